@@ -0,0 +1,71 @@
+"""ORM vs bulk write throughput for `blitzkrieg.db.models` entities.
+
+Inserts the same batch of projects through the ORM unit of work (`session.add` + commit), through
+`BulkWriter`'s multi-row `INSERT ... ON CONFLICT` path and through its `COPY` path, each into a
+scratch schema that is dropped afterwards. Needs a reachable PostgreSQL database:
+
+    python benchmarks/bulk_insert.py --db-url postgresql+psycopg2://user:pw@localhost:5432/db --rows 10000
+"""
+import argparse
+import os
+import time
+import uuid
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from blitzkrieg.db.bulk_writer import BulkWriter
+from blitzkrieg.db.models.project import Project
+
+SCRATCH_SCHEMA = 'blitz_bench'
+
+def make_rows(count):
+    return [
+        {'id': uuid.uuid4(), 'name': f'project-{i}', 'directory_path': f'/tmp/project-{i}', 'short_description': 'bench'}
+        for i in range(count)
+    ]
+
+def run_orm(session, rows):
+    for row in rows:
+        session.add(Project(**row))
+    session.commit()
+
+def run_bulk(session, rows):
+    BulkWriter(session, copy_threshold=len(rows) + 1).insert(Project, rows)
+    session.commit()
+
+def run_copy(session, rows):
+    BulkWriter(session, copy_threshold=0).insert(Project, rows)
+    session.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db-url', default=os.environ.get('BLITZ_BENCH_DB_URL'), help='SQLAlchemy URL of a scratch PostgreSQL database')
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+    if not args.db_url:
+        parser.error('--db-url (or BLITZ_BENCH_DB_URL) is required')
+
+    engine = create_engine(args.db_url).execution_options(schema_translate_map={'project_management': SCRATCH_SCHEMA})
+    with engine.begin() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCRATCH_SCHEMA}'))
+        Project.__table__.create(connection, checkfirst=True)
+
+    try:
+        for label, runner in (('orm', run_orm), ('bulk insert', run_bulk), ('bulk copy', run_copy)):
+            with engine.begin() as connection:
+                connection.execute(text(f'TRUNCATE {SCRATCH_SCHEMA}.project'))
+            rows = make_rows(args.rows)
+            with Session(engine) as session:
+                started = time.perf_counter()
+                runner(session, rows)
+                elapsed = time.perf_counter() - started
+            print(f"{label:<12} {args.rows} rows in {elapsed * 1000:8.1f} ms ({args.rows / elapsed:,.0f} rows/s)")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE'))
+        engine.dispose()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Cost of ConsoleInterface status messages in each output mode.
+
+Sends the same mix of handle_info/handle_wait/handle_success calls through a fresh
+ConsoleInterface per mode with stdout and stderr redirected to /dev/null, and reports the
+per-call cost. Rich mode includes the final flush of the render queue.
+
+    python benchmarks/console_logging.py --calls 10000
+"""
+import argparse
+import contextlib
+import os
+import time
+
+from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
+from blitzkrieg.ui_management.output_mode import OUTPUT_MODES, set_output_mode
+
+def run_mode(mode, calls):
+    set_output_mode(mode)
+    console = ConsoleInterface()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        started = time.perf_counter()
+        for i in range(calls):
+            if i % 3 == 0:
+                console.handle_info(f"Processed item [white]{i}[/white]")
+            elif i % 3 == 1:
+                console.handle_wait(f"Working on item {i}...")
+            else:
+                console.handle_success(f"Finished item {i}")
+        console.spinner.stop()
+        return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=10000)
+    args = parser.parse_args()
+    for mode in OUTPUT_MODES:
+        elapsed = run_mode(mode, args.calls)
+        print(f"{mode:<6} {args.calls} calls in {elapsed * 1000:8.1f} ms ({elapsed / args.calls * 1e6:6.2f} us/call)")
+    set_output_mode('rich')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Cold-start import budget for the `blitz` entry point.
+
+Runs `blitz --help` in fresh interpreters with `-X importtime`, parses the per-module timings from
+stderr and exits non-zero when the total import time goes over budget, when one of the heavy
+dependencies that commands are supposed to load lazily shows up, or when the help text registered
+for a lazy command no longer matches its docstring.
+
+    python benchmarks/import_time.py --budget-ms 150
+"""
+import argparse
+import subprocess
+import sys
+
+from blitzkrieg.cli.main import main as main_group
+
+# Modules that must not be imported just to render `blitz --help`
+FORBIDDEN_MODULES = [
+    'docker',
+    'sqlalchemy',
+    'rich',
+    'questionary',
+    'prompt_toolkit',
+    'cookiecutter',
+    'rust_codetextualizer',
+    'requests',
+    'alembic',
+    'psycopg2',
+]
+
+ENTRY_POINT = "from blitzkrieg.cli.main import main; main(['--help'])"
+
+def measure_import_time():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', ENTRY_POINT],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    total_us = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        # import time:   self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        # Nested imports are indented under the module that triggered them
+        modules[name[1:].rstrip()] = int(cumulative_us)
+    return total_us / 1000, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=150.0, help='Maximum cold-start import time')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters; the fastest run counts')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest top-level imports to report')
+    args = parser.parse_args()
+
+    runs = [measure_import_time() for _ in range(args.runs)]
+    total_ms, modules = min(runs, key=lambda run: run[0])
+
+    top_level = sorted(
+        ((name, us) for name, us in modules.items() if not name.startswith(' ')),
+        key=lambda item: item[1], reverse=True
+    )
+    print(f"blitz --help import time: {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms, best of {args.runs})")
+    for name, us in top_level[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    imported = {name.strip().split('.')[0] for name in modules}
+    leaked = [name for name in FORBIDDEN_MODULES if name in imported]
+    failed = False
+    if leaked:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(leaked)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        failed = True
+    for name, registered, docstring in main_group.find_stale_help():
+        print(f"FAIL: help for `blitz {name}` is {registered!r} in LAZY_SUBCOMMANDS but {docstring!r} in its docstring")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
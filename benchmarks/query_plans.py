@@ -0,0 +1,121 @@
+"""Query plans of the hot project_management lookups on a seeded database.
+
+Seeds --rows projects (half of them children of the first 1% of projects) and as many issues
+into a scratch schema, runs VACUUM ANALYZE, then EXPLAINs each lookup and fails if any plan
+contains a sequential scan or misses the index it is meant to use. Needs a reachable PostgreSQL
+database:
+
+    python benchmarks/query_plans.py --db-url postgresql+psycopg2://user:pw@localhost:5432/db --rows 100000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import Session
+
+from blitzkrieg.db.bulk_writer import BulkWriter
+from blitzkrieg.db.queries import issue_listing, keyset_page, project_listing, row_key
+from blitzkrieg.db.models.issue import Issue
+from blitzkrieg.db.models.project import Project
+
+SCRATCH_SCHEMA = 'blitz_bench'
+
+def seed(engine, rows):
+    project_ids = [uuid.uuid4() for _ in range(rows)]
+    parents = project_ids[:max(rows // 100, 1)]
+    projects = [
+        {
+            'id': project_id, 'name': f'project-{i}', 'directory_path': f'/tmp/project-{i}',
+            'parent_id': parents[i % len(parents)] if i >= len(parents) and i % 2 else None,
+        }
+        for i, project_id in enumerate(project_ids)
+    ]
+    issues = [
+        {'id': uuid.uuid4(), 'index': i, 'title': f'issue-{i}', 'project_id': project_ids[i % len(project_ids)]}
+        for i in range(rows)
+    ]
+    with Session(engine) as session:
+        writer = BulkWriter(session, copy_threshold=0)
+        writer.insert(Project, projects)
+        writer.insert(Issue, issues)
+        session.commit()
+    return project_ids
+
+def get_plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from get_plan_nodes(child)
+
+def explain(connection, statement):
+    compiled = statement.compile(connection, compile_kwargs={'literal_binds': True})
+    # schema_translate_map is applied at execution, so rewrite the literal SQL the same way
+    sql = str(compiled).replace('project_management.', f'{SCRATCH_SCHEMA}.')
+    started = time.perf_counter()
+    connection.execute(text(sql)).all()
+    elapsed = time.perf_counter() - started
+    plan = connection.execute(text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return list(get_plan_nodes(plan[0]['Plan'])), elapsed
+
+def middle_key(connection, listing, rows):
+    """Key of the row halfway through a listing, where `blitz list` would resume a later page."""
+    return row_key(listing, connection.execute(keyset_page(listing, 1).offset(rows // 2)).one())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db-url', default=os.environ.get('BLITZ_BENCH_DB_URL'), help='SQLAlchemy URL of a scratch PostgreSQL database')
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+    if not args.db_url:
+        parser.error('--db-url (or BLITZ_BENCH_DB_URL) is required')
+
+    engine = create_engine(args.db_url).execution_options(schema_translate_map={'project_management': SCRATCH_SCHEMA})
+    with engine.begin() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE'))
+        connection.execute(text(f'CREATE SCHEMA {SCRATCH_SCHEMA}'))
+        Project.__table__.create(connection, checkfirst=True)
+        Issue.__table__.create(connection, checkfirst=True)
+
+    failures = []
+    try:
+        started = time.perf_counter()
+        project_ids = seed(engine, args.rows)
+        print(f"seeded {args.rows} projects and {args.rows} issues in {time.perf_counter() - started:.1f} s")
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            connection.execute(text(f'VACUUM ANALYZE {SCRATCH_SCHEMA}.project'))
+            connection.execute(text(f'VACUUM ANALYZE {SCRATCH_SCHEMA}.issue'))
+
+            parent_id, project_id = project_ids[0], project_ids[len(project_ids) // 2]
+            projects, issues = project_listing(), issue_listing()
+            lookups = [
+                ('project by name', select(Project).where(Project.name == f'project-{args.rows // 2}'), 'uq_project_name'),
+                ('children of project', select(Project.id).where(Project.parent_id == parent_id), 'ix_project_parent_id'),
+                ('issues of project', select(Issue).where(Issue.project_id == project_id), 'ix_issue_project_id'),
+                ('issue count of project', select(func.count()).where(Issue.project_id == project_id), 'ix_issue_project_id'),
+                ('keyset page of projects', keyset_page(projects, 500, middle_key(connection, projects, args.rows)), 'ix_project_created_at_id'),
+                ('keyset page of issues', keyset_page(issues, 500, middle_key(connection, issues, args.rows)), 'ix_issue_created_at_id'),
+            ]
+            for label, statement, expected_index in lookups:
+                nodes, elapsed = explain(connection, statement)
+                node_types = [node['Node Type'] for node in nodes]
+                indexes = {node.get('Index Name') for node in nodes} - {None}
+                ok = 'Seq Scan' not in node_types and expected_index in indexes
+                if not ok:
+                    failures.append(label)
+                print(f"{'ok  ' if ok else 'FAIL'} {label:<24} {elapsed * 1000:7.2f} ms  {' > '.join(node_types)} ({', '.join(sorted(indexes)) or 'no index'})")
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE'))
+        engine.dispose()
+
+    if failures:
+        print(f"{len(failures)} lookups are not using their index: {', '.join(failures)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
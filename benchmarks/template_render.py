@@ -0,0 +1,57 @@
+"""Project generation time: cookiecutter() against the compiled template cache.
+
+Renders each bundled template --projects times into a scratch directory with both paths and
+reports the per-project cost. The compiled cache is warmed once first, as it would be after the
+first project on a host.
+
+    python benchmarks/template_render.py --projects 50
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from cookiecutter.main import cookiecutter
+
+from blitzkrieg.compiled_template_cache import CompiledTemplateCache
+
+TEMPLATES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'blitzkrieg', 'templates')
+
+def get_context(name):
+    # Everything CookieCutterManager passes; the pyo3 template cannot render from its defaults alone
+    return {
+        'project_name': name, 'project_description': 'Benchmark project', 'project_short_description': 'Benchmark', 'full_name': 'Bench',
+        'email': 'bench@example.com', 'github_username': 'bench',
+    }
+
+def time_renders(render, projects, output_directory):
+    started = time.perf_counter()
+    for i in range(projects):
+        render(get_context(f'bench project {i}'), os.path.join(output_directory, str(i)))
+    return (time.perf_counter() - started) / projects
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=50)
+    args = parser.parse_args()
+    scratch = tempfile.mkdtemp(prefix='blitz-template-bench-')
+    try:
+        cache = CompiledTemplateCache(os.path.join(scratch, 'cache'))
+        for template_name in sorted(os.listdir(TEMPLATES_DIRECTORY)):
+            template_path = os.path.join(TEMPLATES_DIRECTORY, template_name)
+            cache.get(template_path).render(get_context('warmup'), os.path.join(scratch, template_name, 'warmup'))
+            baseline = time_renders(
+                lambda context, output: cookiecutter(template_path, no_input=True, extra_context=context, output_dir=output),
+                args.projects, os.path.join(scratch, template_name, 'cookiecutter')
+            )
+            compiled = time_renders(
+                lambda context, output: cache.get(template_path).render(context, output),
+                args.projects, os.path.join(scratch, template_name, 'compiled')
+            )
+            print(f"{template_name:<30} cookiecutter {baseline * 1000:6.1f} ms/project  compiled {compiled * 1000:6.1f} ms/project")
+    finally:
+        shutil.rmtree(scratch)
+
+if __name__ == '__main__':
+    main()
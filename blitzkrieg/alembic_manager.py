@@ -1,35 +1,38 @@
 # alembic_manager.py
 
 import os
-import subprocess
-import shutil
-from typing import List
-from blitzkrieg.db.models.base import Base
-from blitzkrieg.db.models.issue import Issue
-from blitzkrieg.db.models.project import Project
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
-from blitzkrieg.file_manager import FileManager
-import sys
+from blitzkrieg.utils.template_renderer import TemplateRenderer
+
+PACKAGE_ROOT = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIRECTORY = os.path.join(PACKAGE_ROOT, 'workspace_management', 'templates')
 
 class AlembicManager:
-    def __init__(self, db_manager, file_manager: FileManager, workspace_name: str, console: ConsoleInterface = None):
+    # Import rewrites applied to model sources copied into a workspace. They are applied in one
+    # pass, so the `.Base` entries spell out what the chained rewrites used to produce.
+    model_import_rewrites = TemplateRenderer({
+        'blitzkrieg.db.models.Base': 'sqlalchemy_models.base',
+        'blitzkrieg.project_management.db.models.Base': 'sqlalchemy_models.base',
+        'blitzkrieg.db.models': 'sqlalchemy_models',
+        'blitzkrieg.project_management.db.models': 'sqlalchemy_models',
+        'sqlalchemy_models.Base': 'sqlalchemy_models.base',
+    })
+
+    def __init__(self, db_manager, workspace_name: str, console: ConsoleInterface = None):
         self.workspace_name = workspace_name
         self.workspace_path = os.path.join(os.getcwd(), self.workspace_name)
         self.db_manager = db_manager
-        self.file_manager = file_manager
         self.alembic_env_path = os.path.join(self.workspace_path, 'env.py')
         self.alembic_ini_path = os.path.join(self.workspace_path, 'alembic.ini')
-        self.migrations_path = os.path.join(self.workspace_path, 'migrations')
         self.sqlalchemy_models_path = os.path.join(self.workspace_path, 'sqlalchemy_models')
-        self.alembic_init__template_path = os.path.join(os.getcwd(), 'blitzkrieg', 'workspace_management', 'templates', 'alembic_init.sh')
-        self.workspace_requirements_txt_template_path = os.path.join(os.getcwd(), 'blitzkrieg', 'workspace_management', 'templates', 'requirements.txt')
-        self.initial_table_models = [Base, Project, Issue]
-        self.models_directory = os.path.join(os.getcwd(), 'blitzkrieg', 'db', 'models')
+        # Resolved against the installed package so `blitz` works from any directory
+        self.alembic_init__template_path = os.path.join(TEMPLATES_DIRECTORY, 'alembic_init.sh')
+        self.workspace_requirements_txt_template_path = os.path.join(TEMPLATES_DIRECTORY, 'requirements.txt')
+        self.index_migration_template_path = os.path.join(TEMPLATES_DIRECTORY, 'migrations', 'project_management_indexes.py')
+        self.schema_fingerprint_template_path = os.path.join(TEMPLATES_DIRECTORY, 'schema_fingerprint.py')
+        self.models_directory = os.path.join(PACKAGE_ROOT, 'db', 'models')
         self.console = console if console else ConsoleInterface()
-        self.init_paths = [
-            self.workspace_path,
-            os.path.join(self.workspace_path, 'sqlalchemy_models'),
-        ]
+
     def get_alembic_init_content(self):
         return f"""
 [alembic]
@@ -148,136 +151,20 @@ format = %(levelname)-5.5s [%(name)s] %(message)s
 datefmt = %H:%M:%S
 
 """
-    def create_alembic_ini_file(self):
-        try:
-            self.console.handle_wait("Creating alembic.ini file...")
-            alembic_init_content = self.get_alembic_init_content()
-            with open(self.alembic_ini_path, 'w') as f:
-                f.write(alembic_init_content)
-            # take content that has $*workspace_name*$ and replace it with the actual workspace name, same for all other vars encapsulated by those chars
-            self.file_manager.replace_text_in_file(self.alembic_ini_path, '$*workspace_name*$', self.workspace_name)
-            self.console.handle_success(f"Created alembic.ini file at [white]{self.alembic_ini_path}[/white]")
-            self.console.display_file_content(self.alembic_ini_path)
-        except Exception as e:
-            return self.console.handle_error(f"Failed to create alembic.ini file: {str(e)}")
-
-
-    def create_init_files(self):
-        """ Ensures that __init__.py files are present in all necessary directories. """
-        try:
-            for path in self.init_paths:
-                init_file = os.path.join(path, '__init__.py')
-                if not os.path.exists(init_file):
-                    open(init_file, 'a').close()
-                    self.console.handle_info(f"Created __init__.py file at {path}")
-            return self.console.handle_success("All __init__.py files created successfully.")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to create init files: {str(e)}")
-
-    def create_sqlalchemy_models_directory(self):
-        """ Ensure the sqlalchemy_models directory is created and models are initialized. """
-        try:
-            if not os.path.exists(self.sqlalchemy_models_path):
-                os.makedirs(self.sqlalchemy_models_path, exist_ok=True)
-                sys.path.append(self.workspace_path)
-                return self.console.handle_success(f"Created sqlalchemy_models directory at [white]{self.sqlalchemy_models_path}[/white]")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to create sqlalchemy_models directory: {str(e)}")
-
-    def copy_alembic_init_script(self):
-        try:
-            if os.path.exists(self.alembic_init__template_path):
-                shutil.copy(self.alembic_init__template_path, self.workspace_path)
-                self.file_manager.chmod_permissions(os.path.join(self.workspace_path, 'alembic_init.sh'), 0o755)
-                self.replace_variable_placeholders_in_alembic_init_script()
-                return self.console.handle_success(f"Copied alembic_init.py to {self.workspace_path}")
-            else:
-                return self.console.handle_error(f"alembic_init.sh not found at {self.alembic_init__template_path}")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to copy alembic_init.py: {str(e)}")
-
-    def replace_variable_placeholders_in_alembic_init_script(self):
-        workspace_alembic_init_script_path = os.path.join(self.workspace_path, 'alembic_init.sh')
-
-        try:
-            self.file_manager.replace_text_in_file(
-                workspace_alembic_init_script_path,
-                '$*workspace_name*$',
-                self.workspace_name
-            )
-            self.console.handle_info(f"Replacing postgres_port variable placeholder in alembic_init.sh and setting its value to {self.db_manager.db_port}")
-            self.file_manager.replace_text_in_file(
-                workspace_alembic_init_script_path,
-                '$*postgres_port*$',
-                str(self.db_manager.db_port)
-            )
-            return self.console.handle_success(f"Replaced variable placeholders in alembic_init.sh")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to replace variable placeholders in alembic_init.sh: {str(e)}")
-
-    def copy_sqlalchemy_models(self):
-        try:
-            if self.models_directory and os.path.exists(self.models_directory):
-                for filename in os.listdir(self.models_directory):
-                    full_file_path = os.path.join(self.models_directory, filename)
-                    if os.path.isfile(full_file_path) and filename.endswith('.py'):
-                        shutil.copy(full_file_path, self.sqlalchemy_models_path)
-                        self.file_manager.replace_text_in_file(
-                            os.path.join(self.sqlalchemy_models_path, filename),
-                            'blitzkrieg.db.models',
-                            f"sqlalchemy_models"
-                        )
-                        self.file_manager.replace_text_in_file(
-                            os.path.join(self.sqlalchemy_models_path, filename),
-                            'blitzkrieg.project_management.db.models',
-                            f"sqlalchemy_models"
-                        )
-                        self.file_manager.replace_text_in_file(
-                            os.path.join(self.sqlalchemy_models_path, filename),
-                            'sqlalchemy_models.Base',
-                            'sqlalchemy_models.base'
-                        )
-
-                return self.console.handle_success(f"Copied SQLAlchemy models from [white]{self.models_directory}[/white] to [white]{self.sqlalchemy_models_path}[/white].")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to copy SQLAlchemy models: {str(e)}")
-
-    def copy_requirements_txt(self):
-        self.copy_file_to_container(
-            self.workspace_requirements_txt_template_path,
-            os.path.join(self.workspace_path, 'requirements.txt')
-        )
-    def copy_file_to_container(self, file_path: str, container_path: str):
-        try:
-            if os.path.exists(file_path):
-                shutil.copy(file_path, container_path)
-                return self.console.handle_success(f"Copied {file_path} to {container_path}")
-            else:
-                return self.console.handle_error(f"File not found: {file_path}")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to copy file to container: {str(e)}")
-
-
-    def update_sqlalchemy_uri(self):
-        try:
-            with open(self.alembic_ini_path, 'r') as f:
-                lines = f.readlines()
-            with open(self.alembic_ini_path, 'w') as f:
-                for line in lines:
-                    if line.startswith('sqlalchemy.url'):
-                        f.write(f'sqlalchemy.url = {self.db_manager.get_sqlalchemy_uri()}\n')
-                    else:
-                        f.write(line)
-            return self.console.handle_success(f"SQLAlchemy URI updated successfully in the Alembic configuration. Changed 'sqlalchemy.url' from 'sqlite:///alembic.sqlite' to '{self.db_manager.get_sqlalchemy_uri()}'.")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to update SQLAlchemy URI: {str(e)}")
-
-    def update_alembic_env(self):
-        env_content = self.get_new_env_py_content()
-        self.write_env_py_content_to_file(env_content)
-        self.console.display_file_content(self.alembic_env_path)
-
-    def get_new_env_py_content(self):
+
+    def get_model_sources(self):
+        """Return {filename: source} for the model modules, with imports rewritten for the workspace."""
+        sources = {}
+        for filename in sorted(os.listdir(self.models_directory)):
+            full_file_path = os.path.join(self.models_directory, filename)
+            if os.path.isfile(full_file_path) and filename.endswith('.py'):
+                with open(full_file_path, 'r') as f:
+                    sources[filename] = self.model_import_rewrites.render(f.read())
+        return sources
+
+    def get_new_env_py_content(self, sqlalchemy_uri: str = None):
+        if sqlalchemy_uri is None:
+            sqlalchemy_uri = self.db_manager.get_sqlalchemy_uri()
         return f"""
 from sqlalchemy import create_engine, text
 from alembic import context
@@ -307,7 +194,7 @@ metadata = Base.metadata
 for cls in Base.__subclasses__():
     cls.__table__.metadata = metadata
 
-url = '{self.db_manager.get_sqlalchemy_uri()}'
+url = '{sqlalchemy_uri}'
 config = context.config
 config.set_main_option('sqlalchemy.url', url)
 
@@ -338,9 +225,3 @@ if context.is_offline_mode():
 else:
     run_migrations_online()
 """
-
-
-    def write_env_py_content_to_file(self, content):
-        with open(self.alembic_env_path, 'w') as env_file:
-            env_file.write(content)
-        self.console.handle_info("Alembic env.py file updated successfully with target metadata and sys.path.append() for SQLAlchemy models.")
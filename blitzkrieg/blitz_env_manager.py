@@ -1,7 +1,115 @@
 import os
 import json
-from typing import Optional
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Optional
 from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.file_utils import atomic_output, file_lock
+
+class EnvFileStore:
+    """In-memory parsed view of a single .blitz.env file.
+
+    Reads are served from the parsed copy until the file's (mtime, size, inode) changes. Writes are
+    merged into a fresh read of the file under an advisory lock and land with a single atomic rename,
+    so concurrent blitz processes never lose each other's keys. Batches are per thread: actions run
+    concurrently, and one action's batch must neither buffer nor discard another action's writes.
+    """
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.lock_path = f"{file_path}.lock"
+        self._lock = threading.RLock()
+        self._lines = []
+        self._values: Dict[str, str] = {}
+        self._signature = ()
+        self._local = threading.local()
+
+    def _batch_state(self):
+        """The calling thread's batch nesting depth and pending writes."""
+        state = self._local
+        if not hasattr(state, 'depth'):
+            state.depth = 0
+            state.pending = {}
+        return state
+
+    def _stat_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self):
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return
+        lines = []
+        if signature is not None:
+            with open(self.file_path, 'r') as f:
+                lines = f.readlines()
+        values = {}
+        for line in lines:
+            if line.startswith('#') or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            values.setdefault(key, value.strip())
+        self._lines, self._values, self._signature = lines, values, signature
+
+    def get(self, key: str) -> Optional[str]:
+        pending = self._batch_state().pending
+        if key in pending:
+            return pending[key]
+        with self._lock:
+            self._load()
+            return self._values.get(key)
+
+    def set(self, key: str, value):
+        self.update_many({key: value})
+
+    def update_many(self, values: Dict[str, object]):
+        state = self._batch_state()
+        state.pending.update({key: str(value) for key, value in values.items()})
+        if state.depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        """Buffer every set() this thread makes in the block and write them with one atomic rename on exit."""
+        state = self._batch_state()
+        state.depth += 1
+        try:
+            yield self
+        except BaseException:
+            state.depth -= 1
+            if state.depth == 0:
+                state.pending.clear()
+            raise
+        state.depth -= 1
+        if state.depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Write the calling thread's pending values."""
+        pending = self._batch_state().pending
+        if not pending:
+            return
+        with self._lock, file_lock(self.lock_path):
+            # Another process may have written since our last read; merge onto its version
+            self._signature = ()
+            self._load()
+            lines = list(self._lines)
+            remaining = dict(pending)
+            for i, line in enumerate(lines):
+                key = line.partition('=')[0]
+                if '=' in line and not line.startswith('#') and key in remaining:
+                    lines[i] = f"{key}={remaining.pop(key)}\n"
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+            lines.extend(f"{key}={value}\n" for key, value in remaining.items())
+            with atomic_output(self.file_path) as f:
+                f.writelines(lines)
+            pending.clear()
+            self._signature = ()
+            self._load()
 
 class BlitzEnvManager:
     def __init__(self):
@@ -11,6 +119,8 @@ class BlitzEnvManager:
         self.workspace_name = None
         self.workspace_path = None
         self.workspace_env_file_path = None
+        self._stores: Dict[str, EnvFileStore] = {}
+        self._stores_lock = threading.Lock()
 
     def set_workspace(self, workspace_name: str, workspace_path: Optional[str] = None):
         self.workspace_name = workspace_name
@@ -38,33 +148,35 @@ class BlitzEnvManager:
                 f.write("IS_WORKSPACE=True\n")
         self.console.handle_info(f"Ensured workspace .blitz.env file at {self.workspace_env_file_path}")
 
+    def _get_store(self, file_path: str) -> EnvFileStore:
+        with self._stores_lock:
+            if file_path not in self._stores:
+                self._stores[file_path] = EnvFileStore(file_path)
+            return self._stores[file_path]
+
     def _get_env_var(self, key: str, file_path: str) -> Optional[str]:
-        if not os.path.exists(file_path):
-            return None
-        with open(file_path, 'r') as f:
-            for line in f:
-                if line.startswith(f"{key}="):
-                    return line.split('=', 1)[1].strip()
-        return None
+        return self._get_store(file_path).get(key)
 
     def _set_env_var(self, key: str, value: str, file_path: str):
-        lines = []
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
+        self._get_store(file_path).set(key, value)
 
-        updated = False
-        for i, line in enumerate(lines):
-            if line.startswith(f"{key}="):
-                lines[i] = f"{key}={value}\n"
-                updated = True
-                break
+    @contextmanager
+    def batch(self):
+        """Group global and workspace env var writes into one atomic write per file."""
+        with ExitStack() as stack:
+            stack.enter_context(self._get_store(self.global_env_file_path).batch())
+            if self.workspace_env_file_path:
+                stack.enter_context(self._get_store(self.workspace_env_file_path).batch())
+            yield self
 
-        if not updated:
-            lines.append(f"{key}={value}\n")
+    def update_global_env_vars(self, values: Dict[str, object]):
+        self._get_store(self.global_env_file_path).update_many(values)
 
-        with open(file_path, 'w') as f:
-            f.writelines(lines)
+    def update_workspace_env_vars(self, values: Dict[str, object]):
+        if not self.workspace_env_file_path:
+            self.console.handle_error("Workspace not set. Use set_workspace() first.")
+            return
+        self._get_store(self.workspace_env_file_path).update_many(values)
 
     def get_global_env_var(self, key: str) -> Optional[str]:
         self.console.handle_info(f"Checking global env var at {self.global_env_file_path} for the key {key}...")
@@ -89,10 +201,8 @@ class BlitzEnvManager:
         current_dir = os.path.abspath(start_dir or os.getcwd())
         while True:
             env_file_path = os.path.join(current_dir, self.file_name)
-            if os.path.isfile(env_file_path):
-                with open(env_file_path, 'r') as f:
-                    if 'IS_WORKSPACE=True' in f.read():
-                        return current_dir
+            if os.path.isfile(env_file_path) and self._get_env_var('IS_WORKSPACE', env_file_path) == 'True':
+                return current_dir
             parent_dir = os.path.dirname(current_dir)
             if parent_dir == current_dir:  # Reached the root of the file system
                 return None
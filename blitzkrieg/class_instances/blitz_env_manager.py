@@ -1,3 +1,19 @@
-from blitzkrieg.blitz_env_manager import BlitzEnvManager
+import threading
 
-blitz_env_manager = BlitzEnvManager()
+_blitz_env_manager = None
+_lock = threading.Lock()
+
+def get_blitz_env_manager():
+    global _blitz_env_manager
+    if _blitz_env_manager is None:
+        with _lock:
+            if _blitz_env_manager is None:
+                from blitzkrieg.blitz_env_manager import BlitzEnvManager
+                _blitz_env_manager = BlitzEnvManager()
+    return _blitz_env_manager
+
+def __getattr__(name):
+    # Keeps `from ... import blitz_env_manager` working while creating the instance on first use
+    if name == 'blitz_env_manager':
+        return get_blitz_env_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,19 @@
-from blitzkrieg.docker_manager import DockerManager
+import threading
 
-docker_manager: DockerManager = DockerManager()
+_docker_manager = None
+_lock = threading.Lock()
+
+def get_docker_manager():
+    global _docker_manager
+    if _docker_manager is None:
+        with _lock:
+            if _docker_manager is None:
+                from blitzkrieg.docker_manager import DockerManager
+                _docker_manager = DockerManager()
+    return _docker_manager
+
+def __getattr__(name):
+    # Keeps `from ... import docker_manager` working while creating the instance on first use
+    if name == 'docker_manager':
+        return get_docker_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
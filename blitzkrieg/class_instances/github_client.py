@@ -0,0 +1,19 @@
+import threading
+
+_github_client = None
+_lock = threading.Lock()
+
+def get_github_client():
+    global _github_client
+    if _github_client is None:
+        with _lock:
+            if _github_client is None:
+                from blitzkrieg.utils.github_utils import GitHubClient, load_github_token
+                _github_client = GitHubClient(token=load_github_token())
+    return _github_client
+
+def __getattr__(name):
+    # The token may need a prompt, so the client is only created once a GitHub call is made
+    if name == 'github_client':
+        return get_github_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,19 @@
+import threading
+
+_port_allocator = None
+_lock = threading.Lock()
+
+def get_port_allocator():
+    global _port_allocator
+    if _port_allocator is None:
+        with _lock:
+            if _port_allocator is None:
+                from blitzkrieg.utils.port_allocation import PortAllocator
+                _port_allocator = PortAllocator()
+    return _port_allocator
+
+def __getattr__(name):
+    # Keeps `from ... import port_allocator` working while creating the instance on first use
+    if name == 'port_allocator':
+        return get_port_allocator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
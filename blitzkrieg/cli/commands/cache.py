@@ -0,0 +1,46 @@
+import time
+import click
+from blitzkrieg.db.metadata_cache import get_metadata_cache
+from blitzkrieg.project_management.db.connection import get_workspace_db_url
+from blitzkrieg.ui_management.console_instance import console
+
+@click.group('cache')
+def cache():
+    """Manage the local metadata cache that `blitz list` reads from."""
+
+@cache.command('refresh')
+@click.option('--workspace', '-w', default=None, help="Refresh the cache of this workspace's database instead of the default one.")
+@click.option('--full', is_flag=True, help='Reload every row instead of only those changed since the last refresh.')
+def refresh(workspace, full):
+    """Copy new and changed rows from the database into the local cache."""
+    try:
+        metadata_cache = get_metadata_cache(get_workspace_db_url(workspace))
+        console.handle_wait("Refreshing the local metadata cache...")
+        started = time.perf_counter()
+        counts = metadata_cache.refresh(full=full)
+        for table_name, count in counts.items():
+            console.handle_info(f"{table_name}: {count} row(s) copied")
+        console.handle_success(f"Refreshed {metadata_cache.cache_path} in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        console.handle_error(f"Failed to refresh the metadata cache: {str(e)}")
+        raise SystemExit(1)
+
+@cache.command('status')
+@click.option('--workspace', '-w', default=None, help="Show the cache of this workspace's database instead of the default one.")
+def status(workspace):
+    """Show when each cached table was last refreshed."""
+    try:
+        metadata_cache = get_metadata_cache(get_workspace_db_url(workspace))
+        state = metadata_cache.get_sync_state()
+        if not state:
+            return console.handle_info("The cache is empty; `blitz cache refresh` fills it.")
+        console.logger.log_json(metadata_cache.cache_path, {
+            table_name: {
+                'refreshed_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['refreshed_at'])),
+                'high_water': entry['high_water'],
+            }
+            for table_name, entry in state.items()
+        }, style="blue")
+    except Exception as e:
+        console.handle_error(f"Failed to read the metadata cache: {str(e)}")
+        raise SystemExit(1)
@@ -0,0 +1,13 @@
+import click
+import rust_codetextualizer
+from blitzkrieg.ui_management.console_instance import console
+
+@click.command('contextualize')
+def contextualize():
+    """Extract the code context of the blitz_init workflow."""
+    try:
+        console.handle_wait("Starting the contextualization process")
+        rust_codetextualizer.extract_code_context('blitz_init')
+
+    except Exception as e:
+        console.handle_error(f"An error occurred during contextualization: {str(e)}")
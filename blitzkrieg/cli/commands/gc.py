@@ -0,0 +1,40 @@
+import click
+from blitzkrieg.class_instances.docker_manager import docker_manager
+from blitzkrieg.docker_resource_index import WORKSPACE_LABEL, DockerResourceIndex
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.workspace_directory_manager import WorkspaceDirectoryManager
+
+@click.command('gc')
+@click.option('--dry-run', is_flag=True, help='List orphaned resources without removing them.')
+@click.option('--workers', default=8, show_default=True, help='Number of resources removed in parallel.')
+@click.option('--directory', type=click.Path(exists=True, file_okay=False), default='.', show_default=True,
+              help='Where to look for workspace directories whose background deletion did not finish.')
+def gc(dry_run, workers, directory):
+    """Remove Docker resources and directories left behind by deleted workspaces."""
+    verb = "Would remove" if dry_run else "Removed"
+    try:
+        console.handle_wait("Looking for Docker resources of deleted workspaces...")
+        resources, failed = docker_manager.collect_orphaned_resources(dry_run=dry_run, max_workers=workers)
+        total = sum(len(items) for items in resources.values())
+        if not total and not failed:
+            console.handle_success("No orphaned workspace resources found.")
+        else:
+            for resource_type, items in resources.items():
+                for resource in items:
+                    workspace = DockerResourceIndex.get_labels(resource).get(WORKSPACE_LABEL, '?')
+                    console.handle_info(f"{verb} {resource_type[:-1]} [white]{resource.name}[/white] (workspace {workspace})")
+            for resource_type, name, error in failed:
+                console.handle_error(f"Failed to remove {resource_type[:-1]} {name}: {error}")
+            console.handle_success(f"{verb} {total} orphaned resource(s).")
+    except Exception as e:
+        console.handle_error(f"Failed to collect orphaned resources: {str(e)}")
+
+    console.handle_wait("Looking for workspace directories left behind by deletions...")
+    removed, failed = WorkspaceDirectoryManager.remove_leftover_deletions(directory, dry_run=dry_run)
+    if not removed and not failed:
+        return console.handle_success("No leftover workspace directories found.")
+    for path in removed:
+        console.handle_info(f"{verb} leftover directory [white]{path}[/white]")
+    for path, error in failed:
+        console.handle_error(f"Failed to remove leftover directory {path}: {error}")
+    console.handle_success(f"{verb} {len(removed)} leftover workspace directory(ies).")
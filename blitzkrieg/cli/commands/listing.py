@@ -0,0 +1,142 @@
+import sys
+import time
+import click
+from blitzkrieg.db.metadata_cache import get_metadata_cache
+from blitzkrieg.db.queries import DEFAULT_PAGE_SIZE, LISTINGS, iter_keyset_pages
+from blitzkrieg.project_management.db.connection import engine_registry, get_workspace_db_url
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.ui_management.output_mode import get_output_mode, write_json_record
+
+# Display widths for the rich table; columns not listed here get the default
+COLUMN_WIDTHS = {'id': 36, 'index': 6, 'created_at': 19, 'project_type': 20, 'path': 48}
+DEFAULT_COLUMN_WIDTH = 28
+# Seconds a cached table may age before `blitz list` brings it up to date first
+DEFAULT_MAX_AGE = 300
+
+class RowPrinter:
+    """Writes rows as they arrive: fixed-width columns in rich mode, tab-separated in quiet mode and
+    one JSON record per row in json mode. Nothing is buffered, so output memory does not depend on
+    the number of rows."""
+    def __init__(self, title, columns, stream=None):
+        self.title = title
+        self.columns = columns
+        self.stream = stream or sys.stdout
+        self.mode = get_output_mode()
+        self.widths = [COLUMN_WIDTHS.get(column, DEFAULT_COLUMN_WIDTH) for column in columns]
+        self.count = 0
+
+    @staticmethod
+    def format_value(value):
+        if value is None:
+            return ''
+        if hasattr(value, 'strftime'):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        return str(value).replace('\n', ' ').replace('\t', ' ')
+
+    def fit(self, text, width):
+        return text.ljust(width) if len(text) <= width else text[:width - 1] + '…'
+
+    def write_header(self):
+        if self.mode == 'rich':
+            header = '  '.join(self.fit(column, width) for column, width in zip(self.columns, self.widths))
+            self.stream.write(click.style(header.rstrip(), bold=True) + '\n')
+
+    def write(self, row):
+        self.count += 1
+        if self.mode == 'json':
+            write_json_record({'level': 'data', 'title': self.title, 'data': dict(row._mapping)}, self.stream)
+            return
+        values = [self.format_value(value) for value in row]
+        if self.mode == 'quiet':
+            self.stream.write('\t'.join(values) + '\n')
+        else:
+            self.stream.write('  '.join(self.fit(value, width) for value, width in zip(values, self.widths)).rstrip() + '\n')
+
+def format_age(seconds):
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    return f"{int(seconds // 3600)}h"
+
+def write_notice(message):
+    # stderr in every output mode: scripts reading stdout still learn how old the rows are
+    click.echo(message, err=True)
+
+def get_cache(url, table_name, max_age=DEFAULT_MAX_AGE):
+    """The local metadata cache of url, filled the first time a table is listed and refreshed
+    incrementally once it is older than max_age seconds."""
+    cache = get_metadata_cache(url)
+    state = cache.get_sync_state().get(table_name)
+    if state is None:
+        console.handle_wait("Filling the local metadata cache...")
+        counts = cache.refresh()
+        console.handle_success(f"Cached {sum(counts.values())} rows")
+        console.spinner.stop()
+    elif time.time() - state['refreshed_at'] > max_age:
+        try:
+            cache.refresh()
+        except Exception as e:
+            # Stale rows beat no rows when the database is unreachable; the notice gives their age
+            write_notice(f"Could not refresh the local metadata cache: {str(e)}")
+    return cache
+
+def list_rows(kind, workspace, page_size, limit, live, max_age=DEFAULT_MAX_AGE, **filters):
+    try:
+        listing = LISTINGS[kind](**filters)
+        url = get_workspace_db_url(workspace)
+        table_name = listing.table_name
+        cache = None if live else get_cache(url, table_name, max_age)
+        printer = RowPrinter(kind, listing.columns)
+        with engine_registry.connect(url) if live else cache.connect() as connection:
+            printer.write_header()
+            for row in iter_keyset_pages(connection, listing, page_size=page_size, limit=limit):
+                printer.write(row)
+        if cache:
+            refreshed_at = cache.get_sync_state()[table_name]['refreshed_at']
+            write_notice(
+                f"{printer.count} {kind} from the local cache, refreshed {format_age(time.time() - refreshed_at)} ago "
+                "(--max-age to refresh it sooner, --live to skip it)"
+            )
+        elif printer.mode == 'rich':
+            console.handle_info(f"{printer.count} {kind}")
+    except BrokenPipeError:
+        # `blitz list issues | head` closes the pipe early; stop quietly
+        sys.stderr.close()
+    except Exception as e:
+        console.handle_error(f"Failed to list {kind}: {str(e)}")
+        raise SystemExit(1)
+
+def listing_options(function):
+    function = click.option('--max-age', type=click.IntRange(min=0), default=DEFAULT_MAX_AGE, show_default=True,
+                            help='Refresh the local metadata cache first when it is older than this many seconds.')(function)
+    function = click.option('--live', is_flag=True, help='Query the database directly instead of the local metadata cache.')(function)
+    function = click.option('--limit', type=click.IntRange(min=1), default=None, help='Stop after this many rows.')(function)
+    function = click.option('--page-size', type=click.IntRange(min=1), default=DEFAULT_PAGE_SIZE, show_default=True,
+                            help='Rows fetched per keyset page.')(function)
+    function = click.option('--workspace', '-w', default=None,
+                            help="Read from this workspace's database instead of the default one.")(function)
+    return function
+
+@click.group('list')
+def list_group():
+    """List workspaces, projects or issues."""
+
+@list_group.command('projects')
+@listing_options
+def list_projects(workspace, page_size, limit, live, max_age):
+    """List projects, oldest first."""
+    list_rows('projects', workspace, page_size, limit, live, max_age)
+
+@list_group.command('issues')
+@click.option('--project', 'project_name', default=None, help='Only list the issues of this project.')
+@listing_options
+def list_issues(project_name, workspace, page_size, limit, live, max_age):
+    """List issues, oldest first."""
+    list_rows('issues', workspace, page_size, limit, live, max_age, project_name=project_name)
+
+@list_group.command('workspaces')
+@listing_options
+def list_workspaces(workspace, page_size, limit, live, max_age):
+    """List workspaces by name."""
+    list_rows('workspaces', workspace, page_size, limit, live, max_age)
@@ -0,0 +1,58 @@
+import click
+from blitzkrieg.ui_management.console_instance import console
+
+@click.group('migrate')
+def migrate():
+    """Render a workspace's migrations to a SQL bundle and apply it to databases."""
+
+def get_workspace_url(workspace_name):
+    from blitzkrieg.class_instances.port_allocator import port_allocator
+    from blitzkrieg.postgres_manager import WorkspaceDbManager
+
+    ports = port_allocator.get_workspace_ports(workspace_name)
+    if not ports or 'postgres' not in ports:
+        raise ValueError(f"No database port is recorded for workspace '{workspace_name}'")
+    return WorkspaceDbManager(port=ports['postgres'], workspace_name=workspace_name).get_host_sqlalchemy_uri()
+
+@migrate.command('bundle')
+@click.argument('workspace_directory', type=click.Path(exists=True, file_okay=False), default='.')
+@click.option('--force', is_flag=True, help='Render the bundle again even if one is cached for these revisions.')
+def bundle(workspace_directory, force):
+    """Render the workspace's revision chain to a cached SQL script."""
+    from blitzkrieg.migration_bundle_manager import MigrationBundleManager
+
+    try:
+        console.handle_wait("Rendering the migration bundle...")
+        result = MigrationBundleManager(workspace_directory).bundle(force=force)
+        source = "Reused cached" if result['cached'] else "Rendered"
+        console.handle_success(f"{source} bundle for head {', '.join(result['heads'])}: [white]{result['path']}[/white]")
+    except Exception as e:
+        console.handle_error(f"Failed to render the migration bundle: {str(e)}")
+
+@migrate.command('apply')
+@click.argument('workspace_directory', type=click.Path(exists=True, file_okay=False), default='.')
+@click.option('--workspace', '-w', 'workspace_names', multiple=True, help="Apply to this workspace's database. Repeatable.")
+@click.option('--db-url', 'db_urls', multiple=True, help='Apply to the database at this SQLAlchemy URL. Repeatable.')
+@click.option('--workers', default=8, show_default=True, help='Databases migrated in parallel.')
+def apply(workspace_directory, workspace_names, db_urls, workers):
+    """Apply the bundle of WORKSPACE_DIRECTORY's migrations to empty databases, one transaction each."""
+    from blitzkrieg.migration_bundle_manager import MigrationBundleManager
+
+    if not workspace_names and not db_urls:
+        console.handle_error("Nothing to migrate: pass --workspace or --db-url at least once.")
+        raise SystemExit(1)
+    try:
+        manager = MigrationBundleManager(workspace_directory, max_workers=workers)
+        console.handle_wait("Preparing the migration bundle...")
+        result = manager.bundle()
+        urls = [get_workspace_url(name) for name in workspace_names] + list(db_urls)
+        console.handle_wait(f"Applying the bundle to {len(urls)} database(s)...")
+        results = manager.apply(result, urls)
+    except Exception as e:
+        console.handle_error(f"Failed to apply the migration bundle: {str(e)}")
+        raise SystemExit(1)
+    failed = [entry for entry in results if entry['status'] == 'failed']
+    if failed:
+        console.handle_error(f"{len(failed)} of {len(results)} databases failed; see the summary above.")
+        raise SystemExit(1)
+    console.handle_success(f"Migrated {sum(entry['status'] == 'applied' for entry in results)} database(s) to {', '.join(result['heads'])}")
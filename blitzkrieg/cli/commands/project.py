@@ -0,0 +1,91 @@
+# blitz create-project <project_type='cli' | 'lib'> <project_name> <project_description>
+import os
+import click
+import questionary
+from blitzkrieg.cookie_cutter_manager import CookieCutterManager
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.project_management.db.connection import get_docker_db_session, save_project
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.github_utils import create_github_repo, push_project_to_repo
+
+# find the difference between two file paths to try to navigate from the first path to the second
+def find_path_difference(path1, path2):
+    path1 = path1.split(os.path.sep)
+    path2 = path2.split(os.path.sep)
+
+    # find the common prefix
+    i = 0
+    while i < len(path1) and i < len(path2) and path1[i] == path2[i]:
+        i += 1
+
+    # find the relative path from path1 to the common prefix
+    rel_path = ['..'] * (len(path1) - i)
+
+    # find the relative path from the common prefix to path2
+    rel_path += path2[i:]
+
+    return os.path.sep.join(rel_path)
+
+@click.command('create-project')
+@click.option('--from', 'manifest_path', type=click.Path(exists=True, dir_okay=False), default=None,
+              help='Create every project listed in a YAML manifest instead of prompting.')
+@click.option('--workers', default=8, show_default=True, help='Concurrent template renders and GitHub operations for --from.')
+def create_project(manifest_path, workers):
+    """Create a new project within the current workspace."""
+    if manifest_path:
+        create_projects_from_manifest(manifest_path, workers)
+        return
+
+    project_types = ['Python CLI', 'Pyo3 Rust Extension']
+
+    type = questionary.select(
+        "Select project type:",
+        choices=project_types
+    ).ask()
+
+    project_name = questionary.text("Enter the project name:").ask()
+    short_description = questionary.text("Enter a short description for the project (roughly 3-5 words):").ask()
+    description = questionary.text("Enter a detailed description for the project:").ask()
+
+    project = Project(
+        name=project_name,
+        project_type=type,
+        short_description=short_description,
+        description=description
+    )
+
+    try:
+        session = get_docker_db_session()
+        console.handle_info(f"Starting the create_project command. About to initialize the CookieCutterManager")
+        cookie_cutter_manager = CookieCutterManager()
+        console.handle_info(f"CookieCutterManager initialized successfully")
+        console.handle_info(f"About to get the template path for the project type: {type}")
+        template_path = cookie_cutter_manager.get_template_path(type)
+        console.handle_info(f"Template path retrieved successfully: {template_path}")
+        console.handle_info(f"About to generate the project")
+        cookie_cutter_manager.generate_project(
+            template_path=template_path,
+            project=project
+        )
+        console.handle_success(f"Successfully created project: {project_name}")
+        console.handle_info(f"About to create a GitHub repo")
+        create_github_repo(project)
+        save_project(project, session)
+        console.handle_success(f"Successfully created a GitHub repository for the project: {project_name}")
+        push_project_to_repo(project)
+    except Exception as e:
+        console.handle_error(f"An error occurred while creating the project: {str(e)}")
+
+def create_projects_from_manifest(manifest_path, workers):
+    from blitzkrieg.project_manifest_manager import ProjectManifestManager
+
+    try:
+        results = ProjectManifestManager(manifest_path, max_workers=workers).create_projects()
+    except ValueError as e:
+        console.handle_error(str(e))
+        raise SystemExit(1)
+    failed = [result for result in results if result.status == 'failed']
+    if failed:
+        console.handle_error(f"{len(failed)} of {len(results)} projects failed; see the summary above.")
+        raise SystemExit(1)
+    console.handle_success(f"Created {len(results)} projects from {manifest_path}")
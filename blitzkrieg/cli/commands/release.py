@@ -0,0 +1,53 @@
+import os
+import subprocess
+import click
+from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.git_backend import open_repository
+from blitzkrieg.utils.git_utils import commit_staged_files, create_git_tag, push_branch_and_tags, stage_files_for_commit
+from blitzkrieg.utils.poetry_utils import build_project_package, initialize_poetry, install_project_dependencies, update_project_version
+from blitzkrieg.utils.validation_utils import validate_package_installation, validate_version_number
+
+@click.command('release')
+@click.option('--version', prompt='New version number', help='The new version number for the release')
+def release(version):
+    """Set up Poetry and release a new version of Blitzkrieg to PyPI"""
+
+    validate_version_number(version)
+
+    try:
+        poetry_installation_is_successful = validate_package_installation('poetry')
+
+        if not poetry_installation_is_successful:
+            console.handle_error("Poetry installation failed. Check the validate_poetry_installation() function.")
+
+        initialize_poetry()
+        update_project_version(version)
+        install_project_dependencies()
+        build_project_package()
+
+
+        # Check for PyPI credentials
+        pypi_username = "__token__"
+        pypi_api_key = blitz_env_manager.get_global_env_var('PYPI_API_KEY')
+        if not pypi_api_key:
+            blitz_env_manager.set_global_env_var('PYPI_API_KEY', click.prompt("Enter your PyPI API key"))
+            pypi_api_key = blitz_env_manager.get_global_env_var('PYPI_API_KEY')
+
+        # Publish to PyPI
+        subprocess.run(["poetry", "publish", "--username", pypi_username, "--password", pypi_api_key], check=True)
+
+        # Commit the version bump, tag it and push both, all through one repository handle
+        repository = open_repository(os.getcwd())
+        stage_files_for_commit(['pyproject.toml'], repository)
+        commit_message = f"Bump version to {version}"
+        commit_staged_files(commit_message, repository)
+        tag_name = f"v{version}"
+        create_git_tag(tag_name, repository)
+        push_branch_and_tags(repository.current_branch(), [tag_name], repository=repository)
+
+        click.echo(f"Successfully set up Poetry and released Blitzkrieg version {version} to PyPI!")
+    except subprocess.CalledProcessError as e:
+        click.echo(f"An error occurred during the release process: {str(e)}")
+    except Exception as e:
+        click.echo(f"An unexpected error occurred: {str(e)}")
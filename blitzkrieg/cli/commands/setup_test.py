@@ -0,0 +1,7 @@
+import subprocess
+import click
+
+@click.command('setup-test')
+def setup_test():
+    """Run the setup_test_env.sh script."""
+    subprocess.run(['../../bash/setup_test_env.sh'], check=True)
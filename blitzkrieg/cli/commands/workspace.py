@@ -0,0 +1,18 @@
+import click
+from blitzkrieg.workspace_manager import WorkspaceManager
+
+@click.command('create-workspace')
+@click.argument("workspace_name")
+def create_workspace(workspace_name):
+    """Create a new workspace with its database, pgAdmin and Alembic worker."""
+    WorkspaceManager(
+        workspace_name=workspace_name
+    ).blitz_init()
+
+@click.command('delete-workspace')
+@click.argument("workspace_name")
+def delete_workspace(workspace_name):
+    """Tear down a workspace's containers, volumes, network and directory."""
+    WorkspaceManager(
+        workspace_name=workspace_name
+    ).teardown_workspace()
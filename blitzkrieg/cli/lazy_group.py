@@ -0,0 +1,72 @@
+import importlib
+import importlib.util
+import click
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are only imported when they are invoked."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> ("module.path:attribute", short help shown by --help). The help must be
+        # the first paragraph of the command's docstring; find_stale_help() checks that.
+        self.lazy_subcommands = lazy_subcommands or {}
+        self._loaded_commands = {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Use the registered help text so that `blitz --help` does not import every command module
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_subcommands:
+                rows.append((cmd_name, self.lazy_subcommands[cmd_name][1]))
+                continue
+            command = super().get_command(ctx, cmd_name)
+            if command is None or command.hidden:
+                continue
+            rows.append((cmd_name, command.get_short_help_str(formatter.width)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name):
+        if cmd_name not in self._loaded_commands:
+            import_path, _ = self.lazy_subcommands[cmd_name]
+            module_name, attribute = import_path.split(':')
+            command = getattr(importlib.import_module(module_name), attribute)
+            if not isinstance(command, click.Command):
+                raise ValueError(f"Lazy command '{cmd_name}' at {import_path} is not a click command")
+            self._loaded_commands[cmd_name] = command
+        return self._loaded_commands[cmd_name]
+
+    def find_stale_help(self):
+        """Return (name, registered help, docstring help) for each lazy command whose help has drifted."""
+        stale = []
+        for cmd_name, (import_path, help_text) in sorted(self.lazy_subcommands.items()):
+            docstring_help = read_command_help(import_path)
+            if help_text != docstring_help:
+                stale.append((cmd_name, help_text, docstring_help))
+        return stale
+
+def read_command_help(import_path):
+    """First paragraph of the docstring of the command at `import_path`, read without importing it."""
+    # Only the help checks need a parser; keep it out of the `blitz --help` import path
+    import ast
+
+    module_name, attribute = import_path.split(':')
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin:
+        raise ValueError(f"Lazy command module {module_name} not found")
+    with open(spec.origin, 'r') as f:
+        tree = ast.parse(f.read(), filename=spec.origin)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == attribute:
+            docstring = ast.get_docstring(node) or ''
+            return ' '.join(docstring.split('\n\n')[0].split())
+    raise ValueError(f"{module_name} does not define {attribute}")
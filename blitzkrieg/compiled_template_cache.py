@@ -0,0 +1,212 @@
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from binaryornot.check import is_binary
+from cookiecutter.config import get_user_config
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.exceptions import OutputDirExistsException
+from cookiecutter.generate import generate_context
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import FileSystemBytecodeCache, FileSystemLoader
+
+from blitzkrieg.utils.file_utils import atomic_write, fast_copy
+
+JINJA_MARKERS = ('{{', '{%', '{#')
+
+class CompiledTemplate:
+    """A cookiecutter template pre-walked into a manifest of directories, Jinja files and verbatim files."""
+    def __init__(self, template_path: str, cache_path: str, manifest: dict):
+        self.template_path = template_path
+        self.cache_path = cache_path
+        self.manifest = manifest
+        self.project_template_path = os.path.join(template_path, manifest['project_template'])
+        self.bytecode_cache = FileSystemBytecodeCache(os.path.join(cache_path, 'bytecode'))
+        self._environments = {}
+
+    def get_environment(self, context=None):
+        # The context only selects the Jinja extensions, so environments (and the templates they
+        # have loaded) are shared between renders that use the same extensions
+        context = context or {}
+        extensions = tuple(context.get('cookiecutter', {}).get('_extensions', ()))
+        if extensions not in self._environments:
+            self._environments[extensions] = StrictEnvironment(
+                context=context,
+                keep_trailing_newline=True,
+                loader=FileSystemLoader(self.project_template_path),
+                bytecode_cache=self.bytecode_cache,
+            )
+        return self._environments[extensions]
+
+    def build_context(self, extra_context=None, output_dir='.'):
+        """The same context cookiecutter(no_input=True) would render with."""
+        config = get_user_config()
+        context = generate_context(
+            context_file=os.path.join(self.template_path, 'cookiecutter.json'),
+            default_context=config['default_context'],
+            extra_context=extra_context,
+        )
+        context['_cookiecutter'] = {k: v for k, v in context['cookiecutter'].items() if not k.startswith('_')}
+        context['cookiecutter'].update(prompt_for_config(context, no_input=True))
+        context['cookiecutter']['_template'] = self.template_path
+        context['cookiecutter']['_output_dir'] = os.path.abspath(output_dir)
+        context['cookiecutter']['_repo_dir'] = self.template_path
+        context['cookiecutter']['_checkout'] = None
+        return context
+
+    def render(self, extra_context=None, output_dir='.') -> str:
+        """Generate the project into output_dir and return the project directory."""
+        context = self.build_context(extra_context, output_dir)
+        env = self.get_environment(context)
+        render_path = self._get_path_renderer(env, context)
+        project_dir = os.path.abspath(os.path.join(output_dir, render_path(self.manifest['project_template'])))
+        if os.path.exists(project_dir):
+            raise OutputDirExistsException(f'Error: "{project_dir}" directory already exists')
+        os.makedirs(project_dir)
+        try:
+            for directory in self.manifest['directories']:
+                os.makedirs(os.path.join(project_dir, render_path(directory)), exist_ok=True)
+            for entry in self.manifest['files']:
+                self._write_file(env, context, project_dir, entry, render_path)
+        except BaseException:
+            shutil.rmtree(project_dir, ignore_errors=True)
+            raise
+        return project_dir
+
+    @staticmethod
+    def _get_path_renderer(env, context):
+        """Render template paths segment by segment, compiling each distinct templated segment once."""
+        rendered_segments = {}
+
+        def render_segment(segment):
+            if not any(marker in segment for marker in JINJA_MARKERS):
+                return segment
+            if segment not in rendered_segments:
+                rendered_segments[segment] = env.from_string(segment).render(**context)
+            return rendered_segments[segment]
+
+        def render_path(path):
+            return os.path.join(*[render_segment(segment) for segment in path.split(os.sep)])
+        return render_path
+
+    def _write_file(self, env, context, project_dir, entry, render_path):
+        source = os.path.join(self.project_template_path, entry['path'])
+        destination = os.path.join(project_dir, render_path(entry['path']))
+        # A file name that renders empty leaves only its directory, as with cookiecutter
+        if os.path.isdir(destination):
+            return
+        if entry['kind'] == 'copy':
+            fast_copy(source, destination)
+        else:
+            rendered = env.get_template(entry['path'].replace(os.sep, '/')).render(**context)
+            newline = context['cookiecutter'].get('_new_lines') or entry['newline']
+            with open(destination, 'w', encoding='utf-8', newline=newline) as f:
+                f.write(rendered)
+        os.chmod(destination, entry['mode'])
+
+class CompiledTemplateCache:
+    """Compiles cookiecutter templates once and renders projects from the compiled form in-process.
+
+    Compiling walks the template tree, sorts files into verbatim copies (binary files, files with
+    no Jinja markup, `_copy_without_render` matches) and Jinja templates, and stores the manifest
+    and the templates' bytecode under ~/.blitzkrieg/cache/templates/<template hash>. Later renders
+    only stat the tree to find the cache, load bytecode instead of parsing, and copy verbatim files
+    with fast_copy. Templates with hooks fall back to cookiecutter itself.
+    """
+    manifest_version = 1
+
+    def __init__(self, cache_directory: str = None):
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "templates")
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def iter_template_files(template_path):
+        for root, directories, files in os.walk(template_path):
+            directories.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+    def get_template_hash(self, template_path: str) -> str:
+        """Fingerprint of the template tree from path, size, mtime and mode, so no file is read to find the cache."""
+        digest = hashlib.sha256(f"{self.manifest_version}\0{os.path.abspath(template_path)}".encode())
+        for path in self.iter_template_files(template_path):
+            stat = os.stat(path)
+            digest.update(f"\0{os.path.relpath(path, template_path)}\0{stat.st_size}\0{stat.st_mtime_ns}\0{stat.st_mode}".encode())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def supports(template_path: str) -> bool:
+        return not os.path.isdir(os.path.join(template_path, 'hooks'))
+
+    def get(self, template_path: str) -> CompiledTemplate:
+        template_path = os.path.abspath(template_path)
+        template_hash = self.get_template_hash(template_path)
+        key = (template_path, template_hash)
+        with self._lock:
+            if key not in self._compiled:
+                cache_path = os.path.join(self.cache_directory, f"{os.path.basename(template_path)}-{template_hash}")
+                manifest_path = os.path.join(cache_path, 'manifest.json')
+                try:
+                    with open(manifest_path, 'r') as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    manifest = self.compile(template_path, cache_path)
+                self._compiled[key] = CompiledTemplate(template_path, cache_path, manifest)
+            return self._compiled[key]
+
+    @staticmethod
+    def find_project_template(template_path: str) -> str:
+        for name in sorted(os.listdir(template_path)):
+            if 'cookiecutter' in name and '{{' in name and '}}' in name:
+                return os.path.join(template_path, name)
+        raise FileNotFoundError(f"No project template directory found in {template_path}")
+
+    def compile(self, template_path: str, cache_path: str) -> dict:
+        with open(os.path.join(template_path, 'cookiecutter.json'), 'r', encoding='utf-8') as f:
+            copy_without_render = json.load(f).get('_copy_without_render', [])
+        project_template_path = self.find_project_template(template_path)
+        manifest = {
+            'project_template': os.path.relpath(project_template_path, template_path),
+            'directories': [],
+            'files': [],
+        }
+        for root, directories, files in os.walk(project_template_path):
+            directories.sort()
+            for name in directories:
+                manifest['directories'].append(os.path.relpath(os.path.join(root, name), project_template_path))
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                relative_path = os.path.relpath(path, project_template_path)
+                manifest['files'].append({
+                    'path': relative_path,
+                    'mode': os.stat(path).st_mode & 0o7777,
+                    **self._classify(path, relative_path, copy_without_render),
+                })
+
+        compiled = CompiledTemplate(template_path, cache_path, manifest)
+        os.makedirs(os.path.join(cache_path, 'bytecode'), exist_ok=True)
+        env = compiled.get_environment()
+        for entry in manifest['files']:
+            if entry['kind'] == 'render':
+                # Parsing once here fills the bytecode cache for every later process
+                env.get_template(entry['path'].replace(os.sep, '/'))
+        atomic_write(os.path.join(cache_path, 'manifest.json'), json.dumps(manifest))
+        return manifest
+
+    @staticmethod
+    def _classify(path, relative_path, copy_without_render):
+        if is_binary(path) or any(fnmatch.fnmatch(relative_path, pattern) for pattern in copy_without_render):
+            return {'kind': 'copy'}
+        with open(path, 'r', encoding='utf-8') as f:
+            f.readline()
+            newline = f.newlines[0] if isinstance(f.newlines, tuple) else f.newlines
+            f.seek(0)
+            content = f.read()
+        # Without markup Jinja would return the text unchanged, so copying yields identical bytes
+        if newline in (None, '\n') and '\r' not in content and not any(marker in content for marker in JINJA_MARKERS):
+            return {'kind': 'copy'}
+        return {'kind': 'render', 'newline': newline}
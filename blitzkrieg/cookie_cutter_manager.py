@@ -5,6 +5,31 @@ from blitzkrieg.db.models.project import Project
 from blitzkrieg.ui_management.console_instance import console
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
 
+_template_cache = None
+
+def get_template_cache():
+    global _template_cache
+    if _template_cache is None:
+        from blitzkrieg.compiled_template_cache import CompiledTemplateCache
+        _template_cache = CompiledTemplateCache()
+    return _template_cache
+
+def render_template(template_path, extra_context, output_dir):
+    """Render one cookiecutter template and return the generated directory.
+
+    Uses the compiled template cache unless the template has hooks. Kept at module level, free
+    of console output, so it can run in a worker process.
+    """
+    template_cache = get_template_cache()
+    if template_cache.supports(template_path):
+        return template_cache.get(template_path).render(extra_context, output_dir)
+    return cookiecutter(
+        template_path,
+        no_input=True,
+        extra_context=extra_context,
+        output_dir=output_dir
+    )
+
 class CookieCutterManager:
     def __init__(self):
         self.template_dir = os.path.join(os.path.dirname(__file__), 'templates')
@@ -15,38 +40,43 @@ class CookieCutterManager:
             project_name = project.name
 
             workspace_dir = self.blitz_env_manager.get_active_workspace_dir()
-            workspace_projects_dir = os.path.join(workspace_dir, 'projects')
-
             template_context = self.get_template_context(project)
-            cookiecutter(
-                template_path,
-                no_input=True,
-                extra_context=template_context,
-                output_dir=workspace_projects_dir
-            )
-            console.handle_success(f"Generated project {project_name} at {workspace_dir} with the slug {project_name.lower().replace(' ', '_')}")
+            project.directory_path = render_template(template_path, template_context, self.get_projects_directory())
+            console.handle_success(f"Generated project {project_name} at {workspace_dir} with the slug {template_context['project_slug']}")
         except Exception as e:
             console.handle_error(f"Failed to generate project: {str(e)}")
 
+    def get_projects_directory(self):
+        return os.path.join(self.blitz_env_manager.get_active_workspace_dir(), 'projects')
+
+    @staticmethod
+    def get_project_type_key(project_type):
+        return project_type.lower().replace(' ', '_')
+
+    def get_project_slug(self, project: Project):
+        slug = project.name.lower().replace(' ', '_')
+        if self.get_project_type_key(project.project_type) == 'pyo3_rust_extension':
+            slug = slug.replace('-', '_')
+        return slug
+
     def get_template_context(self, project: Project):
-        project_type = project.project_type
-        project_type = project_type.lower().replace(' ', '_')
+        project_type = self.get_project_type_key(project.project_type)
         project_name = project.name
         project_description = project.description
         project_short_description = project.short_description
 
         project_type_template_name_mapper = {
             'python_cli': {
-                'project_name': 'Python CLI',
-                'project_slug': 'python_cli',
-                'project_description': 'A Python CLI project',
+                'project_name': project_name,
+                'project_slug': self.get_project_slug(project),
+                'project_description': project_description or 'A Python CLI project',
                 'author_name': 'Your Name',
                 'author_email': ''
             },
             'pyo3_rust_extension': {
                 # prompt the user for text input using questionary for project_name value
                 'project_name': project_name,
-                'project_slug': project_name.lower().replace(' ', '_'),
+                'project_slug': self.get_project_slug(project),
                 'project_description': project_description,
                 'full_name': 'Your Name',
                 'email': '',
@@ -60,7 +90,7 @@ class CookieCutterManager:
 
     def get_template_path(self, project_type):
         # make project_type snake_case
-        project_type = project_type.lower().replace(' ', '_')
+        project_type = self.get_project_type_key(project_type)
         project_type_template_name_mapper = {
             'python_cli': 'poetry-cli-template',
             'pyo3_rust_extension': 'pyo3-rust-extension-template'
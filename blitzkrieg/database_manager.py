@@ -1,8 +1,8 @@
 from contextlib import contextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
 from blitzkrieg.db.models.project import Project
+from blitzkrieg.project_management.db.connection import engine_registry
 from blitzkrieg.ui_management.decorators import with_spinner
 
 class DatabaseManager:
@@ -18,18 +18,16 @@ class DatabaseManager:
         return db_uri
 
     def get_engine(self, db_uri):
-        engine = create_engine(db_uri)
-        return engine
+        return engine_registry.get_engine(db_uri)
 
     def get_session(self, engine):
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        return session
+        return engine_registry.get_sessionmaker(engine.url)()
 
     def create_schema(self, schema_name, engine):
         # creates schema
         with engine.connect() as connection:
-            connection.execute(f'CREATE SCHEMA IF NOT EXISTS {schema_name}')
+            connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS {schema_name}'))
+            connection.commit()
 
     def get_project_by_name(self, project_name, session):
         project = session.query(Project).filter(Project.name == project_name).first()
@@ -0,0 +1,137 @@
+import enum
+import io
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import UUID, column, inspect, select, table, text
+from sqlalchemy.dialects import postgresql
+
+
+class BulkWriter:
+    """Writes many rows of a mapped model in a few statements on the session's current transaction.
+
+    Small batches go out as chunked multi-row `INSERT ... ON CONFLICT ... RETURNING`; batches at or
+    above `copy_threshold` are streamed with `COPY` into a temporary staging table and moved over
+    with a single `INSERT ... SELECT`. Nothing is committed here, so the caller decides the
+    transaction boundary (e.g. `engine_registry.session_scope`). Rows written this way bypass the
+    ORM identity map.
+    """
+    default_chunk_size = 1000
+    default_copy_threshold = 5000
+
+    def __init__(self, session, chunk_size: int = None, copy_threshold: int = None):
+        self.session = session
+        self.chunk_size = chunk_size or self.default_chunk_size
+        self.copy_threshold = self.default_copy_threshold if copy_threshold is None else copy_threshold
+
+    def insert(self, model, rows, conflict_columns=None, update_columns=None):
+        """Insert `rows` (dicts keyed by column name, or model instances) and return their primary keys.
+
+        With `conflict_columns` and `update_columns` the conflicting rows are updated in place;
+        otherwise conflicts are skipped and only the keys of newly inserted rows are returned.
+        """
+        target = model.__table__
+        rows = [self._apply_defaults(target, self._to_row(row)) for row in rows]
+        if not rows:
+            return []
+
+        connection = self.session.connection()
+        returned = []
+        # A multi-row VALUES needs one key set per statement; rows normally share a single shape
+        for keys, group in self._group_by_keys(rows).items():
+            if len(group) >= self.copy_threshold:
+                returned.extend(self._copy_insert(connection, target, keys, group, conflict_columns, update_columns))
+            else:
+                for start in range(0, len(group), self.chunk_size):
+                    stmt = postgresql.insert(target).values(group[start:start + self.chunk_size])
+                    stmt = self._on_conflict(stmt, conflict_columns, update_columns)
+                    returned.extend(connection.execute(stmt.returning(*target.primary_key.columns)).all())
+        return self._unwrap_keys(target, returned)
+
+    def _to_row(self, row):
+        if isinstance(row, dict):
+            return dict(row)
+        mapper = inspect(type(row))
+        values = {}
+        for attr in mapper.column_attrs:
+            value = getattr(row, attr.key)
+            if value is not None:
+                values[attr.columns[0].name] = value
+        return values
+
+    def _apply_defaults(self, target, row):
+        for col in target.columns:
+            if col.name in row:
+                continue
+            if col.default is not None and col.default.is_scalar:
+                row[col.name] = col.default.arg
+            elif col.default is not None and col.default.is_callable:
+                row[col.name] = col.default.arg(None)
+            elif col.primary_key and isinstance(col.type, UUID):
+                row[col.name] = uuid.uuid4()
+        return row
+
+    def _group_by_keys(self, rows):
+        groups = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        return groups
+
+    def _on_conflict(self, stmt, conflict_columns, update_columns):
+        if conflict_columns and update_columns:
+            return stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={name: stmt.excluded[name] for name in update_columns}
+            )
+        if conflict_columns:
+            return stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        return stmt.on_conflict_do_nothing()
+
+    def _copy_insert(self, connection, target, keys, rows, conflict_columns, update_columns):
+        preparer = connection.dialect.identifier_preparer
+        schema = connection.schema_for_object(target)
+        target_name = preparer.quote(target.name)
+        if schema:
+            target_name = f"{preparer.quote_schema(schema)}.{target_name}"
+        staging_name = f"blitz_stage_{uuid.uuid4().hex[:12]}"
+        quoted_keys = ', '.join(preparer.quote(key) for key in keys)
+
+        connection.execute(text(
+            f"CREATE TEMP TABLE {staging_name} (LIKE {target_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        ))
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(','.join(self._copy_value(row[key]) for key in keys))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        dbapi_connection = connection.connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {staging_name} ({quoted_keys}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+        staging = table(staging_name, *[column(key) for key in keys])
+        stmt = postgresql.insert(target).from_select(list(keys), select(*staging.columns))
+        stmt = self._on_conflict(stmt, conflict_columns, update_columns)
+        returned = connection.execute(stmt.returning(*target.primary_key.columns)).all()
+        connection.execute(text(f"DROP TABLE {staging_name}"))
+        return returned
+
+    @staticmethod
+    def _copy_value(value):
+        # Unquoted empty is NULL in CSV COPY, so every real value is quoted
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif isinstance(value, (datetime, date)):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        value = str(value)
+        return '"' + value.replace('"', '""') + '"'
+
+    @staticmethod
+    def _unwrap_keys(target, returned):
+        if len(target.primary_key.columns) == 1:
+            return [row[0] for row in returned]
+        return [tuple(row) for row in returned]
@@ -0,0 +1,213 @@
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict
+
+from sqlalchemy import Column, Float, Index, MetaData, String, Table, delete, func, inspect, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+
+from blitzkrieg.db.models.environment_variable import EnvironmentVariable
+from blitzkrieg.db.models.issue import Issue
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.db.models.workspace import Workspace
+
+SOURCE_SCHEMA = 'project_management'
+MIRRORED_MODELS = (Workspace, EnvironmentVariable, Project, Issue)
+
+def _mirror_table(model, metadata):
+    # Columns only: the source's unique constraints are its business, the cache just follows it
+    return Table(model.__tablename__, metadata, *[Column(c.name, c.type, primary_key=c.primary_key) for c in model.__table__.columns])
+
+cache_metadata = MetaData()
+CACHE_TABLES = {model.__tablename__: _mirror_table(model, cache_metadata) for model in MIRRORED_MODELS}
+Index('ix_project_created_at_id', CACHE_TABLES['project'].c.created_at, CACHE_TABLES['project'].c.id)
+Index('ix_project_name', CACHE_TABLES['project'].c.name)
+Index('ix_issue_created_at_id', CACHE_TABLES['issue'].c.created_at, CACHE_TABLES['issue'].c.id)
+Index('ix_issue_project_id', CACHE_TABLES['issue'].c.project_id)
+Index('ix_environment_variable_workspace_id', CACHE_TABLES['environment_variable'].c.workspace_id)
+sync_state = Table(
+    'sync_state', cache_metadata,
+    Column('table_name', String, primary_key=True),
+    # ISO timestamp with its UTC offset; SQLite's DATETIME storage would drop the offset
+    Column('high_water', String),
+    Column('refreshed_at', Float),
+)
+
+class LocalMetadataCache:
+    """SQLite mirror of one metadata database's workspaces, environment variables, projects and issues.
+
+    Lives under ~/.blitzkrieg/cache/metadata, one file per source database, and holds the same
+    tables as the source without the schema, so the queries in `blitzkrieg.db.queries` run on
+    either (see `connect`). `refresh()` copies the rows changed since the last refresh, by
+    coalesce(updated_at, created_at), and reloads the small tables without timestamps whole;
+    `store()` writes our own inserts through right after they commit. An incremental refresh also
+    drops cached rows whose id is gone from the source, at the cost of one id-only scan per table.
+    """
+    cache_version = 1
+    batch_size = 1000
+    # Rows are stamped with their transaction's start time, so a row can commit with a timestamp
+    # below the high water of a refresh that ran in the meantime; re-reading a window catches it
+    refresh_overlap = timedelta(minutes=5)
+
+    def __init__(self, source_url, cache_directory: str = None):
+        self.source_url = source_url
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "metadata")
+        self.cache_path = os.path.join(self.cache_directory, f"{self.get_source_key(source_url)}.sqlite3")
+        self._ready = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_source_key(source_url) -> str:
+        # The host is left out: the same database is localhost from the host and
+        # host.docker.internal from inside a container
+        url = make_url(source_url)
+        return hashlib.sha256(f"{url.username}@{url.port or 5432}/{url.database}".encode()).hexdigest()[:16]
+
+    @property
+    def cache_url(self) -> str:
+        return f"sqlite:///{self.cache_path}"
+
+    def get_engine(self):
+        from blitzkrieg.project_management.db.connection import engine_registry
+
+        engine = engine_registry.get_engine(self.cache_url)
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._create_schema(engine)
+                    self._ready = True
+        return engine
+
+    def _create_schema(self, engine):
+        os.makedirs(self.cache_directory, exist_ok=True)
+        # Created private up front, before SQLite creates it (and its WAL files) with the umask:
+        # environment variables include database and pgAdmin passwords
+        os.close(os.open(self.cache_path, os.O_CREAT | os.O_WRONLY, 0o600))
+        with engine.begin() as connection:
+            if connection.exec_driver_sql("PRAGMA user_version").scalar() != self.cache_version:
+                cache_metadata.drop_all(connection)
+                connection.exec_driver_sql(f"PRAGMA user_version = {self.cache_version}")
+            cache_metadata.create_all(connection)
+        with engine.connect() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+    @contextmanager
+    def connect(self):
+        """A cache connection on which the project_management models' queries run unchanged."""
+        with self.get_engine().connect() as connection:
+            yield connection.execution_options(schema_translate_map={SOURCE_SCHEMA: None})
+
+    def get_sync_state(self) -> Dict[str, Dict]:
+        with self.get_engine().connect() as connection:
+            return {row.table_name: dict(row._mapping) for row in connection.execute(select(sync_state))}
+
+    def is_populated(self, table_name: str = None) -> bool:
+        state = self.get_sync_state()
+        return table_name in state if table_name else bool(state)
+
+    def refresh(self, full: bool = False) -> Dict[str, int]:
+        """Copy new and changed rows from the source. Returns the number of rows copied per table."""
+        from blitzkrieg.project_management.db.connection import engine_registry
+
+        state = self.get_sync_state()
+        counts = {}
+        with engine_registry.connect(self.source_url) as source, self.get_engine().begin() as cache:
+            source_inspector = inspect(source)
+            for model in MIRRORED_MODELS:
+                table_name = model.__tablename__
+                if not source_inspector.has_table(table_name, schema=SOURCE_SCHEMA):
+                    # Recorded as refreshed and empty, so reads don't go back to the source for it
+                    cache.execute(delete(CACHE_TABLES[table_name]))
+                    self._save_sync_state(cache, table_name, None)
+                    counts[table_name] = 0
+                    continue
+                high_water = None if full else (state.get(table_name) or {}).get('high_water')
+                counts[table_name] = self._refresh_table(source, cache, model, high_water, table_name in state and not full)
+        return counts
+
+    def _refresh_table(self, source, cache, model, high_water, incremental):
+        table = model.__table__
+        timestamped = 'updated_at' in table.c and 'created_at' in table.c
+        query = select(table)
+        if timestamped:
+            changed_at = func.coalesce(table.c.updated_at, table.c.created_at)
+            if incremental and high_water:
+                query = query.where(changed_at >= datetime.fromisoformat(high_water) - self.refresh_overlap)
+        if timestamped and incremental:
+            self._delete_missing(source, cache, table)
+        else:
+            cache.execute(delete(CACHE_TABLES[table.name]))
+
+        count = 0
+        latest = datetime.fromisoformat(high_water) if high_water else None
+        rows = source.execution_options(stream_results=True, yield_per=self.batch_size).execute(query).mappings()
+        for batch in rows.partitions(self.batch_size):
+            self._upsert(cache, table.name, batch)
+            count += len(batch)
+            if timestamped:
+                latest = max(filter(None, [latest, *(row['updated_at'] or row['created_at'] for row in batch)]), default=None)
+        self._save_sync_state(cache, table.name, latest)
+        return count
+
+    def _delete_missing(self, source, cache, table):
+        """Drop cached rows deleted at the source since the last refresh; returns how many."""
+        source_ids = set(source.execute(select(table.c.id)).scalars())
+        cached_table = CACHE_TABLES[table.name]
+        missing = [row_id for row_id in cache.execute(select(cached_table.c.id)).scalars() if row_id not in source_ids]
+        for start in range(0, len(missing), self.batch_size):
+            cache.execute(delete(cached_table).where(cached_table.c.id.in_(missing[start:start + self.batch_size])))
+        return len(missing)
+
+    def _upsert(self, cache, table_name, rows):
+        table = CACHE_TABLES[table_name]
+        stmt = sqlite_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[column.name for column in table.primary_key.columns],
+            set_={column.name: stmt.excluded[column.name] for column in table.columns if not column.primary_key},
+        )
+        cache.execute(stmt, [dict(row) for row in rows])
+
+    def _save_sync_state(self, cache, table_name, high_water):
+        stmt = sqlite_insert(sync_state).values(
+            table_name=table_name, high_water=high_water.isoformat() if high_water else None, refreshed_at=time.time()
+        )
+        cache.execute(stmt.on_conflict_do_update(index_elements=['table_name'], set_={
+            'high_water': stmt.excluded.high_water, 'refreshed_at': stmt.excluded.refreshed_at,
+        }))
+
+    def store(self, source, model, *criteria):
+        """Copy the source rows of model matching criteria into the cache, e.g. right after inserting them.
+
+        Rows are read back rather than taken from the caller so server defaults such as
+        created_at are mirrored too. The refresh high water is left alone on purpose.
+        """
+        rows = source.execute(select(model.__table__).where(*criteria)).mappings().all()
+        if rows:
+            with self.get_engine().begin() as cache:
+                self._upsert(cache, model.__tablename__, rows)
+        return len(rows)
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def get_metadata_cache(source_url) -> LocalMetadataCache:
+    key = LocalMetadataCache.get_source_key(source_url)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = LocalMetadataCache(source_url)
+        return _caches[key]
+
+def write_through(source_url, model, *criteria):
+    """Mirror freshly committed rows into the local cache. Never fails the write it follows."""
+    from blitzkrieg.project_management.db.connection import engine_registry
+
+    try:
+        with engine_registry.connect(source_url) as source:
+            get_metadata_cache(source_url).store(source, model, *criteria)
+    except Exception:
+        # The next `blitz cache refresh` picks the rows up by their timestamps
+        pass
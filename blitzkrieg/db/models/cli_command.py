@@ -1,10 +1,13 @@
-from sqlalchemy import UUID, Column, ForeignKey, String
+from sqlalchemy import UUID, Column, ForeignKey, Index, String
 from blitzkrieg.db.models.base import Base
 from sqlalchemy.orm import relationship
 
 class CLICommand(Base):
     __tablename__ = 'cli_command'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        Index('ix_cli_command_project_id', 'project_id'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     name = Column(String)
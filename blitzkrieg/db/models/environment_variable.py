@@ -1,11 +1,15 @@
-from sqlalchemy import UUID, Column, ForeignKey, Integer, String
+from sqlalchemy import UUID, Column, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from blitzkrieg.db.models.base import Base
 
 class EnvironmentVariable(Base):
     __tablename__ = 'environment_variable'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        # Also serves lookups by workspace_id alone, as its leading column
+        UniqueConstraint('workspace_id', 'name', name='uq_environment_variable_workspace_id_name'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     name = Column(String)
@@ -1,11 +1,14 @@
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, String
+from sqlalchemy import UUID, Column, DateTime, ForeignKey, Index, String
 from blitzkrieg.db.models.base import Base
 from sqlalchemy.orm import relationship
 
 
 class Feature(Base):
     __tablename__ = 'feature'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        Index('ix_feature_project_id', 'project_id'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     name = Column(String)
@@ -1,13 +1,18 @@
 # sql alchemy model for project issues called issues
 
-from sqlalchemy import UUID, Column, Integer, String, ForeignKey, Boolean, DateTime, Enum
+from sqlalchemy import UUID, Column, Integer, String, ForeignKey, Boolean, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from blitzkrieg.project_management.db.models.Base import Base
 class Issue(Base):
     __tablename__ = 'issue'
 
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        Index('ix_issue_project_id', 'project_id'),
+        # Keyset pagination order of `blitz list issues`
+        Index('ix_issue_created_at_id', 'created_at', 'id'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     index=Column(Integer)
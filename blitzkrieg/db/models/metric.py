@@ -1,10 +1,13 @@
-from sqlalchemy import UUID, Column, ForeignKey, String
+from sqlalchemy import UUID, Column, ForeignKey, Index, String
 from blitzkrieg.db.models.base import Base
 from sqlalchemy.orm import relationship
 
 class Metric(Base):
     __tablename__ = 'metric'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        Index('ix_metric_project_id', 'project_id'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     name = Column(String)
@@ -1,10 +1,18 @@
 import uuid
-from sqlalchemy import UUID, Column, Integer, String, ForeignKey, Boolean, DateTime, Enum, func
+from sqlalchemy import UUID, Column, Integer, String, ForeignKey, Boolean, DateTime, Enum, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from blitzkrieg.project_management.db.models.Base import Base
 class Project(Base):
     __tablename__ = 'project'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        # get_project_by_name looks projects up by name
+        UniqueConstraint('name', name='uq_project_name'),
+        # Walked by the self-referential children relationship
+        Index('ix_project_parent_id', 'parent_id'),
+        # Keyset pagination order of `blitz list projects`
+        Index('ix_project_created_at_id', 'created_at', 'id'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
     name = Column(String)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 from blitzkrieg.db.models.base import Base
 
@@ -7,7 +7,10 @@ from sqlalchemy.dialects.postgresql import UUID
 
 class Workspace(Base):
     __tablename__ = 'workspace'
-    __table_args__ = {'schema': 'project_management'}
+    __table_args__ = (
+        UniqueConstraint('name', name='uq_workspace_name'),
+        {'schema': 'project_management'},
+    )
 
     id = Column(UUID, primary_key=True)
     name = Column(String)
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.sql import Select
+
+from blitzkrieg.db.models.issue import Issue
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.db.models.workspace import Workspace
+
+DEFAULT_PAGE_SIZE = 500
+
+@dataclass(frozen=True)
+class Listing:
+    """A column-projected query and the unique key it is paged on, in sort order."""
+    query: Select
+    keys: Tuple
+
+    @property
+    def table_name(self):
+        return self.keys[-1].table.name
+
+    @property
+    def columns(self):
+        return [column.name for column in self.query.selected_columns]
+
+def project_listing() -> Listing:
+    return Listing(
+        select(Project.id, Project.name, Project.project_type, Project.short_description, Project.github_repo, Project.created_at),
+        (Project.created_at, Project.id),
+    )
+
+def issue_listing(project_name: str = None) -> Listing:
+    query = select(
+        Issue.id, Issue.index, Issue.title, Project.name.label('project'), Issue.branch_name, Issue.created_at
+    ).outerjoin(Project, Project.id == Issue.project_id)
+    if project_name:
+        query = query.where(Project.name == project_name)
+    return Listing(query, (Issue.created_at, Issue.id))
+
+def workspace_listing() -> Listing:
+    # Workspaces carry no timestamps; the unique name gives the same stable order
+    return Listing(select(Workspace.id, Workspace.name, Workspace.description, Workspace.path), (Workspace.name, Workspace.id))
+
+LISTINGS = {
+    'projects': project_listing,
+    'issues': issue_listing,
+    'workspaces': workspace_listing,
+}
+
+def row_key(listing: Listing, row) -> Tuple[Any, ...]:
+    return tuple(row._mapping[key.key] for key in listing.keys)
+
+def keyset_page(listing: Listing, size: int, after: Optional[Tuple[Any, ...]] = None) -> Select:
+    """The query for the `size` rows that follow the key `after`, or the first page when it is None."""
+    query = listing.query.order_by(*listing.keys).limit(size)
+    if after is not None:
+        query = query.where(tuple_(*listing.keys) > after)
+    return query
+
+def iter_keyset_pages(connection, listing: Listing, page_size: int = DEFAULT_PAGE_SIZE, after: Optional[Tuple[Any, ...]] = None,
+                      limit: int = None) -> Iterator:
+    """Yield the listing's rows in key order, one page of `WHERE (keys) > (last keys) LIMIT n` at a time.
+
+    Each page starts from the last key seen rather than an OFFSET, so the database never re-reads
+    the rows already returned and every page costs the same. Pages are read through a server-side
+    cursor in `yield_per` batches, so at most one batch of plain rows is held in memory.
+    """
+    last = after
+    remaining = limit
+    streaming = connection.execution_options(stream_results=True, yield_per=page_size)
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        fetched = 0
+        for row in streaming.execute(keyset_page(listing, size, last)):
+            fetched += 1
+            yield row
+        if fetched < size:
+            return
+        last = row_key(listing, row)
+        if remaining is not None:
+            remaining -= fetched
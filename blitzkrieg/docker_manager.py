@@ -3,21 +3,46 @@
 import docker
 from docker.errors import NotFound, APIError
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
+from blitzkrieg.docker_resource_index import DockerResourceIndex
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
 from blitzkrieg.ui_management.console_instance import console
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 class DockerManager:
+    container_ready_timeout = 120
+    container_poll_interval = 0.25
+    container_state_events = ('start', 'die', 'destroy', 'health_status: healthy', 'health_status: unhealthy')
+
     def __init__(self):
-        self.client = docker.from_env()
+        self._client = None
+        self._client_lock = threading.Lock()
         self.console: ConsoleInterface = console
         self.blitz_env_manager = blitz_env_manager
 
-    def create_docker_network(self, network_name):
+    @property
+    def client(self):
+        # Connect to the daemon on first use so commands that never touch Docker work without it
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = docker.from_env()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
+    @property
+    def resource_index(self):
+        return DockerResourceIndex(self.client)
+
+    def create_docker_network(self, network_name, labels=None):
         """Create a Docker network if it doesn't exist."""
         try:
             self.console.handle_wait(f"Creating docker network {network_name} to run workspace containers together")
-            network = self.client.networks.create(network_name)
+            network = self.client.networks.create(network_name, labels=labels)
             self.blitz_env_manager.set_workspace_env_var('NETWORK_NAME', network_name)
             self.console.handle_success(f"Network '{network_name}' created successfully.")
 
@@ -27,7 +52,7 @@ class DockerManager:
         except Exception as e:
             return self.console.handle_error(f"Failed to create network: {str(e)}")
 
-    def run_container(self, container_name, image_name, network_name, env_vars, ports, volumes, detach=True):
+    def run_container(self, container_name, image_name, network_name, env_vars, ports, volumes, detach=True, labels=None):
         """Run a Docker container."""
         try:
             self.client.containers.run(
@@ -37,6 +62,7 @@ class DockerManager:
                 environment=env_vars,
                 ports=ports,
                 volumes=volumes,
+                labels=labels,
                 detach=detach
             )
             self.wait_for_container(container_name)
@@ -47,34 +73,123 @@ class DockerManager:
             return self.console.handle_error(f"Failed to run container: {str(e)}")
 
 
-    def wait_for_container(self, container_name, timeout=10000, interval=1):
-        """Wait for container to be in running state."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            self.console.handle_wait(f"Waiting for container {container_name} to start...")
-            time.sleep(10)
-            try:
-                container = self.client.containers.get(container_name)
-                if container.status == 'running':
-                    container_attrs = container.attrs
-                    success_message = f"Container [white]{container_name}[/white] is running"
-                    self.console.handle_success(success_message)
-                    return container_attrs
-                self.console.handle_info(f"Container {container_name} is not running yet. Waiting...")
-                time.sleep(interval)
-            except NotFound:
-                self.console.handle_error(f"Container {container_name} not found.")
-                return None
-            except APIError as e:
-                self.console.handle_error(f"Failed to get container status: {str(e)}")
-                return None
-            except Exception as e:
-                message = f"Failed to wait for container '{container_name}': {str(e)}"
-                self.console.handle_error(message)
-                return None
-        self.console.handle_error(f"Timeout exceeded while waiting for container {container_name} to start.")
+    def image_exists(self, image_tag):
+        try:
+            self.client.images.get(image_tag)
+            return True
+        except docker.errors.ImageNotFound:
+            return False
+
+    def build_image(self, context_path, image_tag, labels=None):
+        """Build an image from context_path and tag it; returns the built image."""
+        image, _ = self.client.images.build(path=context_path, tag=image_tag, labels=labels or {}, rm=True)
+        return image
+
+    def wait_for_container(self, container_name, timeout=None):
+        """Wait for container to be running, and healthy if it defines a healthcheck."""
+        return self.wait_for_containers([container_name], timeout=timeout).get(container_name)
+
+    def wait_for_containers(self, container_names, timeout=None):
+        """Wait for several containers at once using the Docker events stream.
+
+        Returns a dict mapping each container name to its attrs, or None if it never became ready.
+        """
+        timeout = self.container_ready_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+        pending = set(container_names)
+        ready = {name: None for name in container_names}
+        self.console.handle_wait(f"Waiting for containers {', '.join(container_names)} to become ready...")
+
+        # Subscribe before inspecting so that no state change between the two can be missed
+        try:
+            events = self.client.events(
+                decode=True,
+                since=int(time.time()),
+                until=int(deadline) + 1,
+                filters={'type': 'container', 'container': list(container_names)}
+            )
+        except APIError as e:
+            self.console.handle_info(f"Docker events stream unavailable ({str(e)}), falling back to polling.")
+            return self._poll_containers(container_names, deadline, ready)
+        # The daemon ends the stream at `until`; the timer also unblocks a silent stream in time
+        deadline_timer = threading.Timer(timeout, events.close)
+        deadline_timer.daemon = True
+        deadline_timer.start()
+
+        try:
+            for name in list(pending):
+                state = self._get_container_readiness(name)
+                if state is not None:
+                    self._resolve_container(name, state, pending, ready)
+            if pending:
+                for event in events:
+                    name = event.get('Actor', {}).get('Attributes', {}).get('name')
+                    if name not in pending:
+                        continue
+                    action = event.get('Action') or event.get('status') or ''
+                    if action not in self.container_state_events:
+                        continue
+                    # Re-inspect rather than trusting the event alone, compose may recreate containers
+                    state = self._get_container_readiness(name)
+                    if state is not None:
+                        self._resolve_container(name, state, pending, ready)
+                    if not pending or time.time() >= deadline:
+                        break
+        except Exception as e:
+            if pending and time.time() < deadline:
+                self.console.handle_error(f"Failed to wait for containers {', '.join(sorted(pending))}: {str(e)}")
+                return ready
+        finally:
+            deadline_timer.cancel()
+            events.close()
+
+        for name in sorted(pending):
+            self.console.handle_error(f"Timeout exceeded while waiting for container {name} to become ready.")
+        return ready
+
+    def _poll_containers(self, container_names, deadline, ready):
+        pending = set(container_names)
+        while pending and time.time() < deadline:
+            for name in list(pending):
+                state = self._get_container_readiness(name)
+                if state is not None:
+                    self._resolve_container(name, state, pending, ready)
+            if pending:
+                time.sleep(self.container_poll_interval)
+        for name in sorted(pending):
+            self.console.handle_error(f"Timeout exceeded while waiting for container {name} to become ready.")
+        return ready
+
+    def _get_container_readiness(self, container_name):
+        """Return (True, attrs) when ready, (False, reason) when it cannot become ready, None to keep waiting."""
+        try:
+            container = self.client.containers.get(container_name)
+        except NotFound:
+            # docker compose may not have created it yet; its start event will arrive later
+            return None
+        except APIError as e:
+            return (False, f"Failed to get container status: {str(e)}")
+        state = container.attrs.get('State', {})
+        health = state.get('Health', {}).get('Status')
+        if state.get('Status') in ('exited', 'dead'):
+            return (False, f"Container {container_name} exited with code {state.get('ExitCode')}")
+        if state.get('Status') != 'running':
+            return None
+        if health is None or health == 'healthy':
+            return (True, container.attrs)
+        if health == 'unhealthy':
+            return (False, f"Container {container_name} is unhealthy")
         return None
 
+    def _resolve_container(self, container_name, state, pending, ready):
+        is_ready, detail = state
+        pending.discard(container_name)
+        if is_ready:
+            ready[container_name] = detail
+            self.console.handle_success(f"Container [white]{container_name}[/white] is ready")
+        else:
+            self.console.handle_error(detail)
+
     def remove_container(self, container_name):
         """Remove a Docker container."""
         try:
@@ -100,20 +215,52 @@ class DockerManager:
             self.console.handle_error(f"Volume {volume_name} not found.")
             return False
 
-    def remove_all_volumes(self):
-        """Remove all Docker volumes."""
+    def remove_workspace_volumes(self, workspace_name):
+        """Remove the volumes labelled as belonging to workspace_name, found with a single filtered list call."""
         try:
-            for volume in self.client.volumes.list():
-                volume.remove()
-            volume_names = [v.name for v in self.client.volumes.list()]
-            csv_volume_names = ', '.join(volume_names)
+            volumes = self.resource_index.find_workspace_resources(workspace_name)['volumes']
+            if not volumes:
+                return self.console.handle_info(f"No volumes labelled for workspace [white]{workspace_name}[/white]")
+            for volume in volumes:
+                volume.remove(force=True)
+            csv_volume_names = ', '.join(volume.name for volume in volumes)
             return self.console.handle_success(f"The following volumes have been removed successfully: {csv_volume_names}")
-        except NotFound as e:
-            return self.console.handle_error(f"Volume not found.")
         except APIError as e:
-            return self.console.handle_error(f"Failed to remove volume: {str(e)}")
-        except Exception as e:
-            return self.console.handle_error(f"Failed to remove volume: {str(e)}")
+            return self.console.handle_error(f"Failed to remove volumes for workspace [white]{workspace_name}[/white]: {str(e)}")
+
+    def collect_orphaned_resources(self, dry_run=False, max_workers=8):
+        """Remove labelled resources whose workspace directory is gone.
+
+        Returns (resources by type, failures). With dry_run nothing is removed and the resources are
+        the ones that would be.
+        """
+        orphans = self.resource_index.find_orphaned_resources()
+        if dry_run:
+            return orphans, []
+
+        removed = {resource_type: [] for resource_type in orphans}
+        failed = []
+
+        def remove(resource_type, resource):
+            try:
+                if resource_type == 'containers':
+                    resource.remove(force=True)
+                else:
+                    resource.remove()
+                removed[resource_type].append(resource)
+            except NotFound:
+                removed[resource_type].append(resource)
+            except APIError as e:
+                failed.append((resource_type, resource.name, str(e)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Volumes and networks can only go once the containers using them are removed
+            list(executor.map(lambda resource: remove('containers', resource), orphans['containers']))
+            list(executor.map(
+                lambda item: remove(*item),
+                [(resource_type, resource) for resource_type in ('volumes', 'networks') for resource in orphans[resource_type]]
+            ))
+        return removed, failed
 
     def remove_docker_network(self, network_name):
         """Remove a Docker network."""
@@ -0,0 +1,52 @@
+# docker_resource_index.py
+
+import os
+
+MANAGED_LABEL = 'blitzkrieg.managed'
+WORKSPACE_LABEL = 'blitzkrieg.workspace'
+WORKSPACE_PATH_LABEL = 'blitzkrieg.workspace_path'
+
+RESOURCE_TYPES = ('containers', 'volumes', 'networks')
+
+def workspace_labels(workspace_name: str, workspace_path: str):
+    """Labels attached to every container, volume and network blitzkrieg creates for a workspace."""
+    return {
+        MANAGED_LABEL: 'true',
+        WORKSPACE_LABEL: workspace_name,
+        WORKSPACE_PATH_LABEL: workspace_path,
+    }
+
+class DockerResourceIndex:
+    """Finds blitzkrieg-created Docker resources through label filters, one list call per type."""
+    def __init__(self, client):
+        self.client = client
+
+    def _list(self, resource_type, label_filters):
+        collection = getattr(self.client, resource_type)
+        filters = {'label': label_filters}
+        if resource_type == 'containers':
+            return collection.list(all=True, filters=filters)
+        return collection.list(filters=filters)
+
+    @staticmethod
+    def get_labels(resource):
+        # Volumes keep their labels at the top level of attrs, containers and networks under Config/Labels
+        attrs = resource.attrs or {}
+        return attrs.get('Labels') or attrs.get('Config', {}).get('Labels') or {}
+
+    def find_workspace_resources(self, workspace_name: str):
+        label_filters = [f"{MANAGED_LABEL}=true", f"{WORKSPACE_LABEL}={workspace_name}"]
+        return {resource_type: self._list(resource_type, label_filters) for resource_type in RESOURCE_TYPES}
+
+    def find_managed_resources(self):
+        return {resource_type: self._list(resource_type, [f"{MANAGED_LABEL}=true"]) for resource_type in RESOURCE_TYPES}
+
+    def find_orphaned_resources(self):
+        """Managed resources whose workspace directory no longer exists."""
+        orphans = {}
+        for resource_type, resources in self.find_managed_resources().items():
+            orphans[resource_type] = [
+                resource for resource in resources
+                if not os.path.isdir(self.get_labels(resource).get(WORKSPACE_PATH_LABEL) or '')
+            ]
+        return orphans
@@ -1,6 +1,8 @@
 import os
 import uuid
 
+from blitzkrieg.utils.template_renderer import TemplateRenderer
+
 class FileManager:
     def __init__(self):
         pass
@@ -40,8 +42,9 @@ class FileManager:
         os.chmod(file_path, mode)
 
     def replace_text_in_file(self, file_path, old_text, new_text):
-        with open(file_path, 'r') as file:
-            file_content = file.read()
-        new_file_content = file_content.replace(old_text, new_text)
-        with open(file_path, 'w') as file:
-            file.write(new_file_content)
+        self.render_file(file_path, {old_text: new_text})
+
+    @staticmethod
+    def render_file(source_path, rules, destination_path=None):
+        """Apply every {old: new} rule to source_path in one pass and write the result atomically."""
+        return TemplateRenderer(rules).render_file(source_path, destination_path)
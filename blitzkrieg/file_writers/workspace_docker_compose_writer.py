@@ -1,12 +1,14 @@
+from blitzkrieg.docker_resource_index import workspace_labels
 from blitzkrieg.file_writers.base_docker_compose_writer import BaseDockerComposeWriter
 from blitzkrieg.pgadmin_manager import PgAdminManager
 from blitzkrieg.postgres_manager import WorkspaceDbManager
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
-from blitzkrieg.utils.port_allocation import find_available_port
+from blitzkrieg.worker_image_manager import WorkerImageManager
 
 class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
-    def __init__(self, workspace_name: str, workspace_path: str, console: ConsoleInterface, pgadmin_manager: PgAdminManager, postgres_manager: WorkspaceDbManager):
+    def __init__(self, workspace_name: str, workspace_path: str, console: ConsoleInterface, pgadmin_manager: PgAdminManager, postgres_manager: WorkspaceDbManager, worker_image_manager: WorkerImageManager = None):
         super().__init__(console=console, path=workspace_path)
+        self.worker_image_manager = worker_image_manager or WorkerImageManager()
         self.workspace_name = workspace_name
         self.network_name = f"{self.workspace_name}-network"
         self.volumes = {
@@ -16,6 +18,7 @@ class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
         self.console = console
         self.pgadmin = pgadmin_manager
         self.postgres: WorkspaceDbManager = postgres_manager
+        self.labels = workspace_labels(self.workspace_name, workspace_path)
         self.initialize_services()
 
     def add_service(self, name: str, service_config: dict):
@@ -27,6 +30,7 @@ class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
             service_config={
                 'image': 'postgres:latest',
                 'container_name': f"{self.workspace_name}-postgres",
+                'labels': self.labels,
                 'environment': {
                     'POSTGRES_DB': self.workspace_name,
                     'POSTGRES_USER': f"{self.workspace_name}-db-user",
@@ -48,6 +52,7 @@ class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
             service_config={
                 'image': 'dpage/pgadmin4:latest',
                 'container_name': f"{self.workspace_name}-pgadmin",
+                'labels': self.labels,
                 'environment': {
                     'PGADMIN_DEFAULT_EMAIL': 'alexfigueroa.cybr@gmail.com',
                     'PGADMIN_DEFAULT_PASSWORD': 'pw'
@@ -65,11 +70,10 @@ class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
         self.add_service(
             name=f"{self.workspace_name}-alembic-worker",
             service_config={
-                'build': {
-                    'context': '.',
-                    'dockerfile': 'Dockerfile'
-                },
+                'image': self.worker_image_manager.get_image_tag(),
+                'entrypoint': ['bash', '/app/alembic_init.sh'],
                 'container_name': f"{self.workspace_name}-alembic-worker",
+                'labels': self.labels,
                 'environment': {
                     'ALEMBIC_CONFIG': '/app/alembic.ini',
                     'POSTGRES_USER': f"{self.workspace_name}-db-user",
@@ -87,7 +91,7 @@ class WorkspaceDockerComposeWriter(BaseDockerComposeWriter):
             }
         )
         for volume in self.volumes.keys():
-            self.add_volume(volume)
+            self.add_volume(volume, {'labels': self.labels})
         self.add_network(self.network_name, {'external': True})
 
 import yaml
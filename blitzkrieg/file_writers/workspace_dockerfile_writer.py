@@ -6,29 +6,23 @@ class WorkspaceDockerfileWriter(BaseDockerfileWriter):
         super().__init__(path=workspace_path, console=console)
 
     def write_dockerfile(self):
-        dockerfile_content = """
+        super().write_dockerfile(self.get_dockerfile_content())
+
+    @staticmethod
+    def get_dockerfile_content(python_version: str = '3.9'):
+        # Only dependencies are baked in: the workspace itself is bind-mounted at /app by
+        # docker-compose, so the same image serves every workspace and edits never bust its cache.
+        return f"""
         # Dockerfile.alembic_worker
-        FROM python:3.9-slim
+        FROM python:{python_version}-slim
 
         # Set the working directory
         WORKDIR /app
 
-        # Copy the requirements file and install dependencies
+        # Copy the requirements file and install dependencies (alembic included)
         COPY requirements.txt .
         RUN pip install --no-cache-dir -r requirements.txt
 
-        # Copy the application code
-        COPY . .
-
-        # Install Alembic
-        RUN pip install alembic
-
-        # Ensure the script has execution permissions
-        RUN chmod +x /app/alembic_init.sh
-
-        RUN chown -R 1000:1000 /app
-
-        # Set the entry point to the initialization script
-        ENTRYPOINT ["/app/alembic_init.sh"]
+        # The workspace is mounted at /app at runtime, so run the script through bash
+        ENTRYPOINT ["bash", "/app/alembic_init.sh"]
         """
-        super().write_dockerfile(dockerfile_content)
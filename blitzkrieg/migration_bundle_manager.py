@@ -0,0 +1,183 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List
+
+from sqlalchemy.engine import make_url
+
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.file_utils import atomic_output, atomic_write, file_lock
+
+# Runs in the workspace directory so env.py finds its models. Alembic writes the SQL to the real
+# stdout while env.py's own prints go to stderr; the heads are written to the file in argv[2].
+RENDER_SCRIPT = """
+import contextlib, json, sys
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+config = Config(sys.argv[1], output_buffer=sys.stdout)
+with contextlib.redirect_stdout(sys.stderr):
+    command.upgrade(config, 'head', sql=True)
+with open(sys.argv[2], 'w') as f:
+    json.dump(list(ScriptDirectory.from_config(config).get_heads()), f)
+"""
+
+# The online env.py creates the schema before migrating; the offline one does not
+BUNDLE_HEADER = "CREATE SCHEMA IF NOT EXISTS project_management;\n\n"
+
+# Transaction control emitted by offline Alembic; apply() runs the whole bundle in its own transaction
+TRANSACTION_STATEMENTS = {'BEGIN;', 'COMMIT;'}
+
+# Opening or closing tag of a dollar-quoted body: $$ or $name$ ($1 is a parameter, not a tag)
+DOLLAR_QUOTE_PATTERN = re.compile(r'\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$')
+
+def split_statements(lines: Iterable[str]) -> Iterator[str]:
+    """Split SQL into statements at each `;` outside string literals, quoted identifiers,
+    dollar-quoted bodies and `--` comments. Each statement keeps its terminating semicolon."""
+    buffer = []
+    quote = None
+    for line in lines:
+        start = position = 0
+        while position < len(line):
+            if quote:
+                end = line.find(quote, position)
+                if end == -1:
+                    break
+                position, quote = end + len(quote), None
+                continue
+            char = line[position]
+            if char in '\'"':
+                quote = char
+                position += 1
+            elif char == '$' and (match := DOLLAR_QUOTE_PATTERN.match(line, position)) and not (
+                position and (line[position - 1].isalnum() or line[position - 1] == '_')
+            ):
+                quote = match.group()
+                position = match.end()
+            elif line.startswith('--', position):
+                break
+            elif char == ';':
+                buffer.append(line[start:position + 1])
+                yield ''.join(buffer)
+                buffer = []
+                start = position = position + 1
+            else:
+                position += 1
+        buffer.append(line[start:])
+    if ''.join(buffer).strip():
+        yield ''.join(buffer)
+
+def strip_leading_comments(statement: str) -> str:
+    """Drop the blank and `--` lines before a statement, such as Alembic's "-- Running upgrade" notes."""
+    lines = statement.strip().splitlines()
+    while lines and (not lines[0].strip() or lines[0].lstrip().startswith('--')):
+        lines.pop(0)
+    return '\n'.join(lines).strip()
+
+class MigrationBundleManager:
+    """Renders a workspace's Alembic revision chain to one SQL script and applies it without Alembic.
+
+    `bundle()` runs `alembic upgrade head --sql` once per distinct set of revisions and caches the
+    script under ~/.blitzkrieg/cache/migration-bundles/<revision hash>.sql. `apply()` streams a
+    bundle statement by statement into each target database over a single connection and a single
+    transaction, so a database either ends up at head or is left untouched. Databases that already
+    have an alembic_version table are skipped: the bundle always starts from an empty schema.
+    """
+    def __init__(self, workspace_directory: str = '.', cache_directory: str = None, max_workers: int = 8):
+        self.workspace_directory = os.path.abspath(workspace_directory)
+        self.migrations_directory = os.path.join(self.workspace_directory, 'migrations')
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "migration-bundles")
+        self.max_workers = max_workers
+        self.console = console
+
+    def get_revision_files(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.migrations_directory, 'versions', '*.py')))
+
+    def get_bundle_key(self) -> str:
+        """Hash of everything the rendered SQL depends on: env.py and every revision file."""
+        revision_files = self.get_revision_files()
+        if not revision_files:
+            raise FileNotFoundError(f"No Alembic revisions found in {self.migrations_directory}/versions")
+        digest = hashlib.sha256()
+        for path in [os.path.join(self.migrations_directory, 'env.py')] + revision_files:
+            digest.update(f"\0{os.path.relpath(path, self.migrations_directory)}\0".encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    def bundle(self, force: bool = False) -> Dict:
+        """Return {'path', 'heads', 'cached'} for the bundle of the current revisions, rendering it if needed."""
+        key = self.get_bundle_key()
+        bundle_path = os.path.join(self.cache_directory, f"{key}.sql")
+        metadata_path = os.path.join(self.cache_directory, f"{key}.json")
+        with file_lock(f"{bundle_path}.lock"):
+            if not force and os.path.exists(bundle_path) and os.path.exists(metadata_path):
+                with open(metadata_path, 'r') as f:
+                    return {**json.load(f), 'path': bundle_path, 'cached': True}
+
+            heads_path = f"{metadata_path}.heads"
+            with atomic_output(bundle_path) as f, tempfile.TemporaryFile('w+') as errors:
+                f.write(BUNDLE_HEADER)
+                process = subprocess.Popen(
+                    [sys.executable, '-c', RENDER_SCRIPT, os.path.join(self.workspace_directory, 'alembic.ini'), heads_path],
+                    cwd=self.workspace_directory, stdout=subprocess.PIPE, stderr=errors, text=True
+                )
+                for line in process.stdout:
+                    # The psycopg2 dialect renders every % as %% for its paramstyle; the bundle is
+                    # plain SQL, executed verbatim here and runnable with psql
+                    f.write(line.replace('%%', '%'))
+                if process.wait() != 0:
+                    errors.seek(0)
+                    raise RuntimeError(f"alembic upgrade head --sql failed: {errors.read().strip()[-2000:]}")
+            with open(heads_path, 'r') as f:
+                metadata = {'heads': json.load(f), 'workspace_directory': self.workspace_directory}
+            os.remove(heads_path)
+            atomic_write(metadata_path, json.dumps(metadata, indent=4))
+        return {**metadata, 'path': bundle_path, 'cached': False}
+
+    @staticmethod
+    def iter_statements(bundle_path: str) -> Iterator[str]:
+        """Yield the bundle's statements one at a time, without the offline BEGIN/COMMIT and comments.
+
+        Statements end at Alembic's `;` terminator. Blank lines are no boundary: op.execute() SQL
+        and DO blocks may contain them, and semicolons inside dollar-quoted bodies are skipped.
+        """
+        with open(bundle_path, 'r') as f:
+            for statement in split_statements(f):
+                statement = strip_leading_comments(statement)
+                if statement and statement not in TRANSACTION_STATEMENTS:
+                    yield statement
+
+    def apply_to(self, bundle: Dict, url) -> Dict:
+        from blitzkrieg.project_management.db.connection import engine_registry
+
+        target = make_url(url).render_as_string(hide_password=True)
+        try:
+            with engine_registry.connect(url) as connection, connection.begin():
+                cursor = connection.connection.cursor()
+                cursor.execute("SELECT to_regclass('alembic_version')")
+                if cursor.fetchone()[0] is not None:
+                    cursor.execute("SELECT version_num FROM alembic_version")
+                    versions = sorted(row[0] for row in cursor.fetchall())
+                    status = 'up to date' if versions == sorted(bundle['heads']) else 'skipped'
+                    return {'target': target, 'status': status, 'statements': 0, 'versions': versions}
+                statements = 0
+                # Driver-level execute without parameters: the SQL goes out verbatim, % signs included
+                for statement in self.iter_statements(bundle['path']):
+                    cursor.execute(statement)
+                    statements += 1
+            return {'target': target, 'status': 'applied', 'statements': statements, 'versions': bundle['heads']}
+        except Exception as e:
+            return {'target': target, 'status': 'failed', 'statements': 0, 'error': str(e)}
+
+    def apply(self, bundle: Dict, urls: List) -> List[Dict]:
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as executor:
+            results = list(executor.map(lambda url: self.apply_to(bundle, url), urls))
+        self.console.logger.log_json("Migration Bundle Summary", results, style="blue")
+        return results
@@ -4,6 +4,7 @@ import json
 import os
 import tarfile
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
+from blitzkrieg.docker_resource_index import workspace_labels
 from blitzkrieg.utils.port_allocation import find_available_port
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
 
@@ -12,6 +13,7 @@ class PgAdminManager:
             self,
             postgres_port,
             pgadmin_port=None,
+            pgadmin_port_2=None,
             workspace_name: str = None,
             console: ConsoleInterface = None,
     ):
@@ -20,7 +22,7 @@ class PgAdminManager:
         self.network_name = f"{self.workspace_name}-network"
         self.container_name = f"{self.workspace_name}-pgadmin"
         self.pgadmin_port = pgadmin_port if pgadmin_port else find_available_port()
-        self.pgadmin_port_2 = find_available_port(443)
+        self.pgadmin_port_2 = pgadmin_port_2 if pgadmin_port_2 else find_available_port(443)
         self.postgres_port = postgres_port
         self.console_interface = console if console else ConsoleInterface()
         self.postgres_server_config_name = f"{self.workspace_name.capitalize()} PostgreSQL"
@@ -32,7 +34,7 @@ class PgAdminManager:
 
     def teardown(self):
         self.docker_manager.remove_container(self.container_name)
-        self.docker_manager.remove_all_volumes()
+        self.docker_manager.remove_workspace_volumes(self.workspace_name)
 
     def setup_pgadmin(self):
         self.create_server_config()
@@ -68,8 +70,9 @@ class PgAdminManager:
             self.container_name,
             "dpage/pgadmin4",
             self.network_name,
-            {"PGADMIN_DEFAULT_EMAIL": self.blitz_env_manager.set_global_env_var('EMAIL', 'Enter your email: '), "PGADMIN_DEFAULT_PASSWORD": self.blitz_env_manager.set_global_env_var('PASSWORD', 'Enter your password: ')},
+            {"PGADMIN_DEFAULT_EMAIL": self.blitz_env_manager.get_global_env_var('EMAIL'), "PGADMIN_DEFAULT_PASSWORD": self.blitz_env_manager.get_global_env_var('PASSWORD')},
             {'80/tcp': self.pgadmin_port},
-            volume_bind
+            volume_bind,
+            labels=workspace_labels(self.workspace_name, os.path.join(os.getcwd(), self.workspace_name))
         )
         self.console_interface.handle_info(f"PgAdmin Successfully Initialized at [white]http://localhost:{self.pgadmin_port}[/white] with servers.json bind mounted.")
@@ -1,28 +1,148 @@
-from sqlalchemy import create_engine, text
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
+from blitzkrieg.db.bulk_writer import BulkWriter
+from blitzkrieg.db.metadata_cache import write_through
 from blitzkrieg.db.models.project import Project
 
+DB_URL = 'postgresql+psycopg2://alexfigueroa-db-user:pw@localhost:5432/alexfigueroa'
+DOCKER_DB_URL = 'postgresql+psycopg2://alexfigueroa-db-user:pw@host.docker.internal:5432/alexfigueroa'
+
+class EngineRegistry:
+    """Process-wide cache of SQLAlchemy engines, one pool per connection URL."""
+    default_pool_options = {
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
+
+    def __init__(self, **pool_options):
+        self.pool_options = {**self.default_pool_options, **pool_options}
+        self._engines = {}
+        self._sessionmakers = {}
+        self._wait_stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url):
+        # str() on a SQLAlchemy URL masks the password, which would merge distinct credentials
+        return url.render_as_string(hide_password=False) if isinstance(url, URL) else str(url)
+
+    def get_engine(self, url, **pool_options):
+        key = self._key(url)
+        engine = self._engines.get(key)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is None:
+                    options = {**self.pool_options, **pool_options}
+                    if make_url(key).get_backend_name() == 'sqlite':
+                        options = {'pool_pre_ping': options['pool_pre_ping']}
+                    engine = create_engine(key, **options)
+                    self._engines[key] = engine
+                    self._sessionmakers[key] = sessionmaker(bind=engine)
+                    self._wait_stats[key] = {'checkouts': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+        return engine
+
+    def get_sessionmaker(self, url):
+        self.get_engine(url)
+        return self._sessionmakers[self._key(url)]
+
+    def _record_wait(self, url, started):
+        waited = time.perf_counter() - started
+        with self._lock:
+            stats = self._wait_stats[self._key(url)]
+            stats['checkouts'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+
+    @contextmanager
+    def connect(self, url):
+        """Check a connection out of the shared pool for the duration of the block."""
+        engine = self.get_engine(url)
+        started = time.perf_counter()
+        connection = engine.connect()
+        self._record_wait(url, started)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def session_scope(self, url):
+        """Yield a session that commits on success, rolls back on error and always returns its connection."""
+        session = self.get_sessionmaker(url)()
+        try:
+            started = time.perf_counter()
+            session.connection()
+            self._record_wait(url, started)
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def pool_stats(self):
+        stats = []
+        with self._lock:
+            for key, engine in self._engines.items():
+                pool = engine.pool
+                waits = self._wait_stats[key]
+                stats.append({
+                    'url': engine.url.render_as_string(hide_password=True),
+                    'size': pool.size() if hasattr(pool, 'size') else None,
+                    'checked_out': pool.checkedout() if hasattr(pool, 'checkedout') else None,
+                    'checked_in': pool.checkedin() if hasattr(pool, 'checkedin') else None,
+                    'overflow': pool.overflow() if hasattr(pool, 'overflow') else None,
+                    'checkouts': waits['checkouts'],
+                    'total_wait_seconds': round(waits['total_wait'], 6),
+                    'max_wait_seconds': round(waits['max_wait'], 6),
+                })
+        return stats
+
+    def dispose_all(self):
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+            self._sessionmakers.clear()
+            self._wait_stats.clear()
+
+engine_registry = EngineRegistry()
+atexit.register(engine_registry.dispose_all)
+
 def get_db_engine():
-    engine = create_engine('postgresql+psycopg2://alexfigueroa-db-user:pw@localhost:5432/alexfigueroa')
-    return engine
+    return engine_registry.get_engine(DB_URL)
+
+def get_workspace_db_url(workspace_name: str = None):
+    """URL of a workspace's database from the host, or of the default database when no workspace is given."""
+    if workspace_name is None:
+        return DB_URL
+    from blitzkrieg.class_instances.port_allocator import port_allocator
+
+    ports = port_allocator.get_workspace_ports(workspace_name)
+    if not ports or 'postgres' not in ports:
+        raise ValueError(f"No database port is recorded for workspace '{workspace_name}'")
+    return make_url(DB_URL).set(port=ports['postgres'])
 
 def get_docker_db_engine():
-    engine = create_engine('postgresql+psycopg2://alexfigueroa-db-user:pw@host.docker.internal:5432/alexfigueroa')
-    return engine
+    return engine_registry.get_engine(DOCKER_DB_URL)
 
 def get_docker_db_session():
-    engine = get_docker_db_engine()
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    return session
+    return engine_registry.get_sessionmaker(DOCKER_DB_URL)()
 
 def get_db_session():
-    engine = get_db_engine()
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    return session
+    return engine_registry.get_sessionmaker(DB_URL)()
 
 def close_db_session(session):
     if session:
@@ -45,3 +165,20 @@ def get_project_by_name(project_name, session):
 def save_project(project, session):
     session.add(project)
     session.commit()
+    write_through(session.get_bind().url, Project, Project.id == project.id)
+
+def save_projects(projects, session):
+    """Insert many projects in one transaction and return the ids of the rows that were written."""
+    project_ids = BulkWriter(session).insert(Project, projects)
+    session.commit()
+    if project_ids:
+        write_through(session.get_bind().url, Project, Project.id.in_(project_ids))
+    return project_ids
+
+def update_project_github_repos(github_repos, session):
+    """Set github_repo on many projects, given as {project id: repository URL}, in one transaction."""
+    if not github_repos:
+        return
+    session.execute(update(Project), [{'id': project_id, 'github_repo': url} for project_id, url in github_repos.items()])
+    session.commit()
+    write_through(session.get_bind().url, Project, Project.id.in_(list(github_repos)))
@@ -0,0 +1,264 @@
+import os
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from blitzkrieg.cookie_cutter_manager import CookieCutterManager, render_template
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.ui_management.console_instance import console
+
+PROJECT_FIELDS = ('name', 'project_type', 'short_description', 'description', 'github', 'push')
+
+@dataclass
+class ProjectResult:
+    project: Project
+    template_path: str
+    context: Dict
+    github: bool = True
+    push: bool = True
+    status: str = 'pending'
+    steps: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def fail(self, step, error):
+        self.status = 'failed'
+        self.error = f"{step}: {error}"
+
+class ProjectManifestManager:
+    """Creates every project listed in a YAML manifest in one batch.
+
+    The manifest is validated as a whole, against the disk and the project names already in the
+    database, before anything is written. Templates are then rendered in a process pool and the
+    rows are saved in one transaction before any GitHub repository exists; projects that could not
+    be saved have their rendered directories removed. Repository creation and the initial pushes
+    run on a bounded thread pool, and the repository URLs are recorded in one more transaction.
+    Example manifest:
+
+        defaults:
+          project_type: Python CLI
+        projects:
+          - name: billing_cli
+            short_description: Billing tools
+            description: Command line tools for the billing team
+          - name: fast_parser
+            project_type: Pyo3 Rust Extension
+            push: false
+    """
+    def __init__(self, manifest_path: str, max_workers: int = 8):
+        self.manifest_path = manifest_path
+        self.max_workers = max_workers
+        self.console = console
+        self.cookie_cutter_manager = CookieCutterManager()
+
+    def load_manifest(self) -> List[Dict]:
+        import yaml
+
+        with open(self.manifest_path, 'r') as f:
+            manifest = yaml.safe_load(f) or {}
+        if isinstance(manifest, list):
+            manifest = {'projects': manifest}
+        defaults = manifest.get('defaults') or {}
+        return [{**defaults, **(entry or {})} for entry in manifest.get('projects') or []]
+
+    def find_existing_names(self, names: List[str]) -> set:
+        from blitzkrieg.project_management.db.connection import get_docker_db_session
+
+        names = [name for name in names if name]
+        if not names:
+            return set()
+        session = get_docker_db_session()
+        try:
+            return {name for (name,) in session.query(Project.name).filter(Project.name.in_(names))}
+        finally:
+            session.close()
+
+    def validate(self, entries: List[Dict]) -> List[ProjectResult]:
+        """Check every entry and return the planned projects, or raise ValueError listing every problem."""
+        errors = []
+        results = []
+        projects_directory = self.cookie_cutter_manager.get_projects_directory()
+        seen_slugs = {}
+        seen_names = {}
+        if not entries:
+            errors.append("the manifest lists no projects")
+        # project.name is unique: an existing name would otherwise only fail the save, after rendering
+        try:
+            existing_names = self.find_existing_names([str(entry.get('name') or '').strip() for entry in entries])
+        except SQLAlchemyError as e:
+            raise ValueError(f"Could not check the manifest's project names against the database: {e}") from e
+        for position, entry in enumerate(entries, start=1):
+            label = f"project #{position} ({entry.get('name') or 'unnamed'})"
+            unknown = set(entry) - set(PROJECT_FIELDS)
+            if unknown:
+                errors.append(f"{label}: unknown fields {', '.join(sorted(unknown))}")
+            name = str(entry.get('name') or '').strip()
+            if not name or os.sep in name or name.startswith('.'):
+                errors.append(f"{label}: a name without path separators is required")
+                continue
+            if name in existing_names:
+                errors.append(f"{label}: a project with this name already exists")
+            if name in seen_names:
+                errors.append(f"{label}: has the same name as project #{seen_names[name]}")
+            seen_names[name] = position
+            try:
+                template_path = self.cookie_cutter_manager.get_template_path(entry.get('project_type') or '')
+            except (ValueError, FileNotFoundError) as e:
+                errors.append(f"{label}: {e}")
+                continue
+            project = Project(
+                # Assigned up front so the GitHub step can update the rows the bulk insert wrote
+                id=uuid.uuid4(),
+                name=name,
+                project_type=CookieCutterManager.get_project_type_key(entry['project_type']),
+                short_description=entry.get('short_description'),
+                description=entry.get('description'),
+            )
+            slug = self.cookie_cutter_manager.get_project_slug(project)
+            if slug in seen_slugs:
+                errors.append(f"{label}: renders to the same directory as project #{seen_slugs[slug]}")
+            seen_slugs[slug] = position
+            project.directory_path = os.path.join(projects_directory, slug)
+            if os.path.exists(project.directory_path):
+                errors.append(f"{label}: {project.directory_path} already exists")
+            github = bool(entry.get('github', True))
+            results.append(ProjectResult(
+                project, template_path, self.cookie_cutter_manager.get_template_context(project),
+                github=github, push=github and bool(entry.get('push', True)),
+            ))
+        if errors:
+            raise ValueError("Invalid project manifest:\n  " + "\n  ".join(errors))
+        return results
+
+    def render_projects(self, results: List[ProjectResult]):
+        output_directory = self.cookie_cutter_manager.get_projects_directory()
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(results))) as executor:
+            futures = [
+                (result, executor.submit(render_template, result.template_path, result.context, output_directory))
+                for result in results
+            ]
+            for result, future in futures:
+                try:
+                    result.project.directory_path = future.result()
+                    result.steps.append('rendered')
+                except Exception as e:
+                    result.fail('render', e)
+
+    def save_projects(self, results: List[ProjectResult]):
+        from blitzkrieg.project_management.db.connection import get_docker_db_session, save_projects
+
+        rendered = [result for result in results if result.status != 'failed']
+        if not rendered:
+            return
+        session = get_docker_db_session()
+        try:
+            saved_ids = set(save_projects([result.project for result in rendered], session))
+        except Exception as e:
+            session.rollback()
+            saved_ids = set()
+            for result in rendered:
+                result.fail('save', e)
+        finally:
+            session.close()
+        for result in rendered:
+            if result.project.id in saved_ids:
+                result.steps.append('saved')
+                continue
+            if result.status != 'failed':
+                # Skipped by the insert's ON CONFLICT: the name was taken after validation
+                result.fail('save', "a project with this name already exists")
+            self.discard_rendered(result)
+
+    def discard_rendered(self, result: ProjectResult):
+        """Remove the directory rendered for a project that was not saved, so a rerun is not blocked by it."""
+        if 'rendered' in result.steps and result.project.directory_path:
+            shutil.rmtree(result.project.directory_path, ignore_errors=True)
+            result.steps.append('discarded')
+
+    def create_repository(self, result: ProjectResult, github_client):
+        from blitzkrieg.utils.github_utils import create_github_repo
+
+        if result.status == 'failed' or not result.github:
+            return
+        if create_github_repo(result.project, client=github_client):
+            result.steps.append('github')
+        else:
+            result.fail('github', "repository could not be created")
+
+    def push_repository(self, result: ProjectResult):
+        from blitzkrieg.utils.github_utils import push_project_to_repo
+
+        if result.status == 'failed' or not result.push:
+            return
+        if push_project_to_repo(result.project):
+            result.steps.append('pushed')
+        else:
+            result.fail('push', "initial push failed")
+
+    def run_concurrently(self, function, results: List[ProjectResult]):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(function, results))
+
+    def create_repositories(self, results: List[ProjectResult]):
+        from blitzkrieg.class_instances.github_client import get_github_client
+
+        if not any(result.github and result.status != 'failed' for result in results):
+            return
+        # Resolve the token, and any prompt for it, before fanning out
+        github_client = get_github_client()
+        self.run_concurrently(lambda result: self.create_repository(result, github_client), results)
+        self.save_github_repos(results)
+
+    def save_github_repos(self, results: List[ProjectResult]):
+        from blitzkrieg.project_management.db.connection import get_docker_db_session, update_project_github_repos
+
+        github_repos = {
+            result.project.id: result.project.github_repo
+            for result in results if 'github' in result.steps and result.project.github_repo
+        }
+        if not github_repos:
+            return
+        session = get_docker_db_session()
+        try:
+            update_project_github_repos(github_repos, session)
+        except Exception as e:
+            session.rollback()
+            # The repositories exist; only their URLs are missing from the rows
+            self.console.handle_error(f"Failed to record the GitHub repository URLs: {str(e)}")
+        finally:
+            session.close()
+
+    def display_summary(self, results: List[ProjectResult]):
+        summary = []
+        for result in results:
+            if result.status != 'failed':
+                result.status = 'created'
+            summary.append({
+                "project": result.project.name,
+                "status": result.status,
+                "steps": result.steps,
+                "directory": result.project.directory_path,
+                "github_repo": result.project.github_repo,
+                "error": result.error,
+            })
+        self.console.logger.log_json("Project Creation Summary", summary, style="blue")
+
+    def create_projects(self) -> List[ProjectResult]:
+        self.console.handle_wait(f"Validating project manifest {self.manifest_path}...")
+        results = self.validate(self.load_manifest())
+        self.console.handle_success(f"Manifest is valid: {len(results)} projects")
+
+        self.console.handle_wait(f"Rendering {len(results)} project templates...")
+        self.render_projects(results)
+        # Saved before any repository is created: a failed save must not orphan GitHub repositories
+        self.console.handle_wait("Saving projects...")
+        self.save_projects(results)
+        self.console.handle_wait("Creating GitHub repositories...")
+        self.create_repositories(results)
+        self.console.handle_wait("Pushing projects...")
+        self.run_concurrently(self.push_repository, results)
+        self.display_summary(results)
+        return results
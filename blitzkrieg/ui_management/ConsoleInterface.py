@@ -1,11 +1,18 @@
+import atexit
+import io
 import itertools
 import json
+import queue
+import signal
 import subprocess
 import sys
 import threading
 import time
 import logging
-from typing import Any, Dict, List, Callable
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Callable, Optional, Union
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -13,10 +20,9 @@ from rich.logging import RichHandler
 from rich import box
 from rich.syntax import Syntax
 from termcolor import colored
-import shutil
-import pyperclip
-import io
 import os
+from blitzkrieg.ui_management.output_mode import get_output_mode, is_rich_output, should_copy_run_log, strip_markup, write_json_record
+from blitzkrieg.ui_management.run_log import RunLog
 
 # Setup structured and colored logging
 logging.basicConfig(
@@ -26,36 +32,63 @@ logging.basicConfig(
     handlers=[RichHandler(level=logging.INFO)]
 )
 
+def paused(renderer):
+    return renderer.paused() if renderer else nullcontext()
+
 class Logger:
-    def __init__(self):
+    def __init__(self, renderer: 'CustomSpinner' = None, run_log: RunLog = None):
         self.console = Console()
-        self.output_buffer = io.StringIO()
+        self.output_buffer = run_log if run_log is not None else RunLog()
+        self.renderer = renderer
 
     def log(self, message):
-        logging.info(message)
         self.output_buffer.write(f"{message}\n")
+        mode = get_output_mode()
+        if mode == 'json':
+            write_json_record({'level': 'info', 'message': strip_markup(message)})
+        elif mode == 'rich':
+            with paused(self.renderer):
+                logging.info(message)
 
     def log_json(self, title: str, data: Any, style: str = "bold green"):
         json_str = json.dumps(data, indent=4, sort_keys=True)
-        syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
-        panel = Panel(syntax, title=title, border_style=style, expand=True)
-        self.console.print(panel)
         self.output_buffer.write(f"{title}: {json_str}\n")
+        mode = get_output_mode()
+        if mode == 'json':
+            write_json_record({'level': 'data', 'title': title, 'data': data})
+        elif mode == 'rich':
+            syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
+            panel = Panel(syntax, title=title, border_style=style, expand=True)
+            with paused(self.renderer):
+                self.console.print(panel)
 
     def log_error(self, message: str, data: Any = None):
-        if data:
-            json_str = json.dumps(data, indent=4, sort_keys=True)
-            syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
-            panel = Panel(syntax, title=message, border_style="red", expand=True)
+        json_str = json.dumps(data, indent=4, sort_keys=True) if data else ''
+        self.output_buffer.write(f"Error: {message}\n{json_str}\n")
+        mode = get_output_mode()
+        if mode == 'json':
+            write_json_record({'level': 'error', 'message': strip_markup(message), 'data': data})
+        elif mode == 'quiet':
+            sys.stderr.write(f"Error: {strip_markup(message)}\n{json_str}\n" if data else f"Error: {strip_markup(message)}\n")
         else:
-            panel = Panel(message, title="Error", border_style="red", expand=True)
-        self.console.print(panel)
-        self.output_buffer.write(f"Error: {message}\n{json_str if data else ''}\n")
+            if data:
+                syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
+                panel = Panel(syntax, title=message, border_style="red", expand=True)
+            else:
+                panel = Panel(message, title="Error", border_style="red", expand=True)
+            with paused(self.renderer):
+                self.console.print(panel)
 
     def get_output(self):
         return self.output_buffer.getvalue()
 
 class CustomSpinner:
+    """Spinner and status-line renderer driven by one long-lived background thread.
+
+    Callers only enqueue lines and update the spinner text; the render thread drains the queue
+    once per frame, so bursts of messages are written with a single terminal write and no thread
+    is started or joined per message. `paused()` hands the terminal over to direct rich output.
+    """
     def __init__(self, text='Loading...', spinner_chars=None, interval=0.1):
         self._text = text
         self.spinner_chars = spinner_chars if spinner_chars else [
@@ -71,57 +104,111 @@ class CustomSpinner:
             "⠓⠋⠙⠚⠞⠖⠦⠴⠲⠳",
         ]
         self.interval = interval
-        self.stop_running = threading.Event()
-        self.thread = threading.Thread(target=self._spin)
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self.thread: Optional[threading.Thread] = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._active = False
+        self._line_drawn = False
+        self._frames = itertools.cycle(self.spinner_chars)
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        # Picked up on the next frame
+        self._text = value
+
+    def _ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            with self.lock:
+                if self.thread is None or not self.thread.is_alive():
+                    self.thread = threading.Thread(target=self._render_loop, name='blitz-console-renderer', daemon=True)
+                    self.thread.start()
+                    atexit.register(self.stop)
 
     def start(self):
-        if not self.thread.is_alive():
-            self.stop_running.clear()
-            self.thread = threading.Thread(target=self._spin)
-            self.thread.start()
+        if not is_rich_output():
+            return
+        self._active = True
+        self._ensure_thread()
 
     def stop(self):
-        self.stop_running.set()
-        self.thread.join()
-        self._clear_line()
+        if self._active or self._line_drawn:
+            self._active = False
+            self.flush()
 
     def succeed(self, message):
-        self.stop()
-        self._animate_message(message, "✔", "green")
+        self._enqueue_line(message, "✔", "green")
 
     def fail(self, message):
-        self.stop()
-        self._animate_message(message, "✖", "red")
+        self._enqueue_line(message, "✖", "red")
 
     def info(self, message):
-        self.stop()
-        self._animate_message(message, "ℹ", "blue")
-
-    def _spin(self):
-        frame_iter = itertools.cycle(self.spinner_chars)
-        while not self.stop_running.is_set():
-            with self.lock:
-                sys.stdout.write(f"\r{colored(next(frame_iter), 'blue')} {self._text}")
-                sys.stdout.flush()
+        self._enqueue_line(message, "ℹ", "blue")
+
+    def _enqueue_line(self, message, symbol, color):
+        if not is_rich_output():
+            return
+        self._queue.put(colored(f"{symbol} {message}\n", color))
+        self._ensure_thread()
+
+    def flush(self):
+        """Write everything queued so far from the calling thread and take the spinner off the line."""
+        self._render_frame(draw_spinner=False)
+
+    @contextmanager
+    def paused(self):
+        """Write queued lines, clear the spinner and keep it off the terminal for the block."""
+        self.flush()
+        with self.lock:
+            self._clear_line()
+            yield
+
+    def _render_loop(self):
+        while True:
             time.sleep(self.interval)
+            self._render_frame()
+
+    def _render_frame(self, draw_spinner=True):
+        with self.lock:
+            chunks = []
+            while True:
+                try:
+                    chunks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            draw_spinner = draw_spinner and self._active
+            cleared = (chunks or not draw_spinner) and self._clear_line()
+            if chunks:
+                sys.stdout.write(''.join(chunks))
+            if draw_spinner:
+                # \x1b[K erases whatever a longer previous text left behind
+                sys.stdout.write(f"\r{colored(next(self._frames), 'blue')} {self._text}\x1b[K")
+                self._line_drawn = True
+            if chunks or draw_spinner or cleared:
+                sys.stdout.flush()
 
     def _clear_line(self):
-        columns = shutil.get_terminal_size().columns
-        sys.stdout.write('\r' + ' ' * columns + '\r')
-        sys.stdout.flush()
-
-    def _animate_message(self, message, symbol, color):
-        self._clear_line()
-        sys.stdout.write(colored(f"{symbol} {message}\n", color))
-        sys.stdout.flush()
+        if not self._line_drawn:
+            return False
+        sys.stdout.write('\r\x1b[K')
+        self._line_drawn = False
+        return True
 
 class FileManager:
-    def __init__(self):
+    def __init__(self, renderer: CustomSpinner = None, run_log: RunLog = None):
         self.console = Console()
-        self.output_buffer = io.StringIO()
+        self.output_buffer = run_log if run_log is not None else RunLog()
+        self.renderer = renderer
 
     def display_file_content(self, file_path):
+        mode = get_output_mode()
+        if mode == 'json':
+            return write_json_record({'level': 'file', 'path': file_path})
+        if mode == 'quiet':
+            return
         with open(file_path, 'r') as f:
             content = f.read()
         file_extension = file_path.split('.')[-1]
@@ -135,7 +222,8 @@ class FileManager:
             'js': 'javascript'
         }.get(file_extension, 'text')
         syntax = Syntax(content, lexer, theme='monokai', line_numbers=True)
-        self.console.print(syntax)
+        with paused(self.renderer):
+            self.console.print(syntax)
         self.output_buffer.write(content + "\n")
 
     def file_exists(self, file_path):
@@ -143,81 +231,148 @@ class FileManager:
 
 
 class CommandExecutor:
+    """Runs external commands and streams their output line by line.
+
+    Only the last `tail_lines` lines of each stream are kept in memory; for Docker commands the
+    essential-keyword filter runs as lines arrive and keeps its own bounded tail. The latest line
+    is mirrored into the spinner while the command runs, and a timeout stops the command's whole
+    process group, so helpers spawned by docker-compose or poetry go with it.
+    """
+    tail_lines = 200
+    # Seconds between SIGTERM and SIGKILL when a command is cancelled
+    termination_grace_period = 5
+    # Seconds to wait for the output readers once the command has exited; a grandchild that left
+    # the process group can hold the pipes open indefinitely
+    reader_join_timeout = 5
+    essential_docker_keywords = ('done', 'Creating', 'Created', 'Starting', 'Started', 'exporting', 'successfully')
+
     def __init__(self, logger: Logger, spinner: CustomSpinner):
         self.logger = logger
         self.spinner = spinner
 
-    def execute_command(self, command, directory, message=None):
-        self.spinner.stop()
-        self.spinner.text = (message if message else f"Executing command: {' '.join(command)}")
-        self.spinner.start()
+    def execute_command(self, command, directory, message=None, timeout=None):
         if command[0] == 'pip':
             full_command = [sys.executable, '-m'] + command
         else:
             full_command = command
+        return self._execute(
+            full_command, directory,
+            message=message if message else f"Executing command: {' '.join(command)}",
+            title="Command Output", line_filter=None, timeout=timeout
+        )
+
+    def execute_docker_command(self, command, directory, message=None, timeout=None):
+        return self._execute(
+            command, directory,
+            message=message if message else f"Executing Docker command: {' '.join(command)}",
+            title="Docker Command Output", line_filter=self._is_essential_docker_line, timeout=timeout
+        )
+
+    def _execute(self, command, directory, message, title, line_filter=None, timeout=None):
+        self.spinner.stop()
+        self.spinner.text = message
+        self.spinner.start()
         try:
-            result = subprocess.run(
-                full_command, cwd=directory, shell=False, check=True,
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-            command_output = {
-                "args": result.args,
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-            self.spinner.stop()
-            self.logger.log_json("Command Output", self._parse_output(command_output), style="green")
-            return result
-        except subprocess.CalledProcessError as e:
-            error_details = {
-                "returncode": e.returncode,
-                "cmd": e.cmd,
-                "output": e.output,
-                "stderr": e.stderr
-            }
-            self.logger.log_error(f"Command {command} failed with error", self._parse_output(error_details))
-            self.spinner.stop()
-            return None
+            result, timed_out = self._run_streaming(command, directory, message, line_filter, timeout)
         except Exception as e:
             self.logger.log_error("Unexpected Error", str(e))
             self.spinner.stop()
             return None
-
-    def execute_docker_command(self, command, directory, message=None):
         self.spinner.stop()
-        self.spinner.text = (message if message else f"Executing Docker command: {' '.join(command)}")
-        self.spinner.start()
-        try:
-            result = subprocess.run(
-                command, cwd=directory, shell=False, check=True,
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-            command_output = {
-                "args": result.args,
-                "returncode": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-            self.spinner.stop()
-            self.logger.log_json("Docker Command Output", self._parse_docker_output(command_output), style="green")
-            return result
-        except subprocess.CalledProcessError as e:
-            error_details = {
-                "returncode": e.returncode,
-                "cmd": e.cmd,
-                "output": e.output,
-                "stderr": e.stderr
-            }
-            self.logger.log_error(f"Docker command {command} failed with error", self._parse_docker_output(error_details))
-            self.spinner.stop()
+        kind = "Docker command" if line_filter else "Command"
+        if timed_out:
+            self.logger.log_error(f"{kind} {command} timed out after {timeout}s and was stopped", self._parse_output(result))
             return None
-        except Exception as e:
-            self.logger.log_error("Unexpected Error", str(e))
-            self.spinner.stop()
+        if result.returncode != 0:
+            self.logger.log_error(f"{kind} {command} failed with error", {"returncode": result.returncode, **self._parse_output(result)})
             return None
-
-    def _parse_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
+        self.logger.log_json(title, self._parse_output(result), style="green")
+        return result
+
+    def _run_streaming(self, command, directory, message, line_filter=None, timeout=None):
+        """Run `command`, pumping stdout and stderr through reader threads into bounded tails.
+
+        Returns a CompletedProcess whose stdout/stderr hold the kept tail (the filtered lines when
+        `line_filter` is given) and whether the command was stopped by the timeout.
+        """
+        # Unbuffered binary pipes: the readers decode them, and a raw pipe can be closed from here
+        # while a reader is still blocked on it, which a buffered or text stream cannot
+        process = subprocess.Popen(
+            command, cwd=directory, shell=False,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            bufsize=0, start_new_session=True
+        )
+        tails = {'stdout': deque(maxlen=self.tail_lines), 'stderr': deque(maxlen=self.tail_lines)}
+        readers = [
+            threading.Thread(target=self._pump, args=(stream, tails[name], message, line_filter), daemon=True)
+            for name, stream in (('stdout', process.stdout), ('stderr', process.stderr))
+        ]
+        for reader in readers:
+            reader.start()
+        timed_out = False
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            self._terminate_process_group(process)
+        except BaseException:
+            self._terminate_process_group(process)
+            raise
+        finally:
+            deadline = time.monotonic() + self.reader_join_timeout
+            for reader in readers:
+                reader.join(timeout=max(0, deadline - time.monotonic()))
+            # Readers still blocked here stop with a ValueError on their next read
+            process.stdout.close()
+            process.stderr.close()
+        return subprocess.CompletedProcess(
+            command, process.returncode, '\n'.join(tails['stdout']), '\n'.join(tails['stderr'])
+        ), timed_out
+
+    def _pump(self, stream, tail, message, line_filter):
+        # Universal newlines turn the carriage-return progress updates of docker and pip into lines
+        lines = io.TextIOWrapper(io.BufferedReader(stream), errors='replace')
+        try:
+            for line in lines:
+                line = line.rstrip()
+                if not line:
+                    continue
+                self.spinner.text = f"{message} {line[:80]}"
+                if line_filter is None or line_filter(line):
+                    tail.append(line)
+        except (ValueError, OSError):
+            # The pipe was closed under us by _run_streaming after the reader join timed out
+            pass
+
+    def _terminate_process_group(self, process):
+        if process.poll() is not None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        except PermissionError:
+            # The group can't be signalled, e.g. a setuid helper joined it; the child itself always can
+            return self._kill_process(process)
+        try:
+            process.wait(timeout=self.termination_grace_period)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+            self._kill_process(process)
+
+    def _kill_process(self, process):
+        try:
+            process.kill()
+            process.wait(timeout=self.termination_grace_period)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            pass
+
+    def _parse_output(self, output) -> Dict[str, Any]:
+        if isinstance(output, subprocess.CompletedProcess):
+            output = {'stdout': output.stdout, 'stderr': output.stderr}
         parsed_output = {}
         if 'stdout' in output and output['stdout']:
             parsed_output['stdout'] = self._parse_lines(output['stdout'])
@@ -230,58 +385,89 @@ class CommandExecutor:
         filtered_lines = [line for line in lines if line.strip()]
         return filtered_lines
 
-    def _parse_docker_output(self, output: Dict[str, Any]) -> Dict[str, Any]:
-        parsed_output = {}
-        if 'stdout' in output and output['stdout']:
-            parsed_output['stdout'] = self._filter_docker_lines(output['stdout'])
-        if 'stderr' in output and output['stderr']:
-            parsed_output['stderr'] = self._filter_docker_lines(output['stderr'])
-        return parsed_output
-
-    def _filter_docker_lines(self, text: str) -> List[str]:
-        essential_keywords = ['done', 'Creating', 'Created', 'Starting', 'Started', 'exporting', 'successfully']
-        lines = text.strip().split('\n')
-        filtered_lines = [line for line in lines if any(keyword in line for keyword in essential_keywords)]
-        return filtered_lines
+    def _is_essential_docker_line(self, line: str) -> bool:
+        return any(keyword in line for keyword in self.essential_docker_keywords)
 
 class ClipboardManager:
     def __init__(self, logger: Logger):
         self.logger = logger
 
     def copy_to_clipboard(self, text):
-        pyperclip.copy(text)
-        self.logger.log("Output copied to clipboard.")
+        # Imported on demand: pyperclip forks a helper and is unavailable on headless hosts
+        try:
+            import pyperclip
+            pyperclip.copy(text)
+            self.logger.log("Output copied to clipboard.")
+        except Exception as e:
+            self.logger.log(f"Could not copy output to clipboard: {e}")
 
 class DisplayManager:
-    def __init__(self):
+    def __init__(self, renderer: CustomSpinner = None, run_log: RunLog = None):
         self.console = Console()
-        self.output_buffer = io.StringIO()
+        self.output_buffer = run_log if run_log is not None else RunLog()
+        self.renderer = renderer
 
     def display_banner(self, text):
-        banner_panel = Panel(Text(text, style="bold magenta"), border_style="magenta", expand=False, box=box.ROUNDED)
-        self.console.print("\n")
-        self.console.print(banner_panel)
         self.output_buffer.write(f"### {text} ###\n")
+        mode = get_output_mode()
+        if mode == 'json':
+            return write_json_record({'level': 'phase', 'message': text})
+        if mode == 'quiet':
+            return
+        banner_panel = Panel(Text(text, style="bold magenta"), border_style="magenta", expand=False, box=box.ROUNDED)
+        with paused(self.renderer):
+            self.console.print("\n")
+            self.console.print(banner_panel)
 
     def display_subphase(self, text):
-        self.console.print(Text(text, style="bold blue"))
         self.output_buffer.write(f"--- {text} ---\n")
+        if is_rich_output():
+            with paused(self.renderer):
+                self.console.print(Text(text, style="bold blue"))
 
     def display_action_status(self, action_name, status, symbol, color):
-        status_panel = Panel(Text(f"{symbol} {action_name} - {status}", style=f"bold {color}"), border_style=color, box=box.SQUARE)
-        self.console.print(status_panel)
         self.output_buffer.write(f"{symbol} {action_name} - {status}\n")
+        if is_rich_output():
+            status_panel = Panel(Text(f"{symbol} {action_name} - {status}", style=f"bold {color}"), border_style=color, box=box.SQUARE)
+            with paused(self.renderer):
+                self.console.print(status_panel)
 
 class Action:
-    def __init__(self, name: str, func: Callable, **kwargs):
+    def __init__(self, name: str, func: Callable, depends_on: Optional[List[Union['Action', str]]] = None,
+                 resources: Optional[List[str]] = None, critical: bool = False, **kwargs):
         self.name = name
         self.func = func
         self.args = kwargs
+        # None means "after the previous action", [] means "no dependencies"
+        self.depends_on = depends_on
+        self.resources = set(resources or [])
+        # A failed critical action cancels everything that has not started yet
+        self.critical = critical
         self.status = 'pending'
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
 
     def run(self):
-        self.func(**self.args)
-        self.status = 'completed'
+        self.status = 'running'
+        self.started_at = time.perf_counter()
+        try:
+            result = self.func(**self.args)
+            # Actions usually report their own errors and return console.handle_error(...) instead
+            # of raising; for critical actions that still has to stop the workflow.
+            self.status = 'failed' if self.critical and result is False else 'completed'
+        except Exception as e:
+            self.status = 'failed'
+            self.error = e
+            raise
+        finally:
+            self.finished_at = time.perf_counter()
 
 class Phase:
     def __init__(self, title: str):
@@ -298,16 +484,114 @@ class Phase:
         for action in self.actions:
             action.run()
         self.status = 'completed'
+
+class ActionScheduler:
+    """Runs the actions of a workflow on a bounded thread pool in dependency order.
+
+    Actions that leave ``depends_on`` unset keep the old sequential behaviour: they wait for the
+    previous action of their phase, and the first action of a phase waits for every earlier phase.
+    Actions that share a resource name never run at the same time. Dependents of a failed action
+    are skipped, and a failed critical action cancels every action that has not started yet.
+    """
+    def __init__(self, console: 'ConsoleInterface', max_workers: int = 4):
+        self.console = console
+        self.max_workers = max(1, max_workers)
+
+    def resolve_dependencies(self, phases: List[Phase]) -> Dict[Action, List[Action]]:
+        actions_by_name = {action.name: action for phase in phases for action in phase.actions}
+        dependencies: Dict[Action, List[Action]] = {}
+        earlier_actions: List[Action] = []
+        for phase in phases:
+            previous = None
+            for action in phase.actions:
+                if action.depends_on is None:
+                    dependencies[action] = [previous] if previous else list(earlier_actions)
+                else:
+                    resolved = []
+                    for dependency in action.depends_on:
+                        if isinstance(dependency, str):
+                            if dependency not in actions_by_name:
+                                raise ValueError(f"Action '{action.name}' depends on unknown action '{dependency}'")
+                            dependency = actions_by_name[dependency]
+                        resolved.append(dependency)
+                    dependencies[action] = resolved
+                previous = action
+            earlier_actions.extend(phase.actions)
+        return dependencies
+
+    def run(self, phases: List[Phase]) -> List[Action]:
+        dependencies = self.resolve_dependencies(phases)
+        phase_of = {action: phase for phase in phases for action in phase.actions}
+        pending = [action for phase in phases for action in phase.actions]
+        running: Dict[Future, Action] = {}
+        held_resources = set()
+        started_phases = set()
+        abort = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='blitz-action') as pool:
+            while pending or running:
+                progressed = False
+                for action in list(pending):
+                    if abort:
+                        action.status = 'cancelled'
+                        pending.remove(action)
+                        progressed = True
+                        continue
+                    statuses = [dependency.status for dependency in dependencies[action]]
+                    if any(status in ('failed', 'skipped', 'cancelled') for status in statuses):
+                        action.status = 'skipped'
+                        pending.remove(action)
+                        progressed = True
+                        continue
+                    if len(running) >= self.max_workers:
+                        break
+                    if any(status != 'completed' for status in statuses) or action.resources & held_resources:
+                        continue
+                    phase = phase_of[action]
+                    if phase not in started_phases:
+                        started_phases.add(phase)
+                        self.console.current_phase = phase
+                        with self.console.output_lock:
+                            self.console.display_manager.display_banner(phase.title)
+                    held_resources |= action.resources
+                    pending.remove(action)
+                    progressed = True
+                    running[pool.submit(self.console.run_action, action)] = action
+
+                if not running:
+                    if progressed:
+                        continue
+                    if pending:
+                        names = ', '.join(action.name for action in pending)
+                        raise RuntimeError(f"Workflow has unsatisfiable or circular dependencies: {names}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    action = running.pop(future)
+                    held_resources -= action.resources
+                    if action.status == 'failed' and action.critical:
+                        abort = True
+
+        for phase in phases:
+            statuses = {action.status for action in phase.actions}
+            phase.status = 'completed' if statuses <= {'completed'} else 'failed'
+        return [action for phase in phases for action in phase.actions]
+
 class ConsoleInterface:
     def __init__(self):
-        self.logger = Logger()
-        self.file_manager = FileManager()
         self.spinner = CustomSpinner(text='Initializing...', interval=0.1)
+        # One bounded sink for everything shown during the run, shared by the three writers below
+        self.run_log = RunLog()
+        self.logger = Logger(renderer=self.spinner, run_log=self.run_log)
+        self.file_manager = FileManager(renderer=self.spinner, run_log=self.run_log)
         self.command_executor = CommandExecutor(self.logger, spinner=self.spinner)
         self.clipboard_manager = ClipboardManager(self.logger)
-        self.display_manager = DisplayManager()
+        self.display_manager = DisplayManager(renderer=self.spinner, run_log=self.run_log)
         self.workflows: List[Dict[str, Any]] = []
         self.current_phase = None
+        # Actions may run on worker threads; serialize everything that touches the terminal
+        self.output_lock = threading.RLock()
 
     def create_workflow(self, workflow_name: str) -> Dict[str, Any]:
         workflow = {'name': workflow_name, 'phases': []}
@@ -323,79 +607,101 @@ class ConsoleInterface:
         action = phase.add_action(name, func, **kwargs)
         return action
 
+    def _emit_machine_output(self, level, message):
+        """Write a status message in quiet/json mode; returns False in rich mode."""
+        mode = get_output_mode()
+        if mode == 'json':
+            write_json_record({'level': level, 'message': strip_markup(message)})
+        elif mode == 'quiet':
+            if level == 'error':
+                sys.stderr.write(f"✖ {strip_markup(message)}\n")
+        return mode != 'rich'
+
     def handle_success(self, message):
-        self._ensure_spinner_started()
-        self.spinner.succeed(message)
+        """Report a successful step. Returns True so actions can `return console.handle_success(...)`."""
         self.logger.output_buffer.write(f"✔ {message}\n")
-        self.spinner.stop()
+        if not self._emit_machine_output('success', message):
+            self.spinner.succeed(message)
+        return True
 
     def handle_error(self, message, error_object=None):
-        self._ensure_spinner_started()
-        self.spinner.fail(message)
+        """Report a failed step. Returns False, which fails a critical action that returns it."""
         self.logger.output_buffer.write(f"✖ {message}\n")
-        if error_object:
-            error_details = json.dumps(error_object, default=lambda o: o.__dict__, sort_keys=True, indent=4)
-            error_syntax = Syntax(error_details, "json", theme="monokai", line_numbers=True)
-            error_panel = Panel(
-                error_syntax,
-                title="Error Details",
-                title_align="left",
-                border_style="red",
-                expand=False,
-                box=box.DOUBLE,
-            )
-            self.logger.console.print(error_panel)
-        else:
-            self.logger.console.print(Panel(f"[bold red]{message}", border_style="red"))
-        self.spinner.stop()
+        if self._emit_machine_output('error', message):
+            return False
+        with self.output_lock:
+            self.spinner.fail(message)
+            if error_object:
+                error_details = json.dumps(error_object, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+                error_syntax = Syntax(error_details, "json", theme="monokai", line_numbers=True)
+                error_panel = Panel(
+                    error_syntax,
+                    title="Error Details",
+                    title_align="left",
+                    border_style="red",
+                    expand=False,
+                    box=box.DOUBLE,
+                )
+            else:
+                error_panel = Panel(f"[bold red]{message}", border_style="red")
+            with self.spinner.paused():
+                self.logger.console.print(error_panel)
+        return False
 
     def handle_wait(self, message):
-        self._ensure_spinner_started()
-        self.spinner.text = message
-        self.spinner.start()
         self.logger.output_buffer.write(f"... {message}\n")
-        self.spinner.stop()
+        if not self._emit_machine_output('wait', message):
+            self.spinner.text = message
+            self.spinner.start()
 
     def handle_info(self, message):
-        self._ensure_spinner_started()
-        self.spinner.info(message)
         self.logger.output_buffer.write(f"ℹ {message}\n")
-        self.spinner.stop()
+        if not self._emit_machine_output('info', message):
+            self.spinner.info(message)
 
-    def run_workflow(self, workflow: Dict[str, Any]):
-        for phase in workflow['phases']:
-            self.current_phase = phase
-            self.display_manager.display_banner(phase.title)
-            for action in phase.actions:
-                self.run_action(action)
-            phase.status = 'completed'
-        self.clipboard_manager.copy_to_clipboard(self.logger.get_output())
+    def run_workflow(self, workflow: Dict[str, Any], max_workers: int = 4):
+        scheduler = ActionScheduler(self, max_workers=max_workers)
+        actions = scheduler.run(workflow['phases'])
+        self.spinner.stop()
+        self.display_workflow_summary(actions)
+        if should_copy_run_log():
+            self.clipboard_manager.copy_to_clipboard(self.logger.get_output())
 
     def run_action(self, action: Action):
         self.spinner.text = action.name
         self.spinner.start()
         try:
             action.run()
-            self.handle_success(f"Completed {action.name}")
+            if action.status == 'completed':
+                self.handle_success(f"Completed {action.name}")
         except Exception as e:
             self.handle_error(f"An error has occurred while {action.name}: {str(e)}")
-        finally:
-            self.spinner.stop()
+        return action.status
+
+    def display_workflow_summary(self, actions: List[Action]):
+        summary = [
+            {
+                "action": action.name,
+                "status": action.status,
+                "seconds": round(action.duration, 3) if action.duration is not None else None,
+            }
+            for action in actions
+        ]
+        with self.output_lock:
+            self.logger.log_json("Workflow Summary", summary, style="blue")
 
-    def execute_command(self, command, directory, message=None):
+    def execute_command(self, command, directory, message=None, timeout=None):
         try:
-            self._ensure_spinner_started()
-            result = self.command_executor.execute_command(command, directory, message)
+            result = self.command_executor.execute_command(command, directory, message, timeout=timeout)
             self.spinner.stop()
             return result
         except Exception as e:
             self.spinner.stop()
             self.handle_error(f"Command {' '.join(command)} failed: {str(e)}")
 
-    def execute_docker_command(self, command, directory, message=None):
+    def execute_docker_command(self, command, directory, message=None, timeout=None):
         try:
-            self._ensure_spinner_started()
-            result = self.command_executor.execute_docker_command(command, directory, message)
+            result = self.command_executor.execute_docker_command(command, directory, message, timeout=timeout)
             self.spinner.stop()
             return result
         except Exception as e:
@@ -405,6 +711,3 @@ class ConsoleInterface:
     def display_file_content(self, file_path):
         self.file_manager.display_file_content(file_path)
 
-    def _ensure_spinner_started(self):
-        if not self.spinner.thread.is_alive():
-            self.spinner.start()
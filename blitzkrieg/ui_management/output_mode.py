@@ -0,0 +1,47 @@
+"""Process-wide output settings selected by the `blitz` command line.
+
+`rich` is the interactive default. `quiet` prints nothing but plain-text errors on stderr and `json`
+writes one JSON object per event to stdout; neither touches rich, termcolor or the spinner.
+Copying the run log (or a command's result) to the clipboard is opt-in through `--copy-log` or
+BLITZ_COPY_LOG=1.
+Kept free of heavy imports so the CLI can set it before any command module is loaded.
+"""
+import json
+import os
+import re
+import sys
+
+OUTPUT_MODES = ('rich', 'quiet', 'json')
+
+_output_mode = 'rich'
+_copy_run_log = os.environ.get('BLITZ_COPY_LOG', '').lower() in ('1', 'true', 'yes')
+
+# Rich markup such as [white]...[/white] or [bold red] embedded in console messages
+MARKUP_PATTERN = re.compile(r'\[/?[a-zA-Z][a-zA-Z0-9 _#.-]*\]')
+
+def set_output_mode(mode: str):
+    global _output_mode
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode {mode!r}; expected one of {', '.join(OUTPUT_MODES)}")
+    _output_mode = mode
+
+def get_output_mode() -> str:
+    return _output_mode
+
+def is_rich_output() -> bool:
+    return _output_mode == 'rich'
+
+def set_copy_run_log(enabled: bool):
+    global _copy_run_log
+    _copy_run_log = enabled
+
+def should_copy_run_log() -> bool:
+    return _copy_run_log
+
+def strip_markup(message) -> str:
+    return MARKUP_PATTERN.sub('', str(message))
+
+def write_json_record(record: dict, stream=None):
+    stream = stream or sys.stdout
+    stream.write(json.dumps(record, default=str) + '\n')
+    stream.flush()
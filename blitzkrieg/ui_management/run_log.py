@@ -0,0 +1,75 @@
+import atexit
+import gzip
+import os
+import threading
+import time
+from collections import deque
+
+class RunLog:
+    """Size-capped record of everything the console showed during this run.
+
+    The most recent `max_bytes` of text stay in memory; older entries are spilled, in order, to a
+    gzip file under ~/.blitzkrieg/logs that is only created once the cap is first exceeded.
+    Exposes `write`/`getvalue` so it can stand in for the StringIO buffers it replaces.
+    """
+    default_max_bytes = 256 * 1024
+    # Spilled logs kept on disk; older ones are removed when a new one is created
+    keep_spool_files = 20
+
+    def __init__(self, max_bytes: int = None, spool_directory: str = None):
+        self.max_bytes = max_bytes or self.default_max_bytes
+        self.spool_directory = spool_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "logs")
+        self.spool_path = None
+        self.spilled_bytes = 0
+        self._entries = deque()
+        self._size = 0
+        self._spool = None
+        self._lock = threading.Lock()
+
+    def write(self, text: str):
+        if not text:
+            return 0
+        with self._lock:
+            self._entries.append(text)
+            self._size += len(text)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                self._spill(self._entries.popleft())
+        return len(text)
+
+    def _spill(self, text):
+        if self._spool is None:
+            os.makedirs(self.spool_directory, exist_ok=True)
+            self._prune_spool_files()
+            self.spool_path = os.path.join(self.spool_directory, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.log.gz")
+            self._spool = gzip.open(self.spool_path, 'wt', encoding='utf-8')
+            atexit.register(self.close)
+        self._spool.write(text)
+        self._size -= len(text)
+        self.spilled_bytes += len(text)
+
+    def _prune_spool_files(self):
+        spool_files = sorted(
+            (name for name in os.listdir(self.spool_directory) if name.startswith('run-') and name.endswith('.log.gz')),
+            reverse=True
+        )
+        for name in spool_files[self.keep_spool_files - 1:]:
+            try:
+                os.remove(os.path.join(self.spool_directory, name))
+            except OSError:
+                pass
+
+    def getvalue(self) -> str:
+        """The in-memory tail, prefixed with a pointer to the spilled part when there is one."""
+        with self._lock:
+            tail = ''.join(self._entries)
+            if self.spilled_bytes:
+                if self._spool:
+                    self._spool.flush()
+                return f"[{self.spilled_bytes} earlier characters in {self.spool_path}]\n{tail}"
+            return tail
+
+    def close(self):
+        with self._lock:
+            if self._spool:
+                self._spool.close()
+                self._spool = None
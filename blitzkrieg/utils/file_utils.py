@@ -1,6 +1,14 @@
 # file_utils.py
 
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows has no advisory locks; fall back to best-effort atomic renames
+    fcntl = None
 
 def get_files(directory, suffix):
     return [file for file in os.listdir(directory) if file.endswith(suffix)]
@@ -10,3 +18,61 @@ def add_uuid_to_file(file_path, uuid_str):
         content = file.read()
         file.seek(0, 0)
         file.write(f'{uuid_str}\n{content}')
+
+@contextmanager
+def file_lock(lock_path):
+    """Hold an exclusive advisory lock on lock_path for the duration of the block."""
+    os.makedirs(os.path.dirname(lock_path) or '.', exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def atomic_output(file_path, mode='w'):
+    """Yield a temp file next to file_path that replaces it in one rename when the block succeeds."""
+    directory = os.path.dirname(file_path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        if os.path.exists(file_path):
+            os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def atomic_write(file_path, content):
+    with atomic_output(file_path, 'wb' if isinstance(content, bytes) else 'w') as f:
+        f.write(content)
+
+# ioctl request number for FICLONE (copy-on-write clone) on Linux filesystems such as btrfs and XFS
+FICLONE = 0x40049409
+
+def fast_copy(src, dst):
+    """Copy src to dst, sharing extents through a reflink when the filesystem supports it.
+
+    Hard links are deliberately not used: workspace files are edited in place afterwards and
+    must never write through to their source.
+    """
+    cloned = False
+    if fcntl:
+        with open(src, 'rb') as source, open(dst, 'wb') as target:
+            try:
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+                cloned = True
+            except OSError:
+                pass
+    if not cloned:
+        shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+    return dst
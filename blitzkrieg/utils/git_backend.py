@@ -0,0 +1,193 @@
+# git_backend.py
+
+import os
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+try:
+    from dulwich import porcelain
+    from dulwich.repo import Repo
+except ImportError:  # Optional extra; the CLI backend below covers every operation
+    porcelain = None
+    Repo = None
+
+DEFAULT_BRANCH = 'master'
+
+class GitError(Exception):
+    pass
+
+class GitRepository(ABC):
+    """One handle on a working tree for the init/add/commit/tag/remote/push sequence blitzkrieg runs.
+
+    Paths and messages are always passed as arguments, never interpolated into a shell command.
+    Use `open_repository` to get the in-process implementation when dulwich is installed.
+    """
+    backend = None
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+
+    @abstractmethod
+    def init(self, initial_branch: str = DEFAULT_BRANCH):
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, paths: Optional[Iterable[str]] = None):
+        """Stage the given paths (relative to the repository root), or the whole tree when paths is None."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self, message: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def tag(self, name: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_remote(self, name: str, url: str):
+        """Point remote `name` at url, adding it if it does not exist yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def push(self, remote: str = 'origin', branch: str = DEFAULT_BRANCH, tags: Iterable[str] = (), set_upstream: bool = False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def current_branch(self) -> str:
+        raise NotImplementedError
+
+class DulwichRepository(GitRepository):
+    """In-process implementation: no git executable and no process spawns."""
+    backend = 'dulwich'
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._repo = None
+
+    @property
+    def repo(self):
+        if self._repo is None:
+            self._repo = Repo(self.path)
+        return self._repo
+
+    def init(self, initial_branch: str = DEFAULT_BRANCH):
+        if os.path.isdir(os.path.join(self.path, '.git')):
+            self._repo = Repo(self.path)
+            return
+        os.makedirs(self.path, exist_ok=True)
+        self._repo = Repo.init(self.path)
+        self._repo.refs.set_symbolic_ref(b'HEAD', f'refs/heads/{initial_branch}'.encode())
+
+    def add(self, paths: Optional[Iterable[str]] = None):
+        # Absolute paths: older dulwich releases resolve relative ones against the process cwd
+        targets = [self.path] if paths is None else [os.path.join(self.path, path) for path in paths]
+        try:
+            porcelain.add(self.repo, paths=targets)
+        except Exception as e:
+            raise GitError(f"Failed to stage files in {self.path}: {e}") from e
+
+    def commit(self, message: str) -> str:
+        try:
+            return porcelain.commit(self.repo, message=message.encode()).decode()
+        except Exception as e:
+            raise GitError(f"Failed to commit in {self.path}: {e}") from e
+
+    def tag(self, name: str):
+        try:
+            porcelain.tag_create(self.repo, name.encode())
+        except Exception as e:
+            raise GitError(f"Failed to create tag {name}: {e}") from e
+
+    def set_remote(self, name: str, url: str):
+        config = self.repo.get_config()
+        config.set((b'remote', name.encode()), b'url', url.encode())
+        config.set((b'remote', name.encode()), b'fetch', f'+refs/heads/*:refs/remotes/{name}/*'.encode())
+        config.write_to_path()
+
+    def push(self, remote: str = 'origin', branch: str = DEFAULT_BRANCH, tags: Iterable[str] = (), set_upstream: bool = False):
+        refspecs = [f'refs/heads/{branch}'.encode()] + [f'refs/tags/{tag}'.encode() for tag in tags]
+        remote_url = self.repo.get_config().get((b'remote', remote.encode()), b'url').decode()
+        try:
+            # Progress output is discarded; failures surface as exceptions
+            with open(os.devnull, 'wb') as devnull:
+                porcelain.push(self.repo, remote_url, refspecs, outstream=devnull, errstream=devnull)
+        except Exception as e:
+            raise GitError(f"Failed to push {branch} to {remote}: {e}") from e
+        self.repo.refs[f'refs/remotes/{remote}/{branch}'.encode()] = self.repo.refs[f'refs/heads/{branch}'.encode()]
+        if set_upstream:
+            config = self.repo.get_config()
+            config.set((b'branch', branch.encode()), b'remote', remote.encode())
+            config.set((b'branch', branch.encode()), b'merge', f'refs/heads/{branch}'.encode())
+            config.write_to_path()
+
+    def current_branch(self) -> str:
+        return porcelain.active_branch(self.repo).decode()
+
+class GitCliRepository(GitRepository):
+    """Fallback on the git executable: one process per operation, whatever the number of paths."""
+    backend = 'cli'
+
+    def _git(self, *args, input_text: str = None) -> str:
+        try:
+            result = subprocess.run(
+                ['git', *args], cwd=self.path, input=input_text, text=True,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise GitError(f"git {args[0]} failed in {self.path}: {e.stderr.strip()}") from e
+        except FileNotFoundError as e:
+            raise GitError("git is not installed") from e
+        return result.stdout.strip()
+
+    def init(self, initial_branch: str = DEFAULT_BRANCH):
+        if os.path.isdir(os.path.join(self.path, '.git')):
+            return
+        os.makedirs(self.path, exist_ok=True)
+        self._git('init', '--quiet')
+        # symbolic-ref rather than `init --initial-branch`, which older git releases lack
+        self._git('symbolic-ref', 'HEAD', f'refs/heads/{initial_branch}')
+
+    def add(self, paths: Optional[Iterable[str]] = None):
+        if paths is None:
+            self._git('add', '--all')
+            return
+        paths = list(paths)
+        if paths:
+            # NUL-separated pathspecs on stdin keep it to a single process and clear of ARG_MAX
+            self._git('add', '--pathspec-from-file=-', '--pathspec-file-nul', input_text='\0'.join(paths))
+
+    def commit(self, message: str) -> str:
+        self._git('commit', '--quiet', '-m', message)
+        return self._git('rev-parse', 'HEAD')
+
+    def tag(self, name: str):
+        self._git('tag', name)
+
+    def set_remote(self, name: str, url: str):
+        if name in self._git('remote').split():
+            self._git('remote', 'set-url', name, url)
+        else:
+            self._git('remote', 'add', name, url)
+
+    def push(self, remote: str = 'origin', branch: str = DEFAULT_BRANCH, tags: Iterable[str] = (), set_upstream: bool = False):
+        args: List[str] = ['push', '--quiet']
+        if set_upstream:
+            args.append('--set-upstream')
+        self._git(*args, remote, f'refs/heads/{branch}', *[f'refs/tags/{tag}' for tag in tags])
+
+    def current_branch(self) -> str:
+        return self._git('symbolic-ref', '--short', 'HEAD')
+
+def open_repository(path: str, backend: str = None) -> GitRepository:
+    """Return a repository handle for path, preferring dulwich when it is installed.
+
+    `backend` (or BLITZ_GIT_BACKEND) forces 'dulwich' or 'cli'.
+    """
+    backend = backend or os.environ.get('BLITZ_GIT_BACKEND')
+    if backend == 'cli' or (backend is None and porcelain is None):
+        return GitCliRepository(path)
+    if porcelain is None:
+        raise GitError("The dulwich git backend was requested but dulwich is not installed (pip install 'blitzkrieg[git]')")
+    return DulwichRepository(path)
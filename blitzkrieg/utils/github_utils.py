@@ -1,39 +1,200 @@
+import hashlib
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
 from urllib.parse import urlparse
 from blitzkrieg.db.models.project import Project
 from blitzkrieg.ui_management.console_instance import console
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
+from blitzkrieg.class_instances.github_client import get_github_client
+from blitzkrieg.utils.file_utils import atomic_write
+from blitzkrieg.utils.git_backend import open_repository
 from blitzkrieg.utils.run_command import run_command
 
-def create_github_repo(project: Project):
+class GitHubAPIError(Exception):
+    def __init__(self, response: requests.Response, retry_at: float = None):
+        self.response = response
+        self.status_code = response.status_code
+        # Epoch time GitHub asked us to wait until, when it refused the request for now
+        self.retry_at = retry_at
+        message = f"GitHub API {response.request.method} {response.url} failed with status {response.status_code}"
+        if retry_at is not None:
+            message += f"; rate limited until {time.strftime('%H:%M:%S', time.localtime(retry_at))}"
+        super().__init__(message)
+
+class GitHubClient:
+    """GitHub REST client sharing one pooled, keep-alive session across every call.
+
+    GET responses that carry an ETag are cached under ~/.blitzkrieg/cache/github and revalidated
+    with If-None-Match, so unchanged resources come back as 304s that GitHub does not count against
+    the rate limit. Rate-limited responses are retried with backoff that honours Retry-After and
+    X-RateLimit-Reset, as long as the wait fits under max_backoff; a longer wait fails right away
+    instead of retrying against a limit that is still exhausted. 5xx responses are retried only for
+    idempotent methods, since a POST may have taken effect before the error. `base_url` can point at
+    a local stub server.
+    """
+    default_base_url = 'https://api.github.com'
+    retry_statuses = (429, 500, 502, 503, 504)
+    # Statuses GitHub sends Retry-After with: primary and secondary rate limits, and maintenance
+    retry_after_statuses = (403, 429, 503)
+    idempotent_methods = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    # Longest wait worth sleeping through; a later Retry-After or reset is reported instead
+    max_backoff = 60
+
+    def __init__(self, token: str = None, base_url: str = None, timeout=(5, 30), max_retries: int = 3,
+                 pool_size: int = 10, cache_directory: str = None):
+        self.base_url = (base_url or self.default_base_url).rstrip('/')
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "github")
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "blitzkrieg",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+        # Connection failures are retried by urllib3; HTTP statuses are handled in request() so the headers can be read
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size,
+            max_retries=Retry(total=max_retries, connect=max_retries, read=0, status=0, backoff_factor=0.5,
+                              respect_retry_after_header=False, raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Cache entries are per token, so two accounts never see each other's private resources
+        self._cache_namespace = hashlib.sha256((token or '').encode()).hexdigest()[:12]
+        self._cache_lock = threading.Lock()
+
+    def _url(self, path: str) -> str:
+        return path if path.startswith(('http://', 'https://')) else f"{self.base_url}/{path.lstrip('/')}"
+
+    def get_retry_at(self, response: requests.Response):
+        """Epoch time from Retry-After or an exhausted rate limit's reset, or None when neither applies."""
+        status = response.status_code
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None and status in self.retry_after_statuses:
+            try:
+                return time.time() + float(retry_after)
+            except ValueError:
+                pass
+        if status in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = response.headers.get('X-RateLimit-Reset')
+            if reset is not None:
+                try:
+                    # The reset is in whole seconds; wait until it has certainly passed
+                    return max(float(reset) + 1, time.time())
+                except ValueError:
+                    pass
+        return None
+
+    def get_backoff(self, response: requests.Response, attempt: int):
+        """Seconds to wait before retrying response, or None when it should not be retried."""
+        status = response.status_code
+        rate_limited = status in (403, 429)
+        if status not in self.retry_after_statuses and status not in self.retry_statuses:
+            return None
+        if not rate_limited and response.request.method not in self.idempotent_methods:
+            # A rate-limited request was refused outright; after a 5xx it may already have been applied
+            return None
+        retry_at = self.get_retry_at(response)
+        if retry_at is not None:
+            wait = max(retry_at - time.time(), 0)
+            return wait if wait <= self.max_backoff else None
+        if status in self.retry_statuses:
+            return min(0.5 * 2 ** attempt, self.max_backoff)
+        return None
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        url = self._url(path)
+        for attempt in range(self.max_retries + 1):
+            response = self.session.request(method, url, **kwargs)
+            backoff = self.get_backoff(response, attempt)
+            if backoff is None or attempt == self.max_retries:
+                return response
+            response.close()
+            time.sleep(backoff)
+
+    def _cache_path(self, url: str, params) -> str:
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        return os.path.join(self.cache_directory, self._cache_namespace, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def _read_cache(self, cache_path: str):
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, path: str, params: Dict[str, Any] = None) -> Any:
+        """GET path and return the decoded JSON body, revalidating against the on-disk ETag cache."""
+        url = self._url(path)
+        cache_path = self._cache_path(url, params)
+        cached = self._read_cache(cache_path)
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        response = self.request('GET', url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached['body']
+        if not response.ok:
+            raise GitHubAPIError(response, self.get_retry_at(response))
+        body = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._cache_lock:
+                atomic_write(cache_path, json.dumps({'etag': etag, 'body': body}))
+        return body
+
+    def post(self, path: str, payload: Dict[str, Any]) -> Any:
+        response = self.request('POST', path, json=payload)
+        if not response.ok:
+            raise GitHubAPIError(response, self.get_retry_at(response))
+        return response.json()
+
+    def map(self, function: Callable, items: Iterable, max_workers: int = None) -> List:
+        """Apply function to every item concurrently over the shared pool; results keep the input order."""
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as executor:
+            return list(executor.map(function, items))
+
+    def get_many(self, paths: Iterable[str], max_workers: int = None) -> List:
+        return self.map(self.get, paths, max_workers=max_workers)
+
+    def close(self):
+        self.session.close()
+
+def create_github_repo(project: Project, client: 'GitHubClient' = None):
     """Create a new github repo."""
-    github_token = load_github_token()
+    client = client or get_github_client()
     project_name = project.name
     project_description = project.description
 
-    url = f"https://api.github.com/user/repos"
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
     data = {
         "name": project_name,
         "description": project_description,
         "private": False
     }
-    response = requests.post(url, headers=headers, data=json.dumps(data))
+    response = client.request('POST', '/user/repos', json=data)
+    retry_at = client.get_retry_at(response)
 
     if response.status_code == 201:
         console.handle_success(f'Successfully created repository "{project_name}"')
         repo_url = response.json()['html_url']
         project.github_repo = repo_url
         console.handle_info(f'You can access it at {repo_url}')
+        return repo_url
     elif response.status_code == 422:
         console.handle_error(f'Repository "{project_name}" already exists')
+    elif retry_at is not None:
+        console.handle_error(f'Failed to create repository "{project_name}": {GitHubAPIError(response, retry_at)}')
     elif response.status_code == 403:
         console.handle_error('Permission denied. Check your GitHub token')
     else:
@@ -47,8 +208,7 @@ def load_github_token():
     return github_token
 
 def push_project_to_repo(project: Project):
-    workspace_dir_path = blitz_env_manager.get_active_workspace_dir()
-    project_dir_path = os.path.join(workspace_dir_path, 'projects', project.name)
+    project_dir_path = project.directory_path or os.path.join(blitz_env_manager.get_active_workspace_dir(), 'projects', project.name)
     # initlialize git within the project directory
 
     github_token = blitz_env_manager.get_global_env_var('GITHUB_TOKEN')
@@ -62,15 +222,17 @@ def push_project_to_repo(project: Project):
 
     try:
         console.handle_wait(f"initializing git within the project directory: {project_dir_path}")
-        run_command(f'cd {project_dir_path} && git init')
-        run_command(f'cd {project_dir_path} && git add .')
-        run_command(f'cd {project_dir_path} && git commit -m "Initial commit"')
-        run_command(f'cd {project_dir_path} && git branch -M master')
-        run_command(f'cd {project_dir_path} && git remote add origin {repo_url}')
-        run_command(f'cd {project_dir_path} && git push -u origin master')
+        repository = open_repository(project_dir_path)
+        repository.init(initial_branch='master')
+        repository.add()
+        repository.commit("Initial commit")
+        repository.set_remote('origin', repo_url)
+        repository.push('origin', 'master', set_upstream=True)
         console.handle_success(f"Successfully pushed project to GitHub")
+        return True
     except Exception as e:
         console.handle_error(f"An error occurred while initializing git within the project directory: {str(e)}")
+        return False
 
 # create test PYPI project for TestPYPI site
 def create_test_pypi_project(project: Project):
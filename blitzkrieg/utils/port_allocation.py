@@ -1,13 +1,103 @@
+import errno
+import json
+import os
 import socket
+import threading
+from contextlib import ExitStack
+from blitzkrieg.utils.file_utils import atomic_write, file_lock
+
+def _bind_probe(port, stack: ExitStack):
+    """Bind port on all interfaces and keep the socket open in stack; True when the port is free."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if os.name != 'nt':
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(('', port))
+    except PermissionError:
+        # Privileged ports are published by the Docker daemon, not by us; only check nobody listens
+        sock.close()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            return s.connect_ex(('127.0.0.1', port)) != 0
+    except OSError as e:
+        sock.close()
+        if e.errno in (errno.EADDRINUSE, errno.EADDRNOTAVAIL):
+            return False
+        raise
+    stack.callback(sock.close)
+    return True
 
-@staticmethod
 def is_port_in_use(port):
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
-
-@staticmethod
-def find_available_port(starting_port=5432):
-    port = starting_port
-    while is_port_in_use(port):
-        port += 1  # try the next port
-    return port
+    with ExitStack() as stack:
+        return not _bind_probe(port, stack)
+
+def find_available_port(starting_port=5432, reserved=frozenset(), max_port=65535):
+    with ExitStack() as stack:
+        for port in range(starting_port, max_port + 1):
+            if port not in reserved and _bind_probe(port, stack):
+                return port
+    raise RuntimeError(f"No free port found between {starting_port} and {max_port}")
+
+class PortAllocator:
+    """Hands out blocks of host ports to workspaces and remembers them in a reservation registry.
+
+    The registry lives next to the global .blitz.env and is only modified under an advisory lock, so
+    two workspaces created at the same time can never be given the same port.
+    """
+    workspace_services = {
+        'postgres': 5432,
+        'pgadmin': 5050,
+        'pgadmin_tls': 443,
+    }
+
+    def __init__(self, registry_path: str = None):
+        self.registry_path = registry_path or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "port_reservations.json")
+        self.lock_path = f"{self.registry_path}.lock"
+        self._lock = threading.Lock()
+
+    def _load_registry(self):
+        try:
+            with open(self.registry_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'workspaces': {}}
+
+    def _save_registry(self, registry):
+        atomic_write(self.registry_path, json.dumps(registry, indent=4, sort_keys=True))
+
+    def get_workspace_ports(self, workspace_name: str):
+        return self._load_registry()['workspaces'].get(workspace_name)
+
+    def reserve_workspace_ports(self, workspace_name: str, services: dict = None):
+        """Return the workspace's reserved ports, reserving a fresh block the first time it is asked for."""
+        services = services or self.workspace_services
+        with self._lock, file_lock(self.lock_path):
+            registry = self._load_registry()
+            existing = registry['workspaces'].get(workspace_name, {})
+            if all(service in existing for service in services):
+                return existing
+
+            reserved = {port for ports in registry['workspaces'].values() for port in ports.values()}
+            block = dict(existing)
+            with ExitStack() as stack:
+                # Every candidate stays bound until the block is recorded, so the probes can't collide
+                for service, starting_port in services.items():
+                    if service in block:
+                        continue
+                    for port in range(starting_port, 65536):
+                        if port not in reserved and _bind_probe(port, stack):
+                            block[service] = port
+                            reserved.add(port)
+                            break
+                    else:
+                        raise RuntimeError(f"No free port found for {service} starting at {starting_port}")
+                registry['workspaces'][workspace_name] = block
+                self._save_registry(registry)
+            return block
+
+    def release_workspace_ports(self, workspace_name: str):
+        with self._lock, file_lock(self.lock_path):
+            registry = self._load_registry()
+            released = registry['workspaces'].pop(workspace_name, None)
+            if released is not None:
+                self._save_registry(registry)
+            return released
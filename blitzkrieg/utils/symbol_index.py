@@ -0,0 +1,278 @@
+# symbol_index.py
+
+import ast
+import hashlib
+import itertools
+import linecache
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+# Directories that never contain project sources worth indexing
+SKIPPED_DIRECTORIES = {'__pycache__', 'node_modules', 'venv', 'env', 'build', 'dist', 'site-packages'}
+
+CLICK_COMMAND_DECORATORS = ('command', 'group')
+
+def get_click_command_name(node) -> str:
+    """The command name registered by a @<x>.command/@<x>.group decorator, or None.
+
+    Mirrors click's own default: without an explicit name the function name is used with
+    underscores turned into dashes.
+    """
+    for decorator in node.decorator_list:
+        call = decorator if isinstance(decorator, ast.Call) else None
+        func = call.func if call else decorator
+        attr = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        if attr not in CLICK_COMMAND_DECORATORS:
+            continue
+        if call:
+            if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+                return call.args[0].value
+            for keyword in call.keywords:
+                if keyword.arg == 'name' and isinstance(keyword.value, ast.Constant):
+                    return keyword.value.value
+        return node.name.replace('_', '-')
+    return None
+
+class _SymbolCollector(ast.NodeVisitor):
+    """Collects definitions and references of one module, tracking the enclosing scope and statement."""
+    def __init__(self):
+        self.definitions = []
+        self.references = []
+        self._seen_references = set()
+        self._scopes = []
+        self._statement = None
+
+    def _scope(self):
+        return '.'.join(self._scopes) or None
+
+    def generic_visit(self, node):
+        if isinstance(node, ast.stmt):
+            previous, self._statement = self._statement, node
+            super().generic_visit(node)
+            self._statement = previous
+        else:
+            super().generic_visit(node)
+
+    def _visit_definition(self, node, kind):
+        self.definitions.append({
+            'name': node.name,
+            'qualname': '.'.join(self._scopes + [node.name]),
+            'kind': kind,
+            'parent': self._scope(),
+            # Start at the first decorator so the recorded source includes them
+            'lineno': min([node.lineno] + [decorator.lineno for decorator in node.decorator_list]),
+            'end_lineno': node.end_lineno,
+            'command_name': get_click_command_name(node) if kind != 'class' else None,
+        })
+        # Decorators and defaults belong to the enclosing scope, the body to the definition itself
+        for decorator in node.decorator_list:
+            self._visit_in_statement(decorator, node)
+        self._scopes.append(node.name)
+        previous, self._statement = self._statement, node
+        for child in ast.iter_child_nodes(node):
+            if child not in node.decorator_list:
+                self.visit(child)
+        self._statement = previous
+        self._scopes.pop()
+
+    def _visit_in_statement(self, node, statement):
+        previous, self._statement = self._statement, statement
+        self.visit(node)
+        self._statement = previous
+
+    def visit_FunctionDef(self, node):
+        self._visit_definition(node, 'function')
+
+    def visit_AsyncFunctionDef(self, node):
+        self._visit_definition(node, 'function')
+
+    def visit_ClassDef(self, node):
+        self._visit_definition(node, 'class')
+
+    def _add_reference(self, name, kind, node):
+        statement = self._statement or node
+        key = (name, kind, statement.lineno)
+        if key not in self._seen_references:
+            self._seen_references.add(key)
+            self.references.append((name, kind, self._scope(), statement.lineno, statement.end_lineno))
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Name):
+            self._add_reference(func.id, 'call', node)
+        elif isinstance(func, ast.Attribute):
+            self._add_reference(func.attr, 'call', node)
+            self.visit(func.value)
+        else:
+            self.visit(func)
+        for child in node.args + node.keywords:
+            self.visit(child)
+
+    def visit_Name(self, node):
+        self._add_reference(node.id, 'name', node)
+
+    def visit_Attribute(self, node):
+        self._add_reference(node.attr, 'attribute', node)
+        self.visit(node.value)
+
+def index_file(path: str) -> Dict:
+    """Parse one module into its index entry. Runs in worker processes, so it must stay top-level."""
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, ValueError, OSError) as e:
+        return {'definitions': [], 'references': [], 'error': str(e)}
+    collector = _SymbolCollector()
+    collector.visit(tree)
+    return {'definitions': collector.definitions, 'references': collector.references, 'error': None}
+
+class SymbolIndex:
+    """Cross-reference index of the definitions, call sites and click commands under a directory tree.
+
+    The index lives in a SQLite database under ~/.blitzkrieg/cache/symbol-index, one per root.
+    Files are keyed by path, mtime and size, so `refresh()` only re-parses files that changed since
+    the last run, and lookups are indexed queries that never load the whole index into memory.
+    Larger batches of changed files are parsed in a process pool.
+    """
+    index_version = 1
+    # Below this many changed files the pool start-up costs more than it saves
+    parallel_threshold = 32
+
+    def __init__(self, root: str = None, cache_directory: str = None, max_workers: int = None):
+        self.root = os.path.abspath(root or os.getcwd())
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "symbol-index")
+        root_hash = hashlib.sha256(self.root.encode()).hexdigest()[:16]
+        self.cache_path = os.path.join(self.cache_directory, f"{root_hash}.sqlite3")
+        self.max_workers = max_workers
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.cache_path)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != self.index_version:
+                self._create_schema()
+        return self._connection
+
+    def _create_schema(self):
+        self._connection.executescript(f"""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS definitions;
+            DROP TABLE IF EXISTS symbol_references;
+            CREATE TABLE files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, error TEXT);
+            CREATE TABLE definitions (
+                path TEXT NOT NULL, name TEXT NOT NULL, qualname TEXT NOT NULL, kind TEXT NOT NULL, parent TEXT,
+                lineno INTEGER NOT NULL, end_lineno INTEGER NOT NULL, command_name TEXT
+            );
+            CREATE TABLE symbol_references (
+                path TEXT NOT NULL, name TEXT NOT NULL, kind TEXT NOT NULL, parent TEXT,
+                lineno INTEGER NOT NULL, end_lineno INTEGER NOT NULL
+            );
+            CREATE INDEX ix_definitions_name ON definitions (name);
+            CREATE INDEX ix_definitions_command_name ON definitions (command_name) WHERE command_name IS NOT NULL;
+            CREATE INDEX ix_definitions_path ON definitions (path);
+            CREATE INDEX ix_symbol_references_name ON symbol_references (name);
+            CREATE INDEX ix_symbol_references_path ON symbol_references (path);
+            PRAGMA user_version = {self.index_version};
+        """)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def iter_source_files(self):
+        """Yield (relative path, stat) for every .py file under the root, skipping hidden and build directories."""
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIRECTORIES:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    yield os.path.relpath(entry.path, self.root), entry.stat()
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the tree. Returns parsed/reused/removed file counts."""
+        connection = self.connection
+        indexed = {row['path']: (row['mtime_ns'], row['size']) for row in connection.execute("SELECT path, mtime_ns, size FROM files")}
+        current = {}
+        changed = []
+        for relative_path, stat in self.iter_source_files():
+            current[relative_path] = (stat.st_mtime_ns, stat.st_size)
+            if indexed.get(relative_path) != current[relative_path]:
+                changed.append(relative_path)
+        removed = [path for path in indexed if path not in current]
+
+        absolute_paths = [os.path.join(self.root, path) for path in changed]
+        if len(changed) >= self.parallel_threshold:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(index_file, absolute_paths, chunksize=16)
+                self._store(connection, changed, removed, current, results)
+        else:
+            self._store(connection, changed, removed, current, map(index_file, absolute_paths))
+        return {'parsed': len(changed), 'reused': len(current) - len(changed), 'removed': len(removed)}
+
+    def _store(self, connection, changed, removed, current, results):
+        with connection:
+            for path in itertools.chain(removed, changed):
+                connection.execute("DELETE FROM definitions WHERE path = ?", (path,))
+                connection.execute("DELETE FROM symbol_references WHERE path = ?", (path,))
+                connection.execute("DELETE FROM files WHERE path = ?", (path,))
+            for relative_path, result in zip(changed, results):
+                mtime_ns, size = current[relative_path]
+                connection.execute("INSERT INTO files VALUES (?, ?, ?, ?)", (relative_path, mtime_ns, size, result['error']))
+                connection.executemany(
+                    "INSERT INTO definitions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (relative_path, d['name'], d['qualname'], d['kind'], d['parent'], d['lineno'], d['end_lineno'], d['command_name'])
+                        for d in result['definitions']
+                    ]
+                )
+                connection.executemany(
+                    "INSERT INTO symbol_references VALUES (?, ?, ?, ?, ?, ?)",
+                    [(relative_path, *reference) for reference in result['references']]
+                )
+
+    def find_definitions(self, name: str) -> List[Dict]:
+        """Definitions whose name, or click command name, is `name`."""
+        rows = self.connection.execute(
+            "SELECT * FROM definitions WHERE name = ? UNION SELECT * FROM definitions WHERE command_name = ? ORDER BY path, lineno",
+            (name, name)
+        )
+        return [dict(row) for row in rows]
+
+    def find_references(self, name: str, kinds=None) -> List[Dict]:
+        """Uses of `name`, one per enclosing statement."""
+        query = "SELECT * FROM symbol_references WHERE name = ?"
+        parameters = [name]
+        if kinds:
+            query += f" AND kind IN ({', '.join('?' * len(kinds))})"
+            parameters.extend(kinds)
+        references = []
+        seen = set()
+        for row in self.connection.execute(query + " ORDER BY path, lineno", parameters):
+            if (row['path'], row['lineno']) not in seen:
+                seen.add((row['path'], row['lineno']))
+                references.append(dict(row))
+        return references
+
+    def get_source(self, location: Dict) -> str:
+        """Source lines spanned by a definition or reference returned from this index."""
+        path = os.path.join(self.root, location['path'])
+        # linecache keeps the text it read first; a file edited since refresh() must be read again
+        linecache.checkcache(path)
+        return ''.join(linecache.getline(path, line) for line in range(location['lineno'], location['end_lineno'] + 1)).rstrip()
@@ -0,0 +1,58 @@
+# template_renderer.py
+
+import mmap
+import os
+import re
+import shutil
+
+from blitzkrieg.utils.file_utils import atomic_output
+
+class TemplateRenderer:
+    """Applies a set of literal substitutions to text or files in a single pass.
+
+    All rules are compiled into one alternation, longest pattern first, so overlapping rules
+    resolve to the most specific match and replacements are never re-scanned by later rules.
+    Rules that used to be applied one after another therefore need composite entries for the
+    chained result (see AlembicManager.model_import_rewrites).
+    """
+    # Files at least this large are scanned through mmap and written out in pieces
+    mmap_threshold = 8 * 1024 * 1024
+
+    def __init__(self, rules):
+        self.rules = dict(rules)
+        patterns = sorted((old for old in self.rules if old), key=len, reverse=True)
+        self._text_replacements = {old: str(new) for old, new in self.rules.items()}
+        self._bytes_replacements = {old.encode(): str(new).encode() for old, new in self.rules.items()}
+        self._text_pattern = re.compile('|'.join(re.escape(old) for old in patterns)) if patterns else None
+        self._bytes_pattern = re.compile(b'|'.join(re.escape(old.encode()) for old in patterns)) if patterns else None
+
+    def render(self, content):
+        if isinstance(content, bytes):
+            if not self._bytes_pattern:
+                return content
+            return self._bytes_pattern.sub(lambda match: self._bytes_replacements[match.group(0)], content)
+        if not self._text_pattern:
+            return content
+        return self._text_pattern.sub(lambda match: self._text_replacements[match.group(0)], content)
+
+    def render_file(self, source_path, destination_path=None):
+        """Render source_path into destination_path (in place when omitted) with one atomic write."""
+        destination_path = destination_path or source_path
+        is_new_file = not os.path.exists(destination_path)
+        size = os.path.getsize(source_path)
+
+        with open(source_path, 'rb') as source, atomic_output(destination_path, 'wb') as destination:
+            if size < self.mmap_threshold or not self._bytes_pattern:
+                destination.write(self.render(source.read()))
+            else:
+                with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    position = 0
+                    for match in self._bytes_pattern.finditer(mapped):
+                        destination.write(mapped[position:match.start()])
+                        destination.write(self._bytes_replacements[match.group(0)])
+                        position = match.end()
+                    destination.write(mapped[position:])
+
+        if is_new_file:
+            shutil.copymode(source_path, destination_path)
+        return destination_path
@@ -0,0 +1,64 @@
+import hashlib
+import os
+
+from blitzkrieg.alembic_manager import TEMPLATES_DIRECTORY
+from blitzkrieg.class_instances.docker_manager import docker_manager
+from blitzkrieg.file_writers.workspace_dockerfile_writer import WorkspaceDockerfileWriter
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.file_utils import atomic_write, file_lock
+
+class WorkerImageManager:
+    """Builds the alembic worker image once per host and shares it between workspaces.
+
+    The tag is derived from requirements.txt, the Python version and the Dockerfile, so an
+    existing tag is always safe to reuse and any change to those inputs yields a new image.
+    """
+    image_repository = 'blitzkrieg/alembic-worker'
+    python_version = '3.9'
+
+    def __init__(self, cache_directory: str = None):
+        self.docker_manager = docker_manager
+        self.console = console
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "worker-image")
+        self.requirements_txt_path = os.path.join(TEMPLATES_DIRECTORY, 'requirements.txt')
+        self._image_tag = None
+
+    def get_build_files(self):
+        with open(self.requirements_txt_path, 'r') as f:
+            requirements_txt = f.read()
+        return {
+            'Dockerfile': WorkspaceDockerfileWriter.get_dockerfile_content(self.python_version),
+            'requirements.txt': requirements_txt,
+        }
+
+    def get_content_hash(self):
+        digest = hashlib.sha256(self.python_version.encode())
+        for filename, content in sorted(self.get_build_files().items()):
+            digest.update(f"\0{filename}\0".encode())
+            digest.update(content.encode())
+        return digest.hexdigest()[:16]
+
+    def get_image_tag(self):
+        if self._image_tag is None:
+            self._image_tag = f"{self.image_repository}:{self.get_content_hash()}"
+        return self._image_tag
+
+    def ensure_image(self):
+        """Build the worker image unless an image with the current tag already exists."""
+        image_tag = self.get_image_tag()
+        if self.docker_manager.image_exists(image_tag):
+            self.console.handle_info(f"Reusing alembic worker image [white]{image_tag}[/white]")
+            return image_tag
+
+        content_hash = image_tag.rsplit(':', 1)[1]
+        context_path = os.path.join(self.cache_directory, content_hash)
+        # Workspaces created in parallel would otherwise all build the same image
+        with file_lock(os.path.join(self.cache_directory, f"{content_hash}.lock")):
+            if self.docker_manager.image_exists(image_tag):
+                return image_tag
+            for filename, content in self.get_build_files().items():
+                atomic_write(os.path.join(context_path, filename), content)
+            self.console.handle_wait(f"Building alembic worker image {image_tag}...")
+            self.docker_manager.build_image(context_path, image_tag, labels={'blitzkrieg.worker-image-hash': content_hash})
+            self.console.handle_success(f"Built alembic worker image [white]{image_tag}[/white]")
+        return image_tag
@@ -1,11 +1,22 @@
 # workspace_directory_manager.py
 
+import glob
 import os
+import shutil
 import subprocess
+import tempfile
+import uuid
+from typing import List, Tuple
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
 
+# Inserted into the name of a workspace directory that has been moved aside for deletion
+TRASH_MARKER = '.deleting-'
+
 class WorkspaceDirectoryManager:
+    # Seconds the background deletion may take before teardown stops waiting on it
+    background_delete_grace = 2
+
     def __init__(self, workspace_name: str = None, console_interface: ConsoleInterface = None):
         self.workspace_name = workspace_name
         self.console = console_interface if console_interface else ConsoleInterface()
@@ -16,12 +27,71 @@ class WorkspaceDirectoryManager:
         return self.delete_workspace_directory()
 
     def delete_workspace_directory(self):
+        """Move the workspace directory out of the way and delete it in a detached background process.
+
+        The deletion gets `background_delete_grace` seconds to finish in the foreground so its errors
+        can be reported; a larger tree keeps being deleted after blitz exits, and anything it cannot
+        remove is left as a `.<name>.deleting-*` directory that `blitz gc` sweeps.
+        """
         try:
-            subprocess.run(['rm', '-rf', self.workspace_path], check=True)
+            if not os.path.exists(self.workspace_path):
+                return self.console.handle_info(f"Workspace directory [white]{self.workspace_path}[/white] does not exist")
+            # A rename within the same parent is atomic, so the workspace name is free again immediately
+            parent_directory, directory_name = os.path.split(self.workspace_path)
+            trash_path = os.path.join(parent_directory, f".{directory_name}{TRASH_MARKER}{uuid.uuid4().hex[:8]}")
+            os.rename(self.workspace_path, trash_path)
+            # An unlinked file rather than a pipe: rm must not get SIGPIPE once blitz has exited
+            with tempfile.TemporaryFile('w+') as errors:
+                process = subprocess.Popen(
+                    ['rm', '-rf', trash_path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=errors,
+                    start_new_session=True
+                )
+                try:
+                    returncode = process.wait(timeout=self.background_delete_grace)
+                except subprocess.TimeoutExpired:
+                    return self.console.handle_success(
+                        f"Moved workspace directory [white]{self.workspace_path}[/white] aside; it is being deleted in the background"
+                    )
+                errors.seek(0)
+                error_output = errors.read().strip()
+            if returncode != 0:
+                # Typically root-owned files the workspace containers wrote into the bind mount
+                first_errors = '; '.join(error_output.splitlines()[:3])
+                return self.console.handle_error(
+                    f"Could not fully delete workspace directory, left at [white]{trash_path}[/white]: {first_errors}. "
+                    "Fix the permissions and run `blitz gc` to remove it."
+                )
             return self.console.handle_success(f"Deleted workspace directory at [white]{self.workspace_path}[/white]")
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             return self.console.handle_error(f"Failed to delete workspace directory: {str(e)}")
 
+    @staticmethod
+    def find_leftover_deletions(directory: str) -> List[str]:
+        """Workspace directories moved aside for deletion under directory that are still on disk."""
+        return sorted(glob.glob(os.path.join(os.path.abspath(directory), f".*{TRASH_MARKER}*")))
+
+    @classmethod
+    def remove_leftover_deletions(cls, directory: str, dry_run: bool = False) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Delete the leftovers under directory. Returns (removed paths, [(path, error)])."""
+        removed, failed = [], []
+        for path in cls.find_leftover_deletions(directory):
+            if dry_run:
+                removed.append(path)
+                continue
+            try:
+                shutil.rmtree(path)
+                removed.append(path)
+            except OSError as e:
+                # A background rm may still be working on it
+                if os.path.exists(path):
+                    failed.append((path, str(e)))
+                else:
+                    removed.append(path)
+        return removed, failed
+
     def create_dir(self, dir_path):
         os.makedirs(dir_path, exist_ok=True)
 
@@ -36,11 +106,12 @@ class WorkspaceDirectoryManager:
 
     def save_workspace_directory_details_to_env_file(self):
         try:
-            self.blitz_env_manager.set_workspace_env_var('WORKSPACE_PATH', self.workspace_path)
-            self.blitz_env_manager.set_workspace_env_var('IS_WORKSPACE', True)
-            self.blitz_env_manager.set_workspace_env_var('WORKSPACE_NAME', self.workspace_name)
-            self.blitz_env_manager.set_global_env_var("CURRENT_WORKSPACE", self.workspace_name)
-            self.blitz_env_manager.set_global_env_var("CURRENT_WORKSPACE_PATH", self.workspace_path)
+            with self.blitz_env_manager.batch():
+                self.blitz_env_manager.set_workspace_env_var('WORKSPACE_PATH', self.workspace_path)
+                self.blitz_env_manager.set_workspace_env_var('IS_WORKSPACE', True)
+                self.blitz_env_manager.set_workspace_env_var('WORKSPACE_NAME', self.workspace_name)
+                self.blitz_env_manager.set_global_env_var("CURRENT_WORKSPACE", self.workspace_name)
+                self.blitz_env_manager.set_global_env_var("CURRENT_WORKSPACE_PATH", self.workspace_path)
             return self.console.handle_success(f"Saved workspace directory details to .blitz.env file")
         except Exception as e:
             return self.console.handle_error(f"Failed to save workspace directory details to .blitz.env file: {str(e)}")
@@ -6,33 +6,26 @@ set -ex
 # Redirect stderr to stdout
 exec 2>&1
 
+# /app is the bind-mounted workspace: keep root-owned __pycache__ directories out of it
+export PYTHONDONTWRITEBYTECODE=1
+
 echo "Navigating to the application directory"
 cd /app
 
-echo "Listing contents of /app"
-ls -la /app
+# Restarts with unchanged models, revisions and init script have nothing to migrate
+echo "Comparing the schema fingerprint with the database..."
+if [ -f /app/migrations/env.py ] && python /app/blitz_migrations/schema_fingerprint.py check; then
+    echo "Schema is up to date; nothing to do"
+    exit 0
+fi
 
 echo "Creating sqlalchemy_models directory"
 mkdir -p /app/sqlalchemy_models
 
-echo "Initializing Alembic"
-alembic init migrations
-
-echo "Listing contents of /app after Alembic initialization"
-ls -la /app
-
-echo "Showing the contents of the migrations/env.py file"
-cat /app/migrations/env.py
-
-echo "Setting permissions for directories"
-chown -R 1000:1000 /app/migrations
-chmod -R 775 /app/migrations
-chown -R 1000:1000 /app
-chmod -R 775 /app
-
-
-echo "Listing contents of /app after setting permissions"
-ls -la /app
+if [ ! -f /app/migrations/env.py ]; then
+    echo "Initializing Alembic"
+    alembic init migrations
+fi
 
 echo "Updating alembic.ini with correct database URL"
 sed -i "s|^sqlalchemy.url = .*|sqlalchemy.url = postgresql+psycopg2://$*workspace_name*$-db-user:pw@$*workspace_name*$-postgres:5432/$*workspace_name*$|g" /app/alembic.ini
@@ -120,18 +113,34 @@ fi
 echo "Contents of /app/migrations/env.py:"
 cat /app/migrations/env.py
 
-echo "Running initial migration..."
-alembic revision --autogenerate -m "initial migration"
+if ! ls /app/migrations/versions/*.py > /dev/null 2>&1; then
+    echo "Running initial migration..."
+    alembic revision --autogenerate -m "initial migration"
+else
+    echo "Upgrading existing revisions before comparing the models..."
+    alembic upgrade head
+    # `alembic check` exits non-zero only when autogenerate would emit operations
+    if ! alembic check; then
+        echo "Models changed; generating a migration..."
+        alembic revision --autogenerate -m "model changes"
+    fi
+fi
 
 echo "Upgrading to head..."
 alembic upgrade head
 
-echo "Setting permissions for directories"
-chown -R 1000:1000 /app/migrations/__pycache__ || true
-chmod -R 775 /app/migrations/__pycache__ || true
-chown -R 1000:1000 /app/sqlalchemy_models/__pycache__ || true
-chmod -R 775 /app/sqlalchemy_models/__pycache__ || true
-chmod -R 1000:1000 /app/migrations/versions || true
-chmod -R 775 /app/migrations/versions || true
+echo "Installing the project_management index migration..."
+if ! grep -qs "revision = 'blitz_0001_indexes'" /app/migrations/versions/*.py; then
+    HEAD_REVISION=$(alembic heads | awk 'NR == 1 {print $1}')
+    sed "s|__DOWN_REVISION__|${HEAD_REVISION}|" /app/blitz_migrations/project_management_indexes.py \
+        > /app/migrations/versions/blitz_0001_project_management_indexes.py
+    alembic upgrade head
+fi
+
+echo "Recording the schema fingerprint..."
+python /app/blitz_migrations/schema_fingerprint.py store
+
+echo "Handing files created by this run to the workspace user"
+find /app/env.py /app/migrations ! -user 1000 -exec chown 1000:1000 {} + -exec chmod ug+rwX {} +
 
 echo "Script completed successfully"
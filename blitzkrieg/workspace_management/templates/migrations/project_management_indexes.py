@@ -0,0 +1,74 @@
+"""project_management indexes and unique constraints
+
+Installed into migrations/versions by alembic_init.sh on top of the autogenerated initial
+revision, with __DOWN_REVISION__ replaced by the head at that point. Every step checks the
+catalog first: new workspaces already get these objects from the autogenerated migration,
+older ones get them here. A unique constraint whose columns already hold duplicates is
+replaced by a plain index and reported instead of failing the upgrade.
+"""
+from alembic import op
+
+revision = 'blitz_0001_indexes'
+down_revision = '__DOWN_REVISION__' or None
+branch_labels = None
+depends_on = None
+
+SCHEMA = 'project_management'
+
+INDEXES = [
+    ('ix_project_parent_id', 'project', ['parent_id']),
+    ('ix_issue_project_id', 'issue', ['project_id']),
+    ('ix_project_created_at_id', 'project', ['created_at', 'id']),
+    ('ix_issue_created_at_id', 'issue', ['created_at', 'id']),
+    ('ix_feature_project_id', 'feature', ['project_id']),
+    ('ix_metric_project_id', 'metric', ['project_id']),
+    ('ix_cli_command_project_id', 'cli_command', ['project_id']),
+    ('ix_software_asset_project_id', 'software_asset', ['project_id']),
+]
+
+UNIQUE_CONSTRAINTS = [
+    ('uq_project_name', 'project', ['name']),
+    ('uq_workspace_name', 'workspace', ['name']),
+    ('uq_environment_variable_workspace_id_name', 'environment_variable', ['workspace_id', 'name']),
+]
+
+# Each step is a single DO block that checks the catalog itself, so the same SQL works online and
+# in an offline `alembic upgrade --sql` bundle, where there is no connection to inspect
+def create_index_sql(name, table, columns):
+    return f"""DO $$
+BEGIN
+    IF to_regclass('{SCHEMA}.{table}') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS {name} ON {SCHEMA}.{table} ({", ".join(columns)});
+    END IF;
+END $$"""
+
+def add_unique_constraint_sql(name, table, columns):
+    column_list = ", ".join(columns)
+    return f"""DO $$
+BEGIN
+    IF to_regclass('{SCHEMA}.{table}') IS NULL OR EXISTS (
+        SELECT 1 FROM pg_constraint c JOIN pg_namespace n ON n.oid = c.connamespace
+        WHERE n.nspname = '{SCHEMA}' AND c.conname = '{name}'
+    ) THEN
+        RETURN;
+    END IF;
+    IF EXISTS (SELECT 1 FROM {SCHEMA}.{table} GROUP BY {column_list} HAVING count(*) > 1) THEN
+        RAISE WARNING '{SCHEMA}.{table} has duplicate ({column_list}) rows; creating a plain index instead of {name}';
+        CREATE INDEX IF NOT EXISTS ix_{name[3:]} ON {SCHEMA}.{table} ({column_list});
+    ELSE
+        ALTER TABLE {SCHEMA}.{table} ADD CONSTRAINT {name} UNIQUE ({column_list});
+    END IF;
+END $$"""
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.execute(create_index_sql(name, table, columns))
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        op.execute(add_unique_constraint_sql(name, table, columns))
+
+def downgrade():
+    for name, table, columns in UNIQUE_CONSTRAINTS:
+        op.execute(f'ALTER TABLE IF EXISTS {SCHEMA}.{table} DROP CONSTRAINT IF EXISTS {name}')
+        op.execute(f'DROP INDEX IF EXISTS {SCHEMA}.ix_{name[3:]}')
+    for name, table, columns in INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {SCHEMA}.{name}')
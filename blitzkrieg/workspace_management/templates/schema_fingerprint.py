@@ -0,0 +1,130 @@
+"""Fingerprint of the workspace schema inputs, stored in the database it was applied to.
+
+Run by alembic_init.sh inside the alembic worker, from /app:
+
+    python blitz_migrations/schema_fingerprint.py check   # exit 0 when the database is up to date
+    python blitz_migrations/schema_fingerprint.py store   # record the current fingerprint
+
+The fingerprint covers the normalized SQLAlchemy metadata of sqlalchemy_models (tables, column
+types, nullability, defaults, keys, indexes and constraints, never file mtimes) plus the content of
+alembic_init.sh, blitz_migrations/ and migrations/versions/, so a new model column, an edited
+init script or a hand-written revision all count as a change. It is stored as the comment of the
+project_management schema, which Alembic autogenerate does not compare.
+"""
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+
+from sqlalchemy import CheckConstraint, ForeignKeyConstraint, UniqueConstraint, create_engine, text
+from sqlalchemy.dialects import postgresql
+
+SCHEMA = 'project_management'
+COMMENT_PREFIX = 'blitz-schema-fingerprint:'
+HASHED_FILES = ('alembic_init.sh', 'blitz_migrations/*.py', 'migrations/versions/*.py')
+
+def load_metadata():
+    # Same loading as env.py, so the fingerprint describes exactly what autogenerate compares
+    sys.path.append('.')
+    models_path = 'sqlalchemy_models'
+    for filename in sorted(os.listdir(models_path)):
+        if filename.endswith('.py') and filename != '__init__.py':
+            module_spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(models_path, filename))
+            module_spec.loader.exec_module(importlib.util.module_from_spec(module_spec))
+    from sqlalchemy_models.base import Base
+
+    return Base.metadata
+
+def compile_sql(element, dialect):
+    return str(element.compile(dialect=dialect)) if hasattr(element, 'compile') else str(element)
+
+def describe_column(column, dialect):
+    default = column.server_default
+    return {
+        'name': column.name,
+        'type': compile_sql(column.type, dialect),
+        'enums': list(getattr(column.type, 'enums', None) or []),
+        'nullable': column.nullable,
+        'primary_key': column.primary_key,
+        'server_default': compile_sql(default.arg, dialect) if default is not None and hasattr(default, 'arg') else None,
+        'foreign_keys': sorted(foreign_key.target_fullname for foreign_key in column.foreign_keys),
+    }
+
+def describe_table(table, dialect):
+    constraints = []
+    for constraint in table.constraints:
+        if isinstance(constraint, (UniqueConstraint, CheckConstraint, ForeignKeyConstraint)):
+            sql = compile_sql(constraint.sqltext, dialect) if isinstance(constraint, CheckConstraint) else None
+            constraints.append([type(constraint).__name__, str(constraint.name), sorted(c.name for c in constraint.columns), sql])
+    return {
+        'name': table.fullname,
+        # Column order is kept: it is the order of the generated CREATE TABLE
+        'columns': [describe_column(column, dialect) for column in table.columns],
+        'indexes': sorted(
+            [str(index.name), [compile_sql(expression, dialect) for expression in index.expressions], bool(index.unique)]
+            for index in table.indexes
+        ),
+        'constraints': sorted(constraints, key=json.dumps),
+    }
+
+def compute_fingerprint():
+    dialect = postgresql.dialect()
+    metadata = load_metadata()
+    files = {}
+    for pattern in HASHED_FILES:
+        for path in sorted(glob.glob(pattern)):
+            with open(path, 'rb') as f:
+                files[path] = hashlib.sha256(f.read()).hexdigest()
+    description = {
+        'tables': [describe_table(metadata.tables[name], dialect) for name in sorted(metadata.tables)],
+        'files': files,
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+def get_database_url():
+    from alembic.config import Config
+
+    return Config(os.environ.get('ALEMBIC_CONFIG', 'alembic.ini')).get_main_option('sqlalchemy.url')
+
+def get_stored_fingerprint(connection):
+    comment = connection.execute(text(
+        "SELECT obj_description(oid, 'pg_namespace') FROM pg_namespace WHERE nspname = :schema"
+    ), {'schema': SCHEMA}).scalar()
+    if comment and comment.startswith(COMMENT_PREFIX):
+        return comment[len(COMMENT_PREFIX):]
+    return None
+
+def check():
+    fingerprint = compute_fingerprint()
+    engine = create_engine(get_database_url())
+    try:
+        with engine.connect() as connection:
+            stored = get_stored_fingerprint(connection)
+            has_version = connection.execute(text("SELECT to_regclass('alembic_version')")).scalar() is not None
+    finally:
+        engine.dispose()
+    if stored == fingerprint and has_version:
+        print(f"Schema fingerprint {fingerprint[:12]} matches the database")
+        return 0
+    print(f"Schema fingerprint {fingerprint[:12]} differs from the database ({(stored or 'none')[:12]})")
+    return 1
+
+def store():
+    fingerprint = compute_fingerprint()
+    engine = create_engine(get_database_url())
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+            connection.execute(text(f"COMMENT ON SCHEMA {SCHEMA} IS '{COMMENT_PREFIX}{fingerprint}'"))
+    finally:
+        engine.dispose()
+    print(f"Stored schema fingerprint {fingerprint[:12]}")
+    return 0
+
+if __name__ == '__main__':
+    commands = {'check': check, 'store': store}
+    if len(sys.argv) != 2 or sys.argv[1] not in commands:
+        sys.exit(f"usage: {sys.argv[0]} check|store")
+    sys.exit(commands[sys.argv[1]]())
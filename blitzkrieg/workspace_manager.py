@@ -4,13 +4,14 @@ from prettytable import PrettyTable
 from blitzkrieg.alembic_manager import AlembicManager
 from blitzkrieg.class_instances.docker_manager import docker_manager
 from blitzkrieg.class_instances.blitz_env_manager import blitz_env_manager
-from blitzkrieg.file_manager import FileManager
+from blitzkrieg.docker_resource_index import workspace_labels
 from blitzkrieg.file_writers.workspace_docker_compose_writer import WorkspaceDockerComposeWriter
-from blitzkrieg.file_writers.workspace_dockerfile_writer import WorkspaceDockerfileWriter
 from blitzkrieg.workspace_directory_manager import WorkspaceDirectoryManager
+from blitzkrieg.workspace_skeleton_cache import WorkspaceSkeletonCache
+from blitzkrieg.worker_image_manager import WorkerImageManager
 from blitzkrieg.pgadmin_manager import PgAdminManager
 from blitzkrieg.postgres_manager import WorkspaceDbManager
-from blitzkrieg.utils.port_allocation import find_available_port
+from blitzkrieg.class_instances.port_allocator import port_allocator
 from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
 from blitzkrieg.ui_management.console_instance import console
 import os
@@ -25,15 +26,18 @@ class WorkspaceManager:
         self.workspace_name: str = workspace_name
         self.console: ConsoleInterface = console
         self.docker_manager = docker_manager
-        self.postgres_port: int = find_available_port(5432)
-        self.pgadmin_port: int = find_available_port(5050)
+        self.port_allocator = port_allocator
+        # Idempotent: an existing workspace gets its recorded ports back without probing
+        self.ports = self.port_allocator.reserve_workspace_ports(self.workspace_name)
+        self.postgres_port: int = self.ports['postgres']
+        self.pgadmin_port: int = self.ports['pgadmin']
         self.pgadmin_manager:PgAdminManager = PgAdminManager(
             postgres_port=self.postgres_port,
             pgadmin_port=self.pgadmin_port,
+            pgadmin_port_2=self.ports['pgadmin_tls'],
             workspace_name=self.workspace_name,
             console=self.console
         )
-        self.file_manager: FileManager = FileManager()
         self.workspace_db_manager: WorkspaceDbManager = WorkspaceDbManager(
             port=self.postgres_port,
             workspace_name=self.workspace_name
@@ -44,19 +48,19 @@ class WorkspaceManager:
         )
         self.workspace_db_manager.set_workspace_directory_manager(self.workspace_directory_manager)
         self.docker_network_name: str = f"{self.workspace_name}-network"
+        self.resource_labels = workspace_labels(self.workspace_name, self.workspace_directory_manager.workspace_path)
         self.cwd = os.getcwd()
         self.alembic_manager: AlembicManager = AlembicManager(
             db_manager=self.workspace_db_manager,
             workspace_name=self.workspace_name,
-            file_manager=self.file_manager,
             console=self.console
         )
         self.workspace_db_manager.set_alembic_manager(self.alembic_manager)
         self.workspace_db_manager.set_pgadmin_manager(self.pgadmin_manager)
-        self.workspace_dockerfile_writer = WorkspaceDockerfileWriter(workspace_path=self.workspace_directory_manager.workspace_path, console=self.console)
-        self.workspace_docker_compose_writer = WorkspaceDockerComposeWriter(workspace_name=self.workspace_name, workspace_path=self.workspace_directory_manager.workspace_path, console=self.console, pgadmin_manager=self.pgadmin_manager, postgres_manager=self.workspace_db_manager)
-        self.file_manager = FileManager()
-        self.workspace_docker_manager = WorkspaceDockerManager()
+        self.workspace_skeleton_cache = WorkspaceSkeletonCache(alembic_manager=self.alembic_manager, console=self.console)
+        self.worker_image_manager = WorkerImageManager()
+        self.workspace_docker_compose_writer = WorkspaceDockerComposeWriter(workspace_name=self.workspace_name, workspace_path=self.workspace_directory_manager.workspace_path, console=self.console, pgadmin_manager=self.pgadmin_manager, postgres_manager=self.workspace_db_manager, worker_image_manager=self.worker_image_manager)
+        self.workspace_docker_manager = WorkspaceDockerManager(worker_image_manager=self.worker_image_manager)
 
     def blitz_init(self):
         blitzkrieg_initialization_process = self.console.create_workflow("Blitzkrieg Initialization")
@@ -64,101 +68,83 @@ class WorkspaceManager:
         workspace_directory_initalization_group = self.console.create_phase(blitzkrieg_initialization_process, "Workspace Directory Initialization")
         workspace_docker_files_composition_group = self.console.create_phase(blitzkrieg_initialization_process, "Workspace Docker Files Composition")
         workspace_container_initialization = self.console.create_phase(blitzkrieg_initialization_process, "Workspace Container Initialization")
-        self.console.add_action(
+        # Independent steps declare their dependencies so the scheduler can overlap them; steps that
+        # write the same .blitz.env file share a resource name so they never interleave.
+        create_workspace_directory = self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Creating workspace directory...",
-            func=self.workspace_directory_manager.create_workspace_directory
+            func=self.workspace_directory_manager.create_workspace_directory,
+            depends_on=[],
+            critical=True
         )
 
-        self.console.add_action(
+        ensure_workspace_env_file = self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Creating workspace .blitz.env file",
-            func=self.blitz_env_manager.ensure_workspace_env_file
+            func=self.blitz_env_manager.ensure_workspace_env_file,
+            depends_on=[create_workspace_directory],
+            resources=['workspace_env']
         )
-        self.console.add_action(
+        ensure_global_env_file = self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Creating global .blitz.env file",
-            func=self.blitz_env_manager.ensure_global_env_file
+            func=self.blitz_env_manager.ensure_global_env_file,
+            depends_on=[],
+            resources=['global_env']
         )
 
-        self.console.add_action(
+        save_workspace_directory_details = self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Saving workspace directory details to workspace .blitz.env",
-            func=self.workspace_directory_manager.save_workspace_directory_details_to_env_file
+            func=self.workspace_directory_manager.save_workspace_directory_details_to_env_file,
+            depends_on=[ensure_workspace_env_file, ensure_global_env_file],
+            resources=['workspace_env', 'global_env']
         )
         self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Creating workspace docker network",
             func=self.docker_manager.create_docker_network,
-            network_name=self.docker_network_name
+            network_name=self.docker_network_name,
+            labels=self.resource_labels,
+            depends_on=[ensure_workspace_env_file],
+            resources=['workspace_env']
         )
 
         self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Storing workspace configuration in .env file...",
-            func=self.store_credentials
-        )
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            func=self.alembic_manager.create_sqlalchemy_models_directory,
-            name="Creating /sqlalchemy_models directory"
-        )
-
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            func=self.alembic_manager.copy_sqlalchemy_models,
-            name="Copying SQLAlchemy Models"
+            func=self.store_credentials,
+            depends_on=[save_workspace_directory_details],
+            resources=['workspace_env', 'global_env']
         )
-
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            func=self.alembic_manager.copy_requirements_txt,
-            name="Copying requirements.txt file"
-        )
-
+        # alembic.ini, env.py, alembic_init.sh, requirements.txt and the models are identical across
+        # workspaces apart from a few placeholders, so they come from a cached skeleton. The worker
+        # image is built from WorkerImageManager's own context, so no Dockerfile is written here.
         self.console.add_action(
             phase=workspace_directory_initalization_group,
-            func=self.alembic_manager.copy_alembic_init_script,
-            name="Copying Alembic Init Script"
-        )
-
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            name="Creating alembic.ini file to replace later...",
-            func=self.alembic_manager.create_alembic_ini_file
-        )
-
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            name="Creating alembic env file to copy into workspace directory...",
-            func=self.alembic_manager.update_alembic_env
-        )
-        self.console.add_action(
-            phase=workspace_directory_initalization_group,
-            name="Creating __init__.py files in workspace directory",
-            func=self.alembic_manager.create_init_files
+            name="Materializing workspace skeleton (alembic, models)...",
+            func=self.workspace_skeleton_cache.materialize,
+            depends_on=[create_workspace_directory],
+            resources=['global_env']
         )
         self.console.add_action(
             phase=workspace_directory_initalization_group,
             name="Creating servers.json file for pgadmin",
-            func=self.pgadmin_manager.create_server_config)
-
-        self.console.add_action(
-            phase=workspace_docker_files_composition_group,
-            name="Creating Dockerfile for workspace...",
-            func=self.workspace_dockerfile_writer.write_dockerfile
+            func=self.pgadmin_manager.create_server_config,
+            depends_on=[create_workspace_directory]
         )
 
-
         self.console.add_action(
             phase=workspace_docker_files_composition_group,
             name="Creating docker-compose.yml for workspace...",
-            func=self.workspace_docker_compose_writer.write_docker_compose_file
+            func=self.workspace_docker_compose_writer.write_docker_compose_file,
+            depends_on=[create_workspace_directory]
         )
 
+        # The container phase keeps the default ordering: it waits for every file above.
         self.console.add_action(
             phase=workspace_container_initialization,
-            name="Building workspace container...",
+            name="Ensuring shared alembic worker image...",
             func=self.workspace_docker_manager.build_workspace_container
         )
 
@@ -184,45 +170,68 @@ class WorkspaceManager:
         #     name="Removing workspace details from database",
         #     func=self.workspace_db_manager.remove_workspace_details
         # )
-        self.console.add_action(
+        # Containers are force-removed concurrently; volumes and the network only go once nothing
+        # attached to them is left, and the directory is moved aside and deleted in the background.
+        remove_postgres_container = self.console.add_action(
             phase=workspace_teardown_group,
             name="Removing Workspace Postgres Database...",
-            func=self.workspace_db_manager.teardown
+            func=self.workspace_db_manager.teardown,
+            depends_on=[]
         )
-        self.console.add_action(
+        remove_pgadmin_container = self.console.add_action(
             phase=workspace_teardown_group,
             name="Removing Workspace PgAdmin Container...",
             func=self.docker_manager.remove_container,
-            container_name=self.pgadmin_manager.container_name
+            container_name=self.pgadmin_manager.container_name,
+            depends_on=[]
         )
-
-        self.console.add_action(
+        remove_alembic_worker_container = self.console.add_action(
             phase=workspace_teardown_group,
             name="Removing Workspace Alembic Worker Container...",
             func=self.docker_manager.remove_container,
-            container_name=f"{self.workspace_name}-alembic-worker"
+            container_name=f"{self.workspace_name}-alembic-worker",
+            depends_on=[]
+        )
+        workspace_containers = [remove_postgres_container, remove_pgadmin_container, remove_alembic_worker_container]
+
+        self.console.add_action(
+            phase=workspace_teardown_group,
+            name="Removing Workspace Directory...",
+            func=self.workspace_directory_manager.teardown,
+            depends_on=[]
         )
 
         self.console.add_action(
             phase=workspace_teardown_group,
-            name="Removing All Docker Volumes...",
-            func=self.docker_manager.remove_all_volumes
+            name="Removing Workspace Docker Volumes...",
+            func=self.docker_manager.remove_workspace_volumes,
+            workspace_name=self.workspace_name,
+            depends_on=workspace_containers
         )
 
         self.console.add_action(
             phase=workspace_teardown_group,
             name="Removing Workspace Docker Network...",
             func=self.docker_manager.remove_docker_network,
-            network_name=self.docker_network_name
+            network_name=self.docker_network_name,
+            depends_on=workspace_containers
         )
 
+        # Ports stay reserved until the containers publishing them are gone
         self.console.add_action(
             phase=workspace_teardown_group,
-            name="Removing Workspace Directory...",
-            func=self.workspace_directory_manager.teardown
+            name="Releasing workspace port reservations...",
+            func=self.release_ports,
+            depends_on=workspace_containers
         )
 
-        self.console.run_workflow(teardown_workspace_process)
+        self.console.run_workflow(teardown_workspace_process, max_workers=len(workspace_containers) + 1)
+
+    def release_ports(self):
+        released = self.port_allocator.release_workspace_ports(self.workspace_name)
+        if released:
+            return self.console.handle_success(f"Released ports {', '.join(str(port) for port in released.values())}")
+        return self.console.handle_info(f"No port reservations found for workspace {self.workspace_name}")
 
     def save_workspace_details(self):
         self.workspace_db_manager.save_workspace_details()
@@ -246,8 +255,7 @@ class WorkspaceManager:
                 ("PGADMIN_BINDING_CONFIG_PATH", self.pgadmin_manager.pgadmin_binding_config_path)
             ]
 
-            for var, val in workspace_env_vars:
-                self.blitz_env_manager.set_workspace_env_var(var, val)
+            self.blitz_env_manager.update_workspace_env_vars(dict(workspace_env_vars))
         except Exception as e:
             self.console.handle_error(f"An error occurred while storing workspace credentials: {e}")
 
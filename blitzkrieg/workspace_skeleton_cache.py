@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from importlib import metadata
+
+from blitzkrieg.alembic_manager import AlembicManager
+from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
+from blitzkrieg.utils.file_utils import fast_copy
+from blitzkrieg.utils.template_renderer import TemplateRenderer
+
+MANIFEST_FILENAME = '.skeleton.json'
+
+class WorkspaceSkeletonCache:
+    """Content-addressed cache of the files every new workspace starts from.
+
+    The skeleton holds the workspace-independent artifacts (alembic.ini, env.py,
+    requirements.txt, alembic_init.sh, the SQLAlchemy models, the index migration and the schema
+    fingerprint script) with `$*name*$` placeholders left in. It lives under a directory named
+    after a hash of all its inputs, so editing a template, a model or upgrading the package simply
+    produces a new key.
+    """
+    # Number of skeleton builds kept around once a new one is created
+    keep_skeletons = 3
+
+    def __init__(self, alembic_manager: AlembicManager, console: ConsoleInterface, cache_directory: str = None):
+        self.alembic_manager = alembic_manager
+        self.console = console
+        self.cache_directory = cache_directory or os.path.join(os.path.expanduser("~"), ".blitzkrieg", "cache", "skeletons")
+
+    def get_skeleton_files(self):
+        """Return {relative path: (content, mode)} for everything the skeleton contains."""
+        with open(self.alembic_manager.alembic_init__template_path, 'r') as f:
+            alembic_init_script = f.read()
+        with open(self.alembic_manager.workspace_requirements_txt_template_path, 'r') as f:
+            requirements_txt = f.read()
+        with open(self.alembic_manager.index_migration_template_path, 'r') as f:
+            index_migration = f.read()
+        with open(self.alembic_manager.schema_fingerprint_template_path, 'r') as f:
+            schema_fingerprint = f.read()
+
+        files = {
+            '__init__.py': ('', 0o644),
+            'alembic.ini': (self.alembic_manager.get_alembic_init_content(), 0o644),
+            'env.py': (self.alembic_manager.get_new_env_py_content(sqlalchemy_uri='$*sqlalchemy_uri*$'), 0o644),
+            'requirements.txt': (requirements_txt, 0o644),
+            'alembic_init.sh': (alembic_init_script, 0o755),
+            os.path.join('sqlalchemy_models', '__init__.py'): ('', 0o644),
+            # Copied into migrations/versions by alembic_init.sh once the initial revision exists
+            os.path.join('blitz_migrations', 'project_management_indexes.py'): (index_migration, 0o644),
+            # Lets alembic_init.sh skip the migration cycle when the models have not changed
+            os.path.join('blitz_migrations', 'schema_fingerprint.py'): (schema_fingerprint, 0o644),
+        }
+        for filename, content in self.alembic_manager.get_model_sources().items():
+            files[os.path.join('sqlalchemy_models', filename)] = (content, 0o644)
+        return files
+
+    def get_skeleton_key(self, files):
+        digest = hashlib.sha256()
+        digest.update(self.get_package_version().encode())
+        for relative_path in sorted(files):
+            content, mode = files[relative_path]
+            digest.update(f"\0{relative_path}\0{mode:o}\0".encode())
+            digest.update(content.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_package_version():
+        try:
+            return metadata.version('blitzkrieg')
+        except metadata.PackageNotFoundError:
+            return 'unknown'
+
+    def ensure_skeleton(self):
+        """Return the path of the skeleton for the current inputs, building it if needed."""
+        files = self.get_skeleton_files()
+        skeleton_path = os.path.join(self.cache_directory, self.get_skeleton_key(files))
+        if os.path.exists(os.path.join(skeleton_path, MANIFEST_FILENAME)):
+            return skeleton_path
+
+        os.makedirs(self.cache_directory, exist_ok=True)
+        build_path = tempfile.mkdtemp(dir=self.cache_directory, prefix='.build-')
+        try:
+            overlay = []
+            for relative_path, (content, mode) in files.items():
+                file_path = os.path.join(build_path, relative_path)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, 'w') as f:
+                    f.write(content)
+                os.chmod(file_path, mode)
+                if '$*' in content:
+                    overlay.append(relative_path)
+            with open(os.path.join(build_path, MANIFEST_FILENAME), 'w') as f:
+                json.dump({'files': sorted(files), 'overlay': sorted(overlay)}, f, indent=4)
+            os.rename(build_path, skeleton_path)
+        except OSError:
+            shutil.rmtree(build_path, ignore_errors=True)
+            # Another process may have published the same key first; that copy is just as good
+            if not os.path.exists(os.path.join(skeleton_path, MANIFEST_FILENAME)):
+                raise
+        self.prune(keep=skeleton_path)
+        return skeleton_path
+
+    def prune(self, keep: str):
+        skeletons = []
+        for name in os.listdir(self.cache_directory):
+            skeleton_path = os.path.join(self.cache_directory, name)
+            try:
+                if not name.startswith('.'):
+                    skeletons.append((os.path.getmtime(skeleton_path), skeleton_path))
+            except OSError:
+                continue
+        skeletons.sort(reverse=True)
+        for _, skeleton_path in skeletons[self.keep_skeletons:]:
+            if skeleton_path != keep:
+                shutil.rmtree(skeleton_path, ignore_errors=True)
+
+    def get_overlay_values(self):
+        return {
+            '$*workspace_name*$': self.alembic_manager.workspace_name,
+            '$*postgres_port*$': str(self.alembic_manager.db_manager.db_port),
+            '$*sqlalchemy_uri*$': self.alembic_manager.db_manager.get_sqlalchemy_uri(),
+        }
+
+    def materialize(self, workspace_path: str = None):
+        """Copy the cached skeleton into the workspace and fill in the per-workspace placeholders."""
+        try:
+            workspace_path = workspace_path or self.alembic_manager.workspace_path
+            skeleton_path = self.ensure_skeleton()
+            with open(os.path.join(skeleton_path, MANIFEST_FILENAME), 'r') as f:
+                manifest = json.load(f)
+            overlay = set(manifest['overlay'])
+            renderer = TemplateRenderer(self.get_overlay_values())
+
+            for relative_path in manifest['files']:
+                source = os.path.join(skeleton_path, relative_path)
+                destination = os.path.join(workspace_path, relative_path)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                if relative_path in overlay:
+                    renderer.render_file(source, destination)
+                else:
+                    fast_copy(source, destination)
+            return self.console.handle_success(f"Materialized workspace skeleton [white]{os.path.basename(skeleton_path)[:12]}[/white] into [white]{workspace_path}[/white]")
+        except Exception as e:
+            return self.console.handle_error(f"Failed to materialize workspace skeleton: {str(e)}")
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import event
+
+from blitzkrieg.db.metadata_cache import MIRRORED_MODELS
+from blitzkrieg.project_management.db.connection import engine_registry
+from blitzkrieg.ui_management.output_mode import get_output_mode, set_copy_run_log, set_output_mode, should_copy_run_log
+
+
+@pytest.fixture(autouse=True)
+def quiet_output():
+    """Run every test in quiet mode with clipboard copies off, whatever BLITZ_COPY_LOG says."""
+    previous_mode, previous_copy = get_output_mode(), should_copy_run_log()
+    set_output_mode('quiet')
+    set_copy_run_log(False)
+    yield
+    set_output_mode(previous_mode)
+    set_copy_run_log(previous_copy)
+
+
+@pytest.fixture
+def sqlite_source(tmp_path):
+    """URL of a SQLite database standing in for the metadata database, with its tables in an
+    attached `project_management` schema so the models' schema-qualified queries run unchanged."""
+    url = f"sqlite:///{tmp_path / 'source.sqlite3'}"
+    engine = engine_registry.get_engine(url)
+
+    @event.listens_for(engine, 'connect')
+    def attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute(f"ATTACH DATABASE '{tmp_path / 'project_management.sqlite3'}' AS project_management")
+
+    for model in MIRRORED_MODELS:
+        model.__table__.create(engine)
+    yield url
+    engine.dispose()
@@ -0,0 +1,156 @@
+import threading
+import time
+
+import pytest
+
+from blitzkrieg.ui_management.ConsoleInterface import ConsoleInterface
+
+
+@pytest.fixture
+def console():
+    return ConsoleInterface()
+
+
+def run_workflow(console, setup, critical=True):
+    """Run `setup` ahead of an independent step and a later phase; returns (statuses, steps that ran)."""
+    ran = []
+    workflow = console.create_workflow('Test')
+    first_phase = console.create_phase(workflow, 'First')
+    second_phase = console.create_phase(workflow, 'Second')
+    console.add_action(first_phase, 'Setting up', setup, depends_on=[], critical=critical)
+    console.add_action(first_phase, 'Independent step', lambda: ran.append('independent'), depends_on=[])
+    console.add_action(second_phase, 'Later step', lambda: ran.append('later'))
+    # One worker, so the independent step only starts once the setup has finished
+    console.run_workflow(workflow, max_workers=1)
+    return {action.name: action.status for phase in workflow['phases'] for action in phase.actions}, ran
+
+
+def test_critical_action_reporting_an_error_cancels_the_rest(console):
+    statuses, ran = run_workflow(console, lambda: console.handle_error('Failed to create workspace directory'))
+
+    assert statuses == {'Setting up': 'failed', 'Independent step': 'cancelled', 'Later step': 'cancelled'}
+    assert ran == []
+    assert 'Completed Setting up' not in console.logger.get_output()
+
+
+def test_critical_action_raising_cancels_the_rest(console):
+    def setup():
+        raise OSError('Permission denied')
+
+    statuses, ran = run_workflow(console, setup)
+
+    assert statuses == {'Setting up': 'failed', 'Independent step': 'cancelled', 'Later step': 'cancelled'}
+    assert ran == []
+    assert 'An error has occurred while Setting up: Permission denied' in console.logger.get_output()
+
+
+def test_critical_action_reporting_success_lets_the_workflow_finish(console):
+    statuses, ran = run_workflow(console, lambda: console.handle_success('Created workspace directory'))
+
+    assert set(statuses.values()) == {'completed'}
+    assert ran == ['independent', 'later']
+
+
+def test_reported_errors_do_not_stop_non_critical_actions(console):
+    statuses, ran = run_workflow(console, lambda: console.handle_error('Container not found.'), critical=False)
+
+    assert set(statuses.values()) == {'completed'}
+    assert ran == ['independent', 'later']
+
+
+class Timeline:
+    """Records when each step runs, and the most steps holding each resource at once."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = {}
+        self.holders = {}
+        self.most_holders = {}
+
+    def step(self, name, resources=(), duration=0.05):
+        def run():
+            with self.lock:
+                started = time.perf_counter()
+                for resource in resources:
+                    self.holders[resource] = self.holders.get(resource, 0) + 1
+                    self.most_holders[resource] = max(self.most_holders.get(resource, 0), self.holders[resource])
+            time.sleep(duration)
+            with self.lock:
+                for resource in resources:
+                    self.holders[resource] -= 1
+                self.spans[name] = (started, time.perf_counter())
+        return run
+
+    def overlap(self, first, second):
+        return self.spans[first][0] < self.spans[second][1] and self.spans[second][0] < self.spans[first][1]
+
+
+def test_dependents_start_after_their_dependencies_finish(console):
+    timeline = Timeline()
+    workflow = console.create_workflow('Test')
+    phase = console.create_phase(workflow, 'First')
+    later_phase = console.create_phase(workflow, 'Second')
+    directory = console.add_action(phase, 'directory', timeline.step('directory'), depends_on=[])
+    console.add_action(phase, 'env file', timeline.step('env file'), depends_on=[directory])
+    console.add_action(phase, 'global env', timeline.step('global env', duration=0.15), depends_on=[])
+    console.add_action(phase, 'compose file', timeline.step('compose file'), depends_on=['directory', 'env file'])
+    # No depends_on: waits for every action of the earlier phase
+    console.add_action(later_phase, 'containers', timeline.step('containers'))
+
+    console.run_workflow(workflow)
+
+    spans = timeline.spans
+    assert spans['env file'][0] >= spans['directory'][1]
+    assert spans['compose file'][0] >= spans['env file'][1]
+    assert spans['containers'][0] >= max(end for name, (_, end) in spans.items() if name != 'containers')
+    # Independent actions still run side by side
+    assert timeline.overlap('global env', 'directory') and timeline.overlap('global env', 'env file')
+
+
+def test_actions_sharing_a_resource_never_overlap(console):
+    timeline = Timeline()
+    workflow = console.create_workflow('Test')
+    phase = console.create_phase(workflow, 'Env files')
+    for number in range(3):
+        console.add_action(phase, f"workspace env {number}", timeline.step(f"workspace env {number}", ['workspace_env']),
+                           depends_on=[], resources=['workspace_env'])
+    console.add_action(phase, 'both env files', timeline.step('both env files', ['workspace_env', 'global_env']),
+                       depends_on=[], resources=['workspace_env', 'global_env'])
+    console.add_action(phase, 'global env', timeline.step('global env', ['global_env']), depends_on=[], resources=['global_env'])
+
+    console.run_workflow(workflow)
+
+    assert {action.status for action in phase.actions} == {'completed'}
+    assert timeline.most_holders == {'workspace_env': 1, 'global_env': 1}
+    # Unrelated resources do not serialize each other
+    assert timeline.overlap('workspace env 0', 'global env')
+
+
+def test_dependents_of_a_failed_action_are_skipped(console):
+    def fail():
+        raise OSError('disk full')
+
+    ran = []
+    workflow = console.create_workflow('Test')
+    phase = console.create_phase(workflow, 'First')
+    broken = console.add_action(phase, 'broken', fail, depends_on=[])
+    console.add_action(phase, 'dependent', lambda: ran.append('dependent'), depends_on=[broken])
+    console.add_action(phase, 'unrelated', lambda: ran.append('unrelated'), depends_on=[])
+
+    console.run_workflow(workflow)
+
+    assert [action.status for action in phase.actions] == ['failed', 'skipped', 'completed']
+    assert ran == ['unrelated'] and phase.status == 'failed'
+
+
+def test_circular_and_unknown_dependencies_are_rejected(console):
+    workflow = console.create_workflow('Test')
+    phase = console.create_phase(workflow, 'First')
+    first = console.add_action(phase, 'first', lambda: None, depends_on=['second'])
+    console.add_action(phase, 'second', lambda: None, depends_on=[first])
+    with pytest.raises(RuntimeError, match='circular'):
+        console.run_workflow(workflow)
+
+    other = console.create_workflow('Other')
+    console.add_action(console.create_phase(other, 'First'), 'orphan', lambda: None, depends_on=['missing'])
+    with pytest.raises(ValueError, match="unknown action 'missing'"):
+        console.run_workflow(other)
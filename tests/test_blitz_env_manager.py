@@ -0,0 +1,104 @@
+import os
+import threading
+
+import pytest
+
+from blitzkrieg import blitz_env_manager
+from blitzkrieg.blitz_env_manager import EnvFileStore
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    path = tmp_path / '.blitz.env'
+    path.write_text("# Workspace configuration\nWORKSPACE_NAME=demo\nPOSTGRES_PORT=5432\n")
+    return path
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Counts the atomic renames the store makes."""
+    recorded = []
+    atomic_output = blitz_env_manager.atomic_output
+
+    def counting_atomic_output(path, *args, **kwargs):
+        recorded.append(path)
+        return atomic_output(path, *args, **kwargs)
+
+    monkeypatch.setattr(blitz_env_manager, 'atomic_output', counting_atomic_output)
+    return recorded
+
+
+def test_reads_are_served_from_memory_until_the_file_changes(env_file, monkeypatch):
+    store = EnvFileStore(str(env_file))
+    opened = []
+    monkeypatch.setattr(blitz_env_manager, 'open', lambda path, *args: opened.append(path) or open(path, *args), raising=False)
+
+    assert store.get('WORKSPACE_NAME') == 'demo'
+    assert store.get('POSTGRES_PORT') == '5432'
+    assert store.get('MISSING') is None
+    assert len(opened) == 1
+
+    # Another process rewrites the file; the new size and mtime invalidate the parsed copy
+    env_file.write_text("WORKSPACE_NAME=renamed\n")
+    os.utime(env_file, ns=(os.stat(env_file).st_atime_ns, os.stat(env_file).st_mtime_ns + 1_000_000))
+    assert store.get('WORKSPACE_NAME') == 'renamed'
+    assert store.get('POSTGRES_PORT') is None
+    assert len(opened) == 2
+
+
+def test_set_rewrites_keys_in_place_and_keeps_other_lines(env_file, writes):
+    store = EnvFileStore(str(env_file))
+
+    store.set('POSTGRES_PORT', 5433)
+    store.set('NETWORK_NAME', 'demo-network')
+
+    assert env_file.read_text() == "# Workspace configuration\nWORKSPACE_NAME=demo\nPOSTGRES_PORT=5433\nNETWORK_NAME=demo-network\n"
+    assert len(writes) == 2
+    # A second store over the same file sees the writes
+    assert EnvFileStore(str(env_file)).get('NETWORK_NAME') == 'demo-network'
+
+
+def test_a_batch_writes_once_on_exit(env_file, writes):
+    store = EnvFileStore(str(env_file))
+
+    with store.batch():
+        store.set('WORKSPACE_PATH', '/tmp/demo')
+        with store.batch():
+            store.update_many({'IS_WORKSPACE': True, 'WORKSPACE_NAME': 'demo2'})
+        assert writes == []
+        assert store.get('WORKSPACE_NAME') == 'demo2'
+        assert 'WORKSPACE_PATH' not in env_file.read_text()
+
+    assert len(writes) == 1
+    assert env_file.read_text().splitlines()[1:] == ['WORKSPACE_NAME=demo2', 'POSTGRES_PORT=5432', 'WORKSPACE_PATH=/tmp/demo', 'IS_WORKSPACE=True']
+
+
+def test_a_failing_batch_only_discards_its_own_thread_writes(env_file):
+    store = EnvFileStore(str(env_file))
+    in_batch = threading.Event()
+    other_thread_done = threading.Event()
+    seen_by_other_thread = []
+
+    def other_action():
+        in_batch.wait(5)
+        # What docker_manager does while another action holds a batch open
+        store.set('NETWORK_NAME', 'demo-network')
+        seen_by_other_thread.append(store.get('WORKSPACE_PATH'))
+        other_thread_done.set()
+
+    thread = threading.Thread(target=other_action)
+    thread.start()
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.set('WORKSPACE_PATH', '/tmp/demo')
+            in_batch.set()
+            assert other_thread_done.wait(5)
+            # Written straight away, not buffered into this thread's batch
+            assert 'NETWORK_NAME=demo-network' in env_file.read_text()
+            raise RuntimeError('saving workspace details failed')
+    thread.join(5)
+
+    assert seen_by_other_thread == [None]
+    assert store.get('NETWORK_NAME') == 'demo-network'
+    assert store.get('WORKSPACE_PATH') is None
+    assert 'WORKSPACE_PATH' not in env_file.read_text()
@@ -0,0 +1,141 @@
+import enum
+import os
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from blitzkrieg.db.bulk_writer import BulkWriter
+from blitzkrieg.db.models.issue import Issue
+from blitzkrieg.db.models.project import Project
+
+
+class Color(enum.Enum):
+    RED = 'red'
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class RecordingConnection:
+    """Compiles every statement for PostgreSQL and answers each with a single returned key."""
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+        return FakeResult([(uuid.uuid4(),)])
+
+
+class FakeSession:
+    def __init__(self):
+        self._connection = RecordingConnection()
+
+    def connection(self):
+        return self._connection
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, ''),
+    ('', '""'),
+    ('say "hi"', '"say ""hi"""'),
+    ('two\nlines, one comma', '"two\nlines, one comma"'),
+    (True, '"true"'),
+    (False, '"false"'),
+    (0, '"0"'),
+    (datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), '"2026-01-02T03:04:05+00:00"'),
+    (date(2026, 1, 2), '"2026-01-02"'),
+    (Color.RED, '"red"'),
+    (uuid.UUID(int=1), '"00000000-0000-0000-0000-000000000001"'),
+])
+def test_copy_value_quotes_everything_but_null(value, expected):
+    assert BulkWriter._copy_value(value) == expected
+
+
+def test_apply_defaults_fills_scalar_callable_and_uuid_key_defaults():
+    writer = BulkWriter(FakeSession())
+
+    project = writer._apply_defaults(Project.__table__, {'name': 'alpha'})
+    # Scalar default, and the callable default of the primary key
+    assert project['is_deployed'] is False and isinstance(project['id'], uuid.UUID)
+    # Issue.id has no default; a UUID primary key still gets one
+    assert isinstance(writer._apply_defaults(Issue.__table__, {'title': 'bug'})['id'], uuid.UUID)
+    # Given values win, and server defaults are left to the database
+    given = writer._apply_defaults(Project.__table__, {'id': uuid.UUID(int=7), 'is_deployed': True})
+    assert given['id'] == uuid.UUID(int=7) and given['is_deployed'] is True and 'created_at' not in given
+
+
+def test_instances_with_different_none_columns_are_grouped_apart():
+    writer = BulkWriter(FakeSession())
+    instances = [Project(name='a'), Project(name='b', github_repo='https://github.com/octo/b'), Project(name='c')]
+
+    rows = [writer._apply_defaults(Project.__table__, writer._to_row(instance)) for instance in instances]
+    groups = writer._group_by_keys(rows)
+
+    assert sorted(len(group) for group in groups.values()) == [1, 2]
+    assert all('github_repo' not in row for row in groups[tuple(sorted(rows[0]))])
+
+
+def test_insert_compiles_chunked_upserts_returning_the_keys():
+    session = FakeSession()
+    rows = [{'name': f"project-{number}", 'github_repo': None} for number in range(5)]
+
+    keys = BulkWriter(session, chunk_size=2).insert(Project, rows, conflict_columns=['name'], update_columns=['github_repo'])
+
+    statements = session.connection().statements
+    assert len(statements) == 3
+    assert len(keys) == 3 and all(isinstance(key, uuid.UUID) for key in keys)
+    assert [len([key for key in statement.params if key.startswith('name_m')]) for statement in statements] == [2, 2, 1]
+    sql = ' '.join(str(statements[0]).split())
+    assert sql.startswith('INSERT INTO project_management.project (')
+    assert 'ON CONFLICT (name) DO UPDATE SET github_repo = excluded.github_repo' in sql
+    assert sql.endswith('RETURNING project_management.project.id')
+
+
+def test_insert_skips_conflicts_without_update_columns():
+    session = FakeSession()
+
+    BulkWriter(session).insert(Project, [{'name': 'alpha'}], conflict_columns=['name'])
+    BulkWriter(session).insert(Project, [{'name': 'beta'}])
+
+    first, second = (' '.join(str(statement).split()) for statement in session.connection().statements)
+    assert 'ON CONFLICT (name) DO NOTHING' in first
+    assert 'ON CONFLICT DO NOTHING' in second
+
+
+@pytest.mark.skipif(not os.environ.get('BLITZ_TEST_DB_URL'), reason='set BLITZ_TEST_DB_URL to a PostgreSQL database')
+@pytest.mark.parametrize('copy_threshold', [0, 1000], ids=['copy', 'insert'])
+def test_round_trip_on_postgres(copy_threshold):
+    from blitzkrieg.project_management.db.connection import engine_registry
+
+    url = os.environ['BLITZ_TEST_DB_URL']
+    session = engine_registry.get_sessionmaker(url)()
+    try:
+        session.execute(text('CREATE SCHEMA IF NOT EXISTS project_management'))
+        Project.__table__.create(session.connection(), checkfirst=True)
+        rows = [
+            {'name': f"bulk-{uuid.uuid4().hex}", 'description': value, 'is_deployed': number % 2 == 0}
+            for number, value in enumerate(['', None, 'say "hi"', 'two\nlines, one comma', "it's"])
+        ]
+
+        keys = BulkWriter(session, copy_threshold=copy_threshold).insert(Project, rows)
+
+        stored = session.execute(
+            select(Project.name, Project.description, Project.is_deployed, Project.created_at).where(Project.id.in_(keys))
+        ).all()
+        assert sorted((row.name, row.description, row.is_deployed) for row in stored) == sorted(
+            (row['name'], row['description'], row['is_deployed']) for row in rows
+        )
+        assert all(row.created_at is not None for row in stored)
+        # Inserting the same names again only skips them
+        assert BulkWriter(session, copy_threshold=copy_threshold).insert(Project, [{'name': rows[0]['name']}], conflict_columns=['name']) == []
+    finally:
+        session.rollback()
+        session.close()
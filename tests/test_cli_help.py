@@ -0,0 +1,33 @@
+import textwrap
+
+import pytest
+
+from blitzkrieg.cli.lazy_group import LazyGroup, read_command_help
+from blitzkrieg.cli.main import main
+
+
+def test_registered_help_matches_the_command_docstrings():
+    assert main.find_stale_help() == []
+
+
+def test_reads_the_first_docstring_paragraph_without_importing(tmp_path, monkeypatch):
+    (tmp_path / 'fake_commands.py').write_text(textwrap.dedent('''
+        import module_that_does_not_exist
+
+        def other():
+            """Not this one."""
+
+        def greet():
+            """Say hello to someone
+            you know.
+
+            Details that --help only shows for the command itself.
+            """
+    '''))
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert read_command_help('fake_commands:greet') == 'Say hello to someone you know.'
+    group = LazyGroup(lazy_subcommands={'greet': ('fake_commands:greet', 'Say hello.')})
+    assert group.find_stale_help() == [('greet', 'Say hello.', 'Say hello to someone you know.')]
+    with pytest.raises(ValueError):
+        read_command_help('fake_commands:missing')
@@ -0,0 +1,114 @@
+import os
+import signal
+import time
+
+import pytest
+
+from blitzkrieg.ui_management.ConsoleInterface import CommandExecutor, CustomSpinner, Logger
+
+
+@pytest.fixture
+def executor():
+    spinner = CustomSpinner()
+    return CommandExecutor(Logger(renderer=spinner), spinner)
+
+
+def is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Reparented orphans may linger as zombies until init reaps them
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+def wait_for_file(path, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path) or not open(path).read().strip():
+        assert time.monotonic() < deadline, f"{path} was never written"
+        time.sleep(0.01)
+    return open(path).read().strip()
+
+
+def test_keeps_only_the_tail_of_each_stream(executor, tmp_path):
+    executor.tail_lines = 5
+    command = ['sh', '-c', 'for i in $(seq 1 1000); do echo "out $i"; echo "err $i" >&2; done']
+
+    result, timed_out = executor._run_streaming(command, str(tmp_path), 'Counting')
+
+    assert not timed_out
+    assert result.returncode == 0
+    assert result.stdout.splitlines() == [f"out {i}" for i in range(996, 1001)]
+    assert result.stderr.splitlines() == [f"err {i}" for i in range(996, 1001)]
+
+
+def test_filters_lines_as_they_arrive(executor, tmp_path):
+    executor.tail_lines = 3
+    marker = tmp_path / 'filtered'
+    seen = []
+
+    def line_filter(line):
+        seen.append(line)
+        # The command waits for this file, so the first line must be filtered before it exits
+        marker.touch()
+        return 'Created' in line
+
+    command = ['sh', '-c', f'echo "Created 0"; while [ ! -e {marker} ]; do sleep 0.01; done; '
+                           'for i in 1 2 3 4; do echo "Created $i"; echo "noise $i"; done; printf "progress\\rCreated 5\\n"']
+
+    result, timed_out = executor._run_streaming(command, str(tmp_path), 'Building', line_filter=line_filter)
+
+    assert not timed_out
+    assert seen[0] == 'Created 0'
+    assert 'noise 4' in seen and 'progress' in seen
+    assert result.stdout.splitlines() == ['Created 3', 'Created 4', 'Created 5']
+
+
+def test_docker_commands_keep_only_essential_lines(executor, tmp_path):
+    command = ['sh', '-c', 'echo "Step 1/3"; echo "Container web Created"; echo "layer 4f2a"; echo "Container web Started"']
+
+    result = executor.execute_docker_command(command, str(tmp_path))
+
+    assert result.stdout.splitlines() == ['Container web Created', 'Container web Started']
+
+
+def test_timeout_kills_the_whole_process_group(executor, tmp_path):
+    pid_file = tmp_path / 'child.pid'
+    command = ['sh', '-c', f'sleep 30 & echo $! > {pid_file}; echo started; wait']
+
+    started = time.monotonic()
+    result, timed_out = executor._run_streaming(command, str(tmp_path), 'Sleeping', timeout=0.5)
+
+    assert timed_out
+    assert time.monotonic() - started < executor.termination_grace_period
+    assert result.stdout == 'started'
+    child = int(wait_for_file(pid_file))
+    deadline = time.monotonic() + 5
+    while is_running(child) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not is_running(child)
+
+
+def test_timed_out_command_is_reported_as_failed(executor, tmp_path):
+    assert executor.execute_command(['sleep', '30'], str(tmp_path), timeout=0.2) is None
+
+
+def test_unsignallable_group_does_not_hang(executor, tmp_path, monkeypatch):
+    def killpg(pid, sig):
+        raise PermissionError(1, 'Operation not permitted')
+
+    monkeypatch.setattr(os, 'killpg', killpg)
+    executor.reader_join_timeout = 0.5
+    pid_file = tmp_path / 'child.pid'
+    # The grandchild outlives its parent and keeps the output pipes open
+    command = ['sh', '-c', f'sleep 30 & echo $! > {pid_file}; wait']
+
+    started = time.monotonic()
+    try:
+        result, timed_out = executor._run_streaming(command, str(tmp_path), 'Sleeping', timeout=0.5)
+        assert timed_out
+        assert result.returncode == -signal.SIGKILL
+        assert time.monotonic() - started < 5
+    finally:
+        monkeypatch.undo()
+        os.kill(int(wait_for_file(pid_file)), signal.SIGKILL)
@@ -0,0 +1,82 @@
+import os
+import shutil
+import stat
+
+import pytest
+from cookiecutter.main import cookiecutter
+
+from blitzkrieg.compiled_template_cache import CompiledTemplateCache
+from blitzkrieg.cookie_cutter_manager import CookieCutterManager
+from blitzkrieg.db.models.project import Project
+
+TEMPLATES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'blitzkrieg', 'templates')
+TEMPLATES = sorted(os.listdir(TEMPLATES_DIRECTORY))
+PROJECT_TYPES = {'poetry-cli-template': 'Python CLI', 'pyo3-rust-extension-template': 'Pyo3 Rust Extension'}
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    # cookiecutter reads ~/.cookiecutterrc and writes replay files under the home directory
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.delenv('COOKIECUTTER_CONFIG', raising=False)
+
+
+def snapshot(directory):
+    """{relative path: (mode, bytes or None for directories)} for everything under directory."""
+    tree = {}
+    for root, directories, files in os.walk(directory):
+        for name in directories + files:
+            path = os.path.join(root, name)
+            content = None
+            if name in files:
+                with open(path, 'rb') as f:
+                    content = f.read()
+            tree[os.path.relpath(path, directory)] = (stat.S_IMODE(os.stat(path).st_mode), content)
+    return tree
+
+
+def test_every_bundled_template_has_a_project_type():
+    assert set(TEMPLATES) == set(PROJECT_TYPES)
+
+
+@pytest.mark.parametrize('template_name', TEMPLATES)
+def test_compiled_render_is_identical_to_cookiecutter(template_name, tmp_path):
+    template_path = os.path.join(TEMPLATES_DIRECTORY, template_name)
+    project = Project(
+        name='Demo-Tool 2', project_type=PROJECT_TYPES[template_name],
+        short_description='Short "quoted" text', description='Line one\nline two',
+    )
+    context = CookieCutterManager().get_template_context(project)
+
+    expected = cookiecutter(template_path, no_input=True, extra_context=context, output_dir=str(tmp_path / 'cookiecutter'))
+    compiled = CompiledTemplateCache(cache_directory=str(tmp_path / 'cache')).get(template_path).render(context, str(tmp_path / 'compiled'))
+    # A second cache instance starts from the manifest and bytecode written by the first
+    cached = CompiledTemplateCache(cache_directory=str(tmp_path / 'cache')).get(template_path).render(context, str(tmp_path / 'cached'))
+
+    assert os.path.basename(compiled) == os.path.basename(cached) == os.path.basename(expected)
+    assert snapshot(expected)
+    assert snapshot(compiled) == snapshot(expected)
+    assert snapshot(cached) == snapshot(expected)
+
+
+def test_template_hash_changes_with_any_template_file(tmp_path):
+    template_path = str(tmp_path / 'template')
+    shutil.copytree(os.path.join(TEMPLATES_DIRECTORY, 'poetry-cli-template'), template_path)
+    cache = CompiledTemplateCache(cache_directory=str(tmp_path / 'cache'))
+    original = cache.get_template_hash(template_path)
+    readme = next(path for path in cache.iter_template_files(template_path) if not path.endswith('cookiecutter.json'))
+
+    assert cache.get_template_hash(template_path) == original
+
+    with open(readme, 'a') as f:
+        f.write('\nOne more line\n')
+    edited = cache.get_template_hash(template_path)
+    assert edited != original
+
+    os.chmod(readme, 0o755)
+    assert cache.get_template_hash(template_path) not in (original, edited)
+
+    compiled = cache.get(template_path)
+    with open(os.path.join(template_path, 'new_file.txt'), 'w') as f:
+        f.write('added')
+    assert cache.get(template_path) is not compiled
@@ -0,0 +1,170 @@
+import queue
+import threading
+import time
+
+import pytest
+from docker.errors import APIError, NotFound
+
+from blitzkrieg.docker_manager import DockerManager
+
+
+class FakeContainer:
+    def __init__(self, status='running', health='starting'):
+        self.attrs = {'State': {'Status': status}}
+        if health:
+            self.attrs['State']['Health'] = {'Status': health}
+
+
+class FakeEventStream:
+    """Blocks like the daemon's stream until an event is pushed or it is closed."""
+    def __init__(self):
+        self._events = queue.Queue()
+        self.closed = False
+
+    def push(self, event):
+        self._events.put(event)
+
+    def close(self):
+        self.closed = True
+        self._events.put(None)
+
+    def __iter__(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            yield event
+
+
+class FakeContainers:
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, name):
+        self.client.inspections += 1
+        if name not in self.client.states:
+            raise NotFound(f"No such container: {name}")
+        return self.client.states[name]
+
+
+class FakeClient:
+    def __init__(self, events_error=None):
+        self.states = {}
+        self.inspections = 0
+        self.stream = FakeEventStream()
+        self.events_error = events_error
+        self.events_filters = None
+        self.containers = FakeContainers(self)
+
+    def events(self, decode, since, until, filters):
+        if self.events_error:
+            raise self.events_error
+        self.events_filters = filters
+        return self.stream
+
+    def become_healthy(self, name):
+        self.states[name] = FakeContainer(health='healthy')
+        self.stream.push({'Type': 'container', 'Action': 'health_status: healthy', 'Actor': {'Attributes': {'name': name}}})
+        return time.perf_counter()
+
+
+@pytest.fixture
+def manager():
+    return DockerManager()
+
+
+def call_later(delay, function, *args):
+    result = {}
+
+    def run():
+        time.sleep(delay)
+        result['value'] = function(*args)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, result
+
+
+def test_reports_readiness_within_milliseconds_of_the_health_event(manager):
+    client = manager.client = FakeClient()
+    client.states['workspace-postgres'] = FakeContainer(health='starting')
+    thread, health_event = call_later(0.3, client.become_healthy, 'workspace-postgres')
+
+    attrs = manager.wait_for_container('workspace-postgres', timeout=5)
+    returned_at = time.perf_counter()
+    thread.join()
+
+    assert attrs['State']['Health']['Status'] == 'healthy'
+    assert returned_at - health_event['value'] < 0.05
+    assert client.events_filters == {'type': 'container', 'container': ['workspace-postgres']}
+    assert client.stream.closed
+
+
+def test_waits_for_several_containers_at_once(manager):
+    client = manager.client = FakeClient()
+    client.states['workspace-postgres'] = FakeContainer(health='starting')
+    # No healthcheck: running is ready, without waiting for an event
+    client.states['workspace-pgadmin'] = FakeContainer(health=None)
+    thread, _ = call_later(0.1, client.become_healthy, 'workspace-postgres')
+
+    started = time.perf_counter()
+    ready = manager.wait_for_containers(['workspace-postgres', 'workspace-pgadmin'], timeout=5)
+    thread.join()
+
+    assert set(ready) == {'workspace-postgres', 'workspace-pgadmin'}
+    assert all(attrs is not None for attrs in ready.values())
+    assert time.perf_counter() - started < 1
+
+
+def test_ignores_events_of_other_containers_and_states(manager):
+    client = manager.client = FakeClient()
+    client.states['workspace-postgres'] = FakeContainer(health='starting')
+    client.stream.push({'Action': 'health_status: healthy', 'Actor': {'Attributes': {'name': 'other'}}})
+    client.stream.push({'Action': 'exec_start: pg_isready', 'Actor': {'Attributes': {'name': 'workspace-postgres'}}})
+    thread, _ = call_later(0.1, client.become_healthy, 'workspace-postgres')
+
+    assert manager.wait_for_container('workspace-postgres', timeout=5) is not None
+    thread.join()
+    # One inspection up front and one for the health event; the other events are skipped
+    assert client.inspections == 2
+
+
+def test_gives_up_at_the_deadline_on_a_silent_stream(manager):
+    client = manager.client = FakeClient()
+    client.states['workspace-postgres'] = FakeContainer(health='starting')
+
+    started = time.perf_counter()
+    assert manager.wait_for_containers(['workspace-postgres'], timeout=0.3) == {'workspace-postgres': None}
+    assert 0.3 <= time.perf_counter() - started < 1
+
+
+def test_reports_unhealthy_containers_without_waiting_for_the_deadline(manager):
+    client = manager.client = FakeClient()
+    client.states['workspace-postgres'] = FakeContainer(status='exited', health=None)
+
+    started = time.perf_counter()
+    assert manager.wait_for_container('workspace-postgres', timeout=5) is None
+    assert time.perf_counter() - started < 0.5
+
+
+def test_falls_back_to_polling_without_an_events_stream(manager):
+    client = manager.client = FakeClient(events_error=APIError('events unsupported'))
+    manager.container_poll_interval = 0.01
+    thread, health_event = call_later(0.2, client.become_healthy, 'workspace-postgres')
+
+    attrs = manager.wait_for_container('workspace-postgres', timeout=5)
+    returned_at = time.perf_counter()
+    thread.join()
+
+    assert attrs['State']['Health']['Status'] == 'healthy'
+    assert returned_at - health_event['value'] < 0.1
+    assert client.inspections > 1
+
+
+def test_polling_gives_up_at_the_deadline(manager):
+    manager.client = FakeClient(events_error=APIError('events unsupported'))
+    manager.container_poll_interval = 0.01
+
+    started = time.perf_counter()
+    assert manager.wait_for_container('workspace-postgres', timeout=0.2) is None
+    assert 0.2 <= time.perf_counter() - started < 1
@@ -0,0 +1,126 @@
+import importlib.util
+import subprocess
+
+import pytest
+
+from blitzkrieg.utils.git_backend import DEFAULT_BRANCH, GitError, GitRepository, open_repository
+
+BACKENDS = [
+    'cli',
+    pytest.param('dulwich', marks=pytest.mark.skipif(importlib.util.find_spec('dulwich') is None, reason='dulwich is not installed')),
+]
+
+
+@pytest.fixture(autouse=True)
+def git_identity(tmp_path, monkeypatch):
+    # Keep the user's global git config out of the tests
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    for kind in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{kind}_NAME', 'Blitz Test')
+        monkeypatch.setenv(f'GIT_{kind}_EMAIL', 'blitz@example.com')
+
+
+def git(directory, *args):
+    return subprocess.run(['git', *args], cwd=directory, check=True, text=True, capture_output=True).stdout.strip()
+
+
+@pytest.fixture
+def remote(tmp_path):
+    path = tmp_path / 'remote.git'
+    subprocess.run(['git', 'init', '--bare', '--quiet', str(path)], check=True)
+    return path
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_init_commit_tag_and_push_to_a_bare_remote(backend, tmp_path, remote):
+    work = tmp_path / 'project'
+    repository = open_repository(str(work), backend=backend)
+    assert repository.backend == backend
+
+    repository.init()
+    assert repository.current_branch() == 'master'
+    write(work / '.gitignore', '*.log\nbuild/\n')
+    write(work / 'README.md', '# project\n')
+    write(work / 'src' / 'app.py', 'print("hello")\n')
+    write(work / 'debug.log', 'ignored\n')
+    write(work / 'build' / 'artifact.txt', 'ignored\n')
+
+    repository.add()
+    first = repository.commit('Initial commit')
+    repository.tag('v0.1.0')
+    repository.set_remote('origin', str(remote))
+    repository.push('origin', 'master', tags=['v0.1.0'], set_upstream=True)
+
+    assert git(remote, 'rev-parse', 'refs/heads/master') == first
+    assert git(remote, 'rev-parse', 'refs/tags/v0.1.0^{commit}') == first
+    assert git(remote, 'ls-tree', '-r', '--name-only', 'master').splitlines() == ['.gitignore', 'README.md', 'src/app.py']
+    assert git(work, 'config', 'branch.master.remote') == 'origin'
+    assert git(work, 'config', 'branch.master.merge') == 'refs/heads/master'
+    assert git(work, 'rev-parse', 'refs/remotes/origin/master') == first
+
+    write(work / 'README.md', '# project\n\nNow with docs.\n')
+    write(work / 'docs' / 'guide.md', 'Guide\n')
+    repository.add(['README.md', 'docs/guide.md'])
+    second = repository.commit('Add a guide')
+    repository.push()
+
+    assert second != first
+    assert git(remote, 'rev-parse', 'refs/heads/master') == second
+    assert git(remote, 'rev-parse', 'master~1') == first
+    assert git(remote, 'show', 'master:docs/guide.md') == 'Guide'
+    assert git(work, 'status', '--porcelain') == ''
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_set_remote_replaces_an_existing_url(backend, tmp_path, remote):
+    work = tmp_path / 'project'
+    repository = open_repository(str(work), backend=backend)
+    repository.init()
+    repository.set_remote('origin', str(tmp_path / 'elsewhere.git'))
+    repository.set_remote('origin', str(remote))
+
+    assert git(work, 'remote', 'get-url', 'origin') == str(remote)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_init_keeps_an_existing_repository(backend, tmp_path):
+    work = tmp_path / 'project'
+    repository = open_repository(str(work), backend=backend)
+    repository.init()
+    write(work / 'README.md', '# project\n')
+    repository.add()
+    first = repository.commit('Initial commit')
+
+    reopened = open_repository(str(work), backend=backend)
+    reopened.init()
+
+    assert git(work, 'rev-parse', 'HEAD') == first
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_push_failures_raise_git_error(backend, tmp_path):
+    work = tmp_path / 'project'
+    repository = open_repository(str(work), backend=backend)
+    repository.init()
+    write(work / 'README.md', '# project\n')
+    repository.add()
+    repository.commit('Initial commit')
+    repository.set_remote('origin', str(tmp_path / 'missing.git'))
+
+    with pytest.raises(GitError):
+        repository.push()
+
+
+def test_an_incomplete_backend_fails_when_constructed(tmp_path):
+    class HalfBackend(GitRepository):
+        def init(self, initial_branch=DEFAULT_BRANCH):
+            pass
+
+    with pytest.raises(TypeError, match='push'):
+        HalfBackend(str(tmp_path))
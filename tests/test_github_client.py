@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blitzkrieg.utils import github_utils
+from blitzkrieg.utils.github_utils import GitHubAPIError, GitHubClient
+
+
+class StubGitHub(ThreadingHTTPServer):
+    """Serves scripted responses: routes map (method, path) to a list consumed one response per request."""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.routes = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def respond(self, method, path, *responses):
+        self.routes[(method, path)] = list(responses)
+
+    def next_response(self, method, path):
+        with self.lock:
+            responses = self.routes.get((method, path))
+            if not responses:
+                return (404, {}, {'message': 'Not Found'})
+            return responses.pop(0) if len(responses) > 1 else responses[0]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def handle_one(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        with self.server.lock:
+            self.server.requests.append({'method': method, 'path': self.path, 'headers': dict(self.headers), 'body': body})
+        response = self.server.next_response(method, self.path)
+        if callable(response):
+            response = response(self)
+        status, headers, payload = response
+        data = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.handle_one('GET')
+
+    def do_POST(self):
+        self.handle_one('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = StubGitHub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub, tmp_path):
+    client = GitHubClient(token='test-token', base_url=stub.base_url, cache_directory=str(tmp_path / 'cache'))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(github_utils.time, 'sleep', recorded.append)
+    return recorded
+
+
+def test_revalidates_cached_responses_with_the_etag(stub, client):
+    def repository(handler):
+        if handler.headers.get('If-None-Match') == '"v1"':
+            return (304, {'ETag': '"v1"'}, None)
+        return (200, {'ETag': '"v1"'}, {'name': 'blitzkrieg', 'stars': 1})
+    stub.respond('GET', '/repos/octo/blitzkrieg', repository)
+
+    first = client.get('/repos/octo/blitzkrieg')
+    second = client.get('/repos/octo/blitzkrieg')
+
+    assert first == second == {'name': 'blitzkrieg', 'stars': 1}
+    assert [request['headers'].get('If-None-Match') for request in stub.requests] == [None, '"v1"']
+    assert stub.requests[0]['headers']['Authorization'] == 'token test-token'
+
+
+def test_etag_cache_is_kept_per_token(stub, client, tmp_path):
+    stub.respond('GET', '/user', (200, {'ETag': '"me"'}, {'login': 'octo'}))
+    client.get('/user')
+    other = GitHubClient(token='other-token', base_url=stub.base_url, cache_directory=str(tmp_path / 'cache'))
+    try:
+        other.get('/user')
+    finally:
+        other.close()
+
+    assert [request['headers'].get('If-None-Match') for request in stub.requests] == [None, None]
+
+
+def test_retries_an_exhausted_rate_limit_after_the_reset(stub, client, sleeps):
+    reset = int(time.time()) + 30
+    stub.respond(
+        'GET', '/user/repos',
+        (403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)}, {'message': 'API rate limit exceeded'}),
+        (200, {}, [{'name': 'blitzkrieg'}]),
+    )
+
+    assert client.get('/user/repos') == [{'name': 'blitzkrieg'}]
+    assert len(stub.requests) == 2
+    assert len(sleeps) == 1 and 29 <= sleeps[0] <= 31
+
+
+def test_fails_right_away_when_the_reset_is_beyond_the_backoff_cap(stub, client, sleeps):
+    reset = int(time.time()) + 3600
+    stub.respond(
+        'GET', '/user/repos',
+        (403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)}, {'message': 'API rate limit exceeded'}),
+    )
+
+    with pytest.raises(GitHubAPIError) as error:
+        client.get('/user/repos')
+    assert error.value.retry_at == reset + 1
+    assert 'rate limited until' in str(error.value)
+    assert len(stub.requests) == 1 and sleeps == []
+
+
+def test_fails_right_away_when_retry_after_is_beyond_the_backoff_cap(stub, client, sleeps):
+    stub.respond('GET', '/search/code', (429, {'Retry-After': '600'}, {'message': 'secondary rate limit'}))
+
+    with pytest.raises(GitHubAPIError) as error:
+        client.get('/search/code')
+    assert error.value.retry_at > time.time() + 500
+    assert len(stub.requests) == 1 and sleeps == []
+
+
+def test_does_not_retry_a_plain_permission_error(stub, client, sleeps):
+    stub.respond('GET', '/orgs/private', (403, {'X-RateLimit-Remaining': '4999'}, {'message': 'Forbidden'}))
+
+    with pytest.raises(GitHubAPIError) as error:
+        client.get('/orgs/private')
+    assert error.value.status_code == 403
+    assert len(stub.requests) == 1 and sleeps == []
+
+
+def test_ignores_retry_after_on_success(stub, client, sleeps):
+    stub.respond('POST', '/user/repos', (201, {'Retry-After': '30'}, {'html_url': 'https://github.com/octo/new'}))
+
+    assert client.post('/user/repos', {'name': 'new'}) == {'html_url': 'https://github.com/octo/new'}
+    assert len(stub.requests) == 1 and sleeps == []
+
+
+def test_retries_server_errors_only_for_idempotent_methods(stub, client, sleeps):
+    stub.respond('GET', '/repos/octo/blitzkrieg', (502, {}, None), (200, {}, {'name': 'blitzkrieg'}))
+    stub.respond('POST', '/user/repos', (502, {}, None), (201, {}, {'html_url': 'https://github.com/octo/new'}))
+
+    assert client.get('/repos/octo/blitzkrieg') == {'name': 'blitzkrieg'}
+    response = client.request('POST', '/user/repos', json={'name': 'new'})
+
+    assert response.status_code == 502
+    assert [request['method'] for request in stub.requests] == ['GET', 'GET', 'POST']
+    assert len(sleeps) == 1
+
+
+def test_get_many_keeps_the_input_order(stub, client):
+    count = 8
+
+    def item(number):
+        def respond(handler):
+            # Later items answer first
+            time.sleep((count - number) * 0.02)
+            return (200, {}, {'number': number})
+        return respond
+
+    for number in range(count):
+        stub.respond('GET', f'/items/{number}', item(number))
+
+    started = time.perf_counter()
+    results = client.get_many([f'/items/{number}' for number in range(count)], max_workers=count)
+
+    assert results == [{'number': number} for number in range(count)]
+    # Fetched concurrently: well under the 0.72 s the delays add up to
+    assert time.perf_counter() - started < 0.5
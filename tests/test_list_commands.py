@@ -0,0 +1,25 @@
+import pytest
+from click.testing import CliRunner
+
+from blitzkrieg.cli.commands import cache, listing
+from blitzkrieg.cli.main import main
+
+
+def unreachable(workspace_name=None):
+    raise ConnectionError('could not connect to server')
+
+
+@pytest.mark.parametrize('arguments, module', [
+    (['list', 'projects'], listing),
+    (['list', 'issues', '--project', 'blitz'], listing),
+    (['cache', 'refresh'], cache),
+    (['cache', 'status'], cache),
+])
+@pytest.mark.parametrize('output', [['-q'], ['--output', 'json']])
+def test_failures_exit_non_zero(arguments, module, output, monkeypatch):
+    monkeypatch.setattr(module, 'get_workspace_db_url', unreachable)
+
+    result = CliRunner().invoke(main, output + arguments)
+
+    assert result.exit_code == 1
+    assert 'could not connect to server' in result.output
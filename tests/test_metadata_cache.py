@@ -0,0 +1,133 @@
+import os
+import stat
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+
+from blitzkrieg.cli.commands import listing
+from blitzkrieg.db import metadata_cache
+from blitzkrieg.db.metadata_cache import LocalMetadataCache, sync_state, write_through
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.project_management.db.connection import engine_registry
+
+START = datetime(2026, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def source(sqlite_source):
+    """Five projects created a day apart."""
+    rows = [{'id': uuid.uuid4(), 'name': f"project-{day}", 'created_at': START + timedelta(days=day)} for day in range(5)]
+    with engine_registry.connect(sqlite_source) as connection:
+        connection.execute(insert(Project), rows)
+        connection.commit()
+    return sqlite_source, rows
+
+
+@pytest.fixture
+def cache(source, tmp_path):
+    return LocalMetadataCache(source[0], cache_directory=str(tmp_path / 'cache'))
+
+
+@pytest.fixture
+def shared_caches(tmp_path, monkeypatch):
+    """Point get_metadata_cache() and write_through() at a fresh cache under tmp_path."""
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setattr(metadata_cache, '_caches', {})
+
+
+def execute(url, statement):
+    with engine_registry.connect(url) as connection:
+        connection.execute(statement)
+        connection.commit()
+
+
+def cached_names(cache):
+    with cache.connect() as connection:
+        return connection.execute(select(Project.name).order_by(Project.created_at)).scalars().all()
+
+
+def test_first_refresh_copies_every_row(cache, source):
+    counts = cache.refresh()
+
+    assert counts == {'workspace': 0, 'environment_variable': 0, 'project': 5, 'issue': 0}
+    assert cached_names(cache) == [f"project-{day}" for day in range(5)]
+    state = cache.get_sync_state()
+    assert state['project']['high_water'] == (START + timedelta(days=4)).isoformat()
+    assert cache.is_populated('project') and cache.is_populated('issue')
+
+
+def test_incremental_refresh_picks_up_updated_rows(cache, source):
+    url, rows = source
+    cache.refresh()
+    execute(url, update(Project).where(Project.id == rows[1]['id']).values(name='renamed', updated_at=START + timedelta(days=10)))
+
+    counts = cache.refresh()
+
+    # The updated row, plus the newest row again because it falls inside the overlap window
+    assert counts['project'] == 2
+    assert cached_names(cache) == ['project-0', 'renamed', 'project-2', 'project-3', 'project-4']
+    assert cache.get_sync_state()['project']['high_water'] == (START + timedelta(days=10)).isoformat()
+
+
+def test_overlap_catches_rows_committed_below_the_high_water(cache, source):
+    url, _ = source
+    cache.refresh()
+    late = {'id': uuid.uuid4(), 'name': 'late', 'created_at': START + timedelta(days=4) - timedelta(minutes=1)}
+    execute(url, insert(Project).values(**late))
+
+    cache.refresh()
+
+    assert 'late' in cached_names(cache)
+
+
+def test_deleted_rows_are_dropped_by_full_and_incremental_refreshes(cache, source):
+    url, rows = source
+    cache.refresh()
+    execute(url, delete(Project).where(Project.id == rows[0]['id']))
+
+    cache.refresh(full=True)
+    assert cached_names(cache) == [f"project-{day}" for day in range(1, 5)]
+
+    execute(url, delete(Project).where(Project.id == rows[1]['id']))
+    cache.refresh()
+    assert cached_names(cache) == [f"project-{day}" for day in range(2, 5)]
+
+
+def test_write_through_mirrors_a_new_row_without_moving_the_high_water(source, shared_caches):
+    url, _ = source
+    cache = metadata_cache.get_metadata_cache(url)
+    cache.refresh()
+    high_water = cache.get_sync_state()['project']['high_water']
+    new_id = uuid.uuid4()
+    execute(url, insert(Project).values(id=new_id, name='new', created_at=START + timedelta(days=30)))
+
+    write_through(url, Project, Project.id == new_id)
+
+    assert cached_names(cache)[-1] == 'new'
+    assert cache.get_sync_state()['project']['high_water'] == high_water
+
+
+def test_write_through_never_raises(shared_caches):
+    write_through('postgresql+psycopg2://user:pw@127.0.0.1:1/missing', Project, Project.id == uuid.uuid4())
+
+
+def test_cache_file_is_private(cache, source):
+    cache.refresh()
+
+    assert stat.S_IMODE(os.stat(cache.cache_path).st_mode) == 0o600
+
+
+def test_listing_refreshes_a_cache_older_than_max_age(source, shared_caches):
+    url, rows = source
+    cache = listing.get_cache(url, 'project')
+    execute(url, update(Project).where(Project.id == rows[2]['id']).values(name='renamed', updated_at=START + timedelta(days=10)))
+
+    assert listing.get_cache(url, 'project', max_age=60) is cache
+    assert 'renamed' not in cached_names(cache)
+
+    with cache.get_engine().begin() as connection:
+        connection.execute(update(sync_state).values(refreshed_at=sync_state.c.refreshed_at - 120))
+    listing.get_cache(url, 'project', max_age=60)
+    assert 'renamed' in cached_names(cache)
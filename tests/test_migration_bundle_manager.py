@@ -0,0 +1,77 @@
+import textwrap
+
+from blitzkrieg.migration_bundle_manager import MigrationBundleManager, split_statements
+
+# What `alembic upgrade head --sql` writes, after the bundle header
+BUNDLE = textwrap.dedent("""\
+    CREATE SCHEMA IF NOT EXISTS project_management;
+
+    BEGIN;
+
+    CREATE TABLE alembic_version (
+        version_num VARCHAR(32) NOT NULL,
+        CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num)
+    );
+
+    -- Running upgrade  -> 1a2b3c4d
+
+    CREATE TABLE project_management.project (
+        id UUID NOT NULL,
+
+        name VARCHAR,
+        PRIMARY KEY (id)
+    );
+
+    DO $$
+    BEGIN
+        -- Only on databases that predate the enum;
+        IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'project_type_enum') THEN
+            CREATE TYPE project_type_enum AS ENUM ('python_cli', 'pyo3_rust_extension');
+
+        END IF;
+    END
+    $$;
+
+    CREATE FUNCTION project_management.touch() RETURNS trigger AS $body$
+    BEGIN
+        NEW.updated_at = now(); RETURN NEW;
+    END;
+    $body$ LANGUAGE plpgsql;
+
+    INSERT INTO project_management.project (id, name) VALUES ('00000000-0000-0000-0000-000000000000', 'it''s; fine
+    -- not a comment');
+
+    INSERT INTO alembic_version (version_num) VALUES ('1a2b3c4d') RETURNING alembic_version.version_num;
+
+    COMMIT;
+
+""")
+
+
+def test_iter_statements_splits_on_terminators_outside_quoted_bodies(tmp_path):
+    bundle_path = tmp_path / 'bundle.sql'
+    bundle_path.write_text(BUNDLE)
+
+    statements = list(MigrationBundleManager.iter_statements(str(bundle_path)))
+
+    assert [statement.split('\n')[0] for statement in statements] == [
+        'CREATE SCHEMA IF NOT EXISTS project_management;',
+        'CREATE TABLE alembic_version (',
+        'CREATE TABLE project_management.project (',
+        'DO $$',
+        'CREATE FUNCTION project_management.touch() RETURNS trigger AS $body$',
+        "INSERT INTO project_management.project (id, name) VALUES ('00000000-0000-0000-0000-000000000000', 'it''s; fine",
+        "INSERT INTO alembic_version (version_num) VALUES ('1a2b3c4d') RETURNING alembic_version.version_num;",
+    ]
+    # Blank lines and semicolons inside a statement stay in it
+    assert statements[2].endswith('    id UUID NOT NULL,\n\n    name VARCHAR,\n    PRIMARY KEY (id)\n);')
+    assert statements[3].endswith("pyo3_rust_extension');\n\n    END IF;\nEND\n$$;")
+    assert '-- Only on databases that predate the enum;' in statements[3]
+    assert statements[5].endswith("-- not a comment');")
+    assert not any(statement in ('BEGIN;', 'COMMIT;') or statement.startswith('--') for statement in statements)
+
+
+def test_split_statements_keeps_text_after_the_last_terminator():
+    statements = list(split_statements(["SELECT 1; SELECT '$$;'", "; SELECT $1 FROM t\n"]))
+
+    assert statements == ['SELECT 1;', " SELECT '$$;';", ' SELECT $1 FROM t\n']
@@ -0,0 +1,159 @@
+import os
+import textwrap
+
+import pytest
+
+from blitzkrieg.project_management.db import connection
+from blitzkrieg.project_manifest_manager import ProjectManifestManager, ProjectResult
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def rollback(self):
+        self.calls.append('rollback')
+
+    def close(self):
+        self.calls.append('close')
+
+
+@pytest.fixture
+def projects_directory(tmp_path):
+    directory = tmp_path / 'workspace' / 'projects'
+    directory.mkdir(parents=True)
+    return directory
+
+
+def make_manager(tmp_path, projects_directory, manifest, existing_names=()):
+    manifest_path = tmp_path / 'projects.yml'
+    manifest_path.write_text(textwrap.dedent(manifest))
+    manager = ProjectManifestManager(str(manifest_path))
+    manager.cookie_cutter_manager.get_projects_directory = lambda: str(projects_directory)
+    manager.find_existing_names = lambda names: {name for name in names if name in existing_names}
+    return manager
+
+
+def test_defaults_apply_to_every_entry_unless_overridden(tmp_path, projects_directory):
+    manager = make_manager(tmp_path, projects_directory, """
+        defaults:
+          project_type: Python CLI
+          push: false
+        projects:
+          - name: billing_cli
+          - name: fast_parser
+            project_type: Pyo3 Rust Extension
+            push: true
+    """)
+
+    assert manager.load_manifest() == [
+        {'project_type': 'Python CLI', 'push': False, 'name': 'billing_cli'},
+        {'project_type': 'Pyo3 Rust Extension', 'push': True, 'name': 'fast_parser'},
+    ]
+
+
+def test_a_bare_list_is_a_manifest_without_defaults(tmp_path, projects_directory):
+    manager = make_manager(tmp_path, projects_directory, """
+        - name: billing_cli
+          project_type: Python CLI
+          github: false
+    """)
+
+    [result] = manager.validate(manager.load_manifest())
+
+    assert result.project.name == 'billing_cli' and result.project.project_type == 'python_cli'
+    assert result.project.directory_path == str(projects_directory / 'billing_cli')
+    assert result.project.id is not None
+    # No repository means nothing to push either
+    assert (result.github, result.push) == (False, False)
+
+
+def test_every_problem_is_reported_at_once(tmp_path, projects_directory):
+    (projects_directory / 'left_over').mkdir()
+    manager = make_manager(tmp_path, projects_directory, """
+        defaults:
+          project_type: Python CLI
+        projects:
+          - name: billing_cli
+            colour: blue
+          - name: ../escape
+          - project_type: Python CLI
+          - name: billing_cli
+          - name: Report Tool
+          - name: report_tool
+          - name: taken
+          - name: left_over
+          - name: odd
+            project_type: Java Applet
+    """, existing_names={'taken'})
+
+    with pytest.raises(ValueError) as error:
+        manager.validate(manager.load_manifest())
+
+    problems = str(error.value).splitlines()[1:]
+    assert [problem.strip() for problem in problems] == [
+        "project #1 (billing_cli): unknown fields colour",
+        "project #2 (../escape): a name without path separators is required",
+        "project #3 (unnamed): a name without path separators is required",
+        "project #4 (billing_cli): has the same name as project #1",
+        "project #4 (billing_cli): renders to the same directory as project #1",
+        "project #6 (report_tool): renders to the same directory as project #5",
+        "project #7 (taken): a project with this name already exists",
+        f"project #8 (left_over): {projects_directory / 'left_over'} already exists",
+        "project #9 (odd): Invalid project type: java_applet",
+    ]
+
+
+def test_an_empty_manifest_is_rejected(tmp_path, projects_directory):
+    manager = make_manager(tmp_path, projects_directory, "projects: []\n")
+
+    with pytest.raises(ValueError, match='the manifest lists no projects'):
+        manager.validate(manager.load_manifest())
+
+
+def rendered_results(manager, names):
+    results = manager.validate([{'name': name, 'project_type': 'Python CLI'} for name in names])
+    for result in results:
+        # Stand-in for render_projects
+        os.makedirs(result.project.directory_path)
+        result.steps.append('rendered')
+    return results
+
+
+def test_rows_skipped_by_the_insert_fail_and_lose_their_directory(tmp_path, projects_directory, monkeypatch):
+    manager = make_manager(tmp_path, projects_directory, "[]\n")
+    results = rendered_results(manager, ['kept', 'raced'])
+    session = FakeSession()
+    monkeypatch.setattr(connection, 'get_docker_db_session', lambda: session)
+    # Another process inserted `raced` after validation; ON CONFLICT DO NOTHING skips it
+    monkeypatch.setattr(connection, 'save_projects', lambda projects, session: [projects[0].id])
+
+    manager.save_projects(results)
+
+    kept, raced = results
+    assert kept.status == 'pending' and kept.steps == ['rendered', 'saved']
+    assert (projects_directory / 'kept').is_dir()
+    assert raced.status == 'failed' and raced.error == 'save: a project with this name already exists'
+    assert raced.steps == ['rendered', 'discarded']
+    assert not (projects_directory / 'raced').exists()
+    assert session.calls == ['close']
+
+
+def test_a_failed_save_fails_every_project_and_removes_the_directories(tmp_path, projects_directory, monkeypatch):
+    manager = make_manager(tmp_path, projects_directory, "[]\n")
+    results = rendered_results(manager, ['alpha', 'beta'])
+    failed_render = ProjectResult(results[0].project, results[0].template_path, {}, status='failed')
+    session = FakeSession()
+    monkeypatch.setattr(connection, 'get_docker_db_session', lambda: session)
+
+    def save_projects(projects, session):
+        assert [project.name for project in projects] == ['alpha', 'beta']
+        raise ConnectionError('server closed the connection')
+
+    monkeypatch.setattr(connection, 'save_projects', save_projects)
+
+    manager.save_projects(results + [failed_render])
+
+    assert [result.error for result in results] == ['save: server closed the connection'] * 2
+    assert list(projects_directory.iterdir()) == []
+    assert session.calls == ['rollback', 'close']
@@ -0,0 +1,118 @@
+import io
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from blitzkrieg.cli.commands.listing import RowPrinter
+from blitzkrieg.db.models.issue import Issue
+from blitzkrieg.db.models.project import Project
+from blitzkrieg.db.queries import issue_listing, iter_keyset_pages, keyset_page, project_listing
+from blitzkrieg.project_management.db.connection import engine_registry
+from blitzkrieg.ui_management.output_mode import set_output_mode
+
+START = datetime(2026, 1, 1, 9, 0, 0)
+
+
+@pytest.fixture
+def projects(sqlite_source):
+    """25 projects over 3 distinct created_at values, so most pages end inside a run of equal timestamps."""
+    rows = [
+        {'id': uuid.uuid4(), 'name': f"project-{number:02}", 'created_at': START + timedelta(minutes=number % 3)}
+        for number in range(25)
+    ]
+    with engine_registry.connect(sqlite_source) as connection:
+        connection.execute(insert(Project), rows)
+        connection.commit()
+    return sorted(rows, key=lambda row: (row['created_at'], row['id']))
+
+
+@pytest.fixture
+def connection(sqlite_source):
+    with engine_registry.connect(sqlite_source) as connection:
+        yield connection
+
+
+def ids(rows):
+    return [row.id for row in rows]
+
+
+@pytest.mark.parametrize('page_size', [1, 4, 7, 25, 100])
+def test_visits_every_row_once_in_key_order(connection, projects, page_size):
+    rows = list(iter_keyset_pages(connection, project_listing(), page_size=page_size))
+
+    assert ids(rows) == [project['id'] for project in projects]
+
+
+def test_pages_resume_after_the_last_key_within_equal_timestamps(connection, projects):
+    listing = project_listing()
+    first_page = connection.execute(keyset_page(listing, 4)).all()
+    last = (first_page[-1].created_at, first_page[-1].id)
+
+    second_page = connection.execute(keyset_page(listing, 4, after=last)).all()
+
+    # Both pages sit inside the first run of equal created_at values; only the id tiebreak separates them
+    assert {row.created_at for row in first_page + second_page} == {START}
+    assert ids(first_page + second_page) == [project['id'] for project in projects[:8]]
+    assert ids(iter_keyset_pages(connection, listing, page_size=3, after=last)) == [project['id'] for project in projects[4:]]
+
+
+@pytest.mark.parametrize('limit', [1, 6, 8, 9, 30])
+def test_limit_stops_across_page_boundaries(connection, projects, limit):
+    rows = list(iter_keyset_pages(connection, project_listing(), page_size=4, limit=limit))
+
+    assert ids(rows) == [project['id'] for project in projects[:limit]]
+
+
+def test_issue_listing_filters_by_project(connection, sqlite_source):
+    alpha, beta = uuid.uuid4(), uuid.uuid4()
+    issues = [
+        {'id': uuid.uuid4(), 'index': number, 'title': f"issue {number}", 'project_id': alpha if number % 2 else beta,
+         'created_at': START + timedelta(minutes=number // 4)}
+        for number in range(10)
+    ]
+    connection.execute(insert(Project), [{'id': alpha, 'name': 'alpha', 'created_at': START}, {'id': beta, 'name': 'beta', 'created_at': START}])
+    connection.execute(insert(Issue), issues)
+    connection.commit()
+
+    rows = list(iter_keyset_pages(connection, issue_listing(project_name='alpha'), page_size=2))
+
+    expected = sorted((issue for issue in issues if issue['project_id'] == alpha), key=lambda issue: (issue['created_at'], issue['id']))
+    assert ids(rows) == [issue['id'] for issue in expected]
+    assert {row.project for row in rows} == {'alpha'}
+    assert len(list(iter_keyset_pages(connection, issue_listing(), page_size=3))) == 10
+
+
+def test_row_printer_writes_tab_separated_rows_in_quiet_mode(connection, projects):
+    connection.execute(Project.__table__.update().where(Project.id == projects[0]['id']).values(short_description='line one\nline\ttwo'))
+    stream = io.StringIO()
+    listing = project_listing()
+    printer = RowPrinter('projects', listing.columns, stream=stream)
+
+    printer.write_header()
+    for row in iter_keyset_pages(connection, listing, limit=2):
+        printer.write(row)
+
+    lines = stream.getvalue().splitlines()
+    assert printer.count == 2 and len(lines) == 2
+    # id, name, project_type, short_description, github_repo, created_at; None prints as ''
+    assert lines[0].split('\t') == [str(projects[0]['id']), projects[0]['name'], '', 'line one line two', '', '2026-01-01 09:00:00']
+
+
+def test_row_printer_writes_one_json_record_per_row(connection, projects):
+    set_output_mode('json')
+    stream = io.StringIO()
+    listing = project_listing()
+    printer = RowPrinter('projects', listing.columns, stream=stream)
+
+    printer.write_header()
+    for row in iter_keyset_pages(connection, listing, limit=3):
+        printer.write(row)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record['data']['name'] for record in records] == [project['name'] for project in projects[:3]]
+    assert {record['level'] for record in records} == {'data'}
+    assert {record['title'] for record in records} == {'projects'}
+    assert set(records[0]['data']) == set(listing.columns)
@@ -0,0 +1,144 @@
+import os
+import textwrap
+
+import pytest
+
+from blitzkrieg.ui_management.console_instance import console
+from blitzkrieg.utils.contextualization_utils import extract_function_and_references
+from blitzkrieg.utils.symbol_index import SymbolIndex
+
+SOURCES = {
+    'pkg/__init__.py': '',
+    'pkg/helpers.py': '''
+        def helper(value):
+            return value * 2
+
+
+        class Formatter:
+            def render(self, value):
+                return str(helper(value))
+    ''',
+    'pkg/cli.py': '''
+        import click
+        from pkg.helpers import helper
+
+
+        @click.command('do-thing')
+        def do_thing():
+            click.echo(helper(
+                21
+            ))
+    ''',
+    'pkg/__pycache__/stale.py': 'def helper():\n    pass\n',
+    '.hidden/skipped.py': 'def helper():\n    pass\n',
+}
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(content).lstrip())
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / 'project'
+    for relative_path, content in SOURCES.items():
+        write(root / relative_path, content)
+    return root
+
+
+@pytest.fixture
+def index(project, tmp_path):
+    index = SymbolIndex(str(project), cache_directory=str(tmp_path / 'cache'))
+    yield index
+    index.close()
+
+
+def test_rerun_only_parses_changed_files(project, index, tmp_path):
+    assert index.refresh() == {'parsed': 3, 'reused': 0, 'removed': 0}
+    index.close()
+
+    reopened = SymbolIndex(str(project), cache_directory=str(tmp_path / 'cache'))
+    try:
+        assert reopened.refresh() == {'parsed': 0, 'reused': 3, 'removed': 0}
+
+        helpers = (project / 'pkg/helpers.py').read_text()
+        write(project / 'pkg/helpers.py', helpers + '\n\ndef other():\n    return helper(1)\n')
+        write(project / 'pkg/extra.py', 'from pkg.helpers import helper\n')
+        os.remove(project / 'pkg/__init__.py')
+        assert reopened.refresh() == {'parsed': 2, 'reused': 1, 'removed': 1}
+        assert [reference['parent'] for reference in reopened.find_references('helper', kinds=['call'])] == [
+            'do_thing', 'Formatter.render', 'other'
+        ]
+        assert reopened.refresh() == {'parsed': 0, 'reused': 3, 'removed': 0}
+    finally:
+        reopened.close()
+
+
+def test_parallel_parse_matches_serial_parse(project, index, tmp_path):
+    index.refresh()
+    parallel = SymbolIndex(str(project), cache_directory=str(tmp_path / 'parallel-cache'), max_workers=2)
+    parallel.parallel_threshold = 1
+    try:
+        assert parallel.refresh()['parsed'] == 3
+        assert parallel.find_definitions('helper') == index.find_definitions('helper')
+        assert parallel.find_references('helper') == index.find_references('helper')
+    finally:
+        parallel.close()
+
+
+def test_finds_definitions_by_name_and_click_command(index):
+    index.refresh()
+
+    [helper] = index.find_definitions('helper')
+    assert (helper['path'], helper['lineno'], helper['kind']) == (os.path.join('pkg', 'helpers.py'), 1, 'function')
+    assert index.get_source(helper) == 'def helper(value):\n    return value * 2'
+
+    [render] = index.find_definitions('render')
+    assert render['qualname'] == 'Formatter.render' and render['parent'] == 'Formatter'
+
+    [command] = index.find_definitions('do-thing')
+    assert command['name'] == 'do_thing'
+    # Starts at the decorator
+    assert index.get_source(command).startswith("@click.command('do-thing')")
+
+
+def test_get_source_reads_files_edited_after_a_lookup(project, index):
+    index.refresh()
+    [helper] = index.find_definitions('helper')
+    assert index.get_source(helper).startswith('def helper(value):')
+
+    helpers = project / 'pkg' / 'helpers.py'
+    helpers.write_text('"""Helpers."""\n\n\n' + helpers.read_text().replace('value * 2', 'value * 3'))
+    index.refresh()
+
+    [helper] = index.find_definitions('helper')
+    assert helper['lineno'] == 4
+    assert index.get_source(helper) == 'def helper(value):\n    return value * 3'
+
+
+def test_finds_call_sites_with_their_whole_statement(index):
+    index.refresh()
+
+    references = index.find_references('helper')
+    assert [(reference['path'], reference['lineno'], reference['parent']) for reference in references] == [
+        (os.path.join('pkg', 'cli.py'), 7, 'do_thing'),
+        (os.path.join('pkg', 'helpers.py'), 7, 'Formatter.render'),
+    ]
+    assert index.get_source(references[0]) == '    click.echo(helper(\n        21\n    ))'
+    assert index.find_references('value', kinds=['name'])[0]['parent'] == 'helper'
+    assert index.find_references('helper', kinds=['attribute']) == []
+    assert index.find_references('missing') == []
+
+
+def test_extract_only_copies_to_the_clipboard_when_asked(project, monkeypatch):
+    copied = []
+    monkeypatch.setattr(console.clipboard_manager, 'copy_to_clipboard', copied.append)
+    monkeypatch.setenv('HOME', str(project.parent / 'home'))
+
+    result = extract_function_and_references('helper', root=str(project))
+    assert 'def helper(value):' in result and 'click.echo(helper(' in result
+    assert copied == []
+
+    extract_function_and_references('helper', root=str(project), copy=True)
+    assert copied == [result]
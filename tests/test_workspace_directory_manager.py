@@ -0,0 +1,75 @@
+import subprocess
+
+import pytest
+
+from blitzkrieg import workspace_directory_manager
+from blitzkrieg.workspace_directory_manager import WorkspaceDirectoryManager
+
+
+class RecordingConsole:
+    def __init__(self):
+        self.messages = []
+
+    def __getattr__(self, name):
+        if name.startswith('handle_'):
+            return lambda message, *args: self.messages.append((name[len('handle_'):], message))
+        raise AttributeError(name)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'demo' / 'migrations' / '__pycache__').mkdir(parents=True)
+    (tmp_path / 'demo' / 'migrations' / '__pycache__' / 'env.cpython-311.pyc').write_bytes(b'\0')
+    console = RecordingConsole()
+    return WorkspaceDirectoryManager('demo', console_interface=console), console
+
+
+def test_deletes_the_workspace_directory(workspace, tmp_path):
+    manager, console = workspace
+
+    manager.delete_workspace_directory()
+
+    assert list(tmp_path.iterdir()) == []
+    assert console.messages[-1][0] == 'success'
+
+
+def test_reports_a_failed_deletion_and_gc_sweeps_the_leftover(workspace, tmp_path, monkeypatch):
+    manager, console = workspace
+    popen = subprocess.Popen
+
+    def failing_rm(command, **kwargs):
+        # What rm prints for files the containers created as root in the bind mount
+        script = f'echo "rm: cannot remove \'{command[-1]}/migrations\': Permission denied" >&2; exit 1'
+        return popen(['sh', '-c', script], **kwargs)
+
+    monkeypatch.setattr(workspace_directory_manager.subprocess, 'Popen', failing_rm)
+    manager.delete_workspace_directory()
+    monkeypatch.undo()
+
+    level, message = console.messages[-1]
+    assert level == 'error' and 'Permission denied' in message
+    leftovers = WorkspaceDirectoryManager.find_leftover_deletions(str(tmp_path))
+    assert len(leftovers) == 1 and '/.demo.deleting-' in leftovers[0]
+    assert not (tmp_path / 'demo').exists()
+
+    assert WorkspaceDirectoryManager.remove_leftover_deletions(str(tmp_path), dry_run=True) == (leftovers, [])
+    assert WorkspaceDirectoryManager.find_leftover_deletions(str(tmp_path)) == leftovers
+    assert WorkspaceDirectoryManager.remove_leftover_deletions(str(tmp_path)) == (leftovers, [])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_slow_deletions_continue_in_the_background(workspace, tmp_path, monkeypatch):
+    manager, console = workspace
+    manager.background_delete_grace = 0.1
+    popen = subprocess.Popen
+
+    def slow_rm(command, **kwargs):
+        return popen(['sh', '-c', 'sleep 0.5; exec "$@"', 'sh', *command], **kwargs)
+
+    monkeypatch.setattr(workspace_directory_manager.subprocess, 'Popen', slow_rm)
+    manager.delete_workspace_directory()
+
+    assert console.messages[-1][0] == 'success'
+    assert 'background' in console.messages[-1][1]
+    assert not (tmp_path / 'demo').exists()